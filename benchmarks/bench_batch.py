@@ -0,0 +1,91 @@
+"""
+Samples per second through one publisher connection and one MqttBuffer
+(in-process loopback broker) as the number of samples per message grows,
+for JSON with per-sample hashes, JSON with one batch hash and binary.
+
+    python benchmarks/bench_batch.py [samples]
+"""
+import os
+import sys
+import time
+from datetime import datetime, timezone, timedelta
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "dashboard")))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "publisher")))
+from mqtt_client import MqttBuffer, parse_timestamp_ns
+from transport import LoopbackBroker, LoopbackTransport
+from boiler_simulator import SamplePublisher
+
+
+TOPIC = "cu/bca/boiler/secure_digital_twin"
+DEVICES = 10
+BATCH_SIZES = [1, 10, 100]
+MODES = {
+    "json": {},
+    "json, batch hash": {"batch_hash": True},
+    "binary": {"binary": True},
+}
+
+
+def make_samples(n):
+    start = datetime.now(timezone.utc) - timedelta(seconds=n)
+    samples = []
+    for i in range(n):
+        timestamp = (start + timedelta(milliseconds=i)).isoformat()
+        device_id = f"boiler_{i % DEVICES:05d}"
+        samples.append((f"{TOPIC}/{device_id}", {
+            "device_id": device_id,
+            "timestamp": timestamp,
+            "temperature": 70.0 + i % 20,
+            "pressure": 30.0 + i % 7,
+            "status": "OK",
+        }, parse_timestamp_ns(timestamp)))
+    return samples
+
+
+def run(samples, batch, options):
+    broker = LoopbackBroker()
+    ingest = MqttBuffer(broker="loopback", port=0, topic=TOPIC, maxlen=len(samples),
+                        transport=LoopbackTransport(broker, "dashboard"))
+    ingest.start()
+    client = LoopbackTransport(broker, "publisher")
+    client.connect()
+    publisher = SamplePublisher(client, batch=batch, **options)
+
+    messages = 0
+    publish = client.publish
+
+    def counting_publish(*args, **kwargs):
+        nonlocal messages
+        messages += 1
+        return publish(*args, **kwargs)
+
+    client.publish = counting_publish
+    t0 = time.perf_counter()
+    for topic, payload, ts_ns in samples:
+        publisher.publish(topic, dict(payload), ts_ns)
+    publisher.flush()
+    while client.pending() or ingest.client.pending():
+        time.sleep(0.0005)
+    elapsed = time.perf_counter() - t0
+    ingest.stop()
+    assert ingest.total_packets == len(samples), (ingest.total_packets, ingest.last_error)
+    assert ingest.integrity_violations == 0
+    return len(samples) / elapsed, messages
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    samples = make_samples(n)
+    print(f"{n:,} samples over {DEVICES} devices, publish -> verify -> buffer")
+    print(f"  {'mode':<18} {'batch':>5} {'messages':>9} {'samples/s':>11}")
+    for mode, options in MODES.items():
+        for batch in BATCH_SIZES:
+            if batch == 1 and options.get("batch_hash"):
+                continue
+            rate, messages = run(samples, batch, options)
+            print(f"  {mode:<18} {batch:>5} {messages:>9,} {rate:>11,.0f}")
+
+
+if __name__ == "__main__":
+    main()
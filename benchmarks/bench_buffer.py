@@ -0,0 +1,99 @@
+"""
+Memory per sample and per-tick frame cost: deque of payload dicts versus
+the columnar TelemetryRingBuffer.
+
+    python benchmarks/bench_buffer.py
+"""
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+from collections import deque
+from datetime import datetime, timezone, timedelta
+
+import pandas as pd
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "dashboard")))
+from integrity import sha256_hash
+from mqtt_client import parse_timestamp_ns
+from ring_buffer import TelemetryRingBuffer
+from frames import to_df
+
+
+SIZES = [10_000, 100_000]
+
+
+def make_payloads(n):
+    start = datetime.now(timezone.utc) - timedelta(seconds=n)
+    payloads = []
+    for i in range(n):
+        payload = {
+            "device_id": "boiler_01",
+            "timestamp": (start + timedelta(seconds=i)).isoformat(),
+            "temperature": round(random.uniform(65.0, 92.0), 2),
+            "pressure": round(random.uniform(18.0, 42.0), 2),
+            "status": "OK",
+        }
+        payload["hash"] = sha256_hash(payload)
+        payloads.append(json.dumps(payload))
+    return payloads
+
+
+def fill_deque(encoded):
+    buf = deque(maxlen=len(encoded))
+    for raw in encoded:
+        payload = json.loads(raw)
+        payload["_received_ts"] = time.time()
+        payload["integrity_ok"] = True
+        buf.append(payload)
+    return buf
+
+
+def fill_ring(encoded):
+    buf = TelemetryRingBuffer(len(encoded))
+    for raw in encoded:
+        payload = json.loads(raw)
+        buf.append(
+            parse_timestamp_ns(payload["timestamp"]),
+            payload["temperature"],
+            payload["pressure"],
+            payload["status"],
+            True,
+            payload["device_id"],
+        )
+    return buf
+
+
+def measure(fill, encoded):
+    tracemalloc.start()
+    buf = fill(encoded)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return buf, current / len(encoded)
+
+
+def best_of(fn, repeats=5):
+    best = float("inf")
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main():
+    print(f"{'samples':>8} | {'deque B/sample':>14} | {'ring B/sample':>13} | {'deque frame/tick':>16} | {'ring frame/tick':>15}")
+    for size in SIZES:
+        encoded = make_payloads(size)
+        dq, dq_bytes = measure(fill_deque, encoded)
+        ring, ring_bytes = measure(fill_ring, encoded)
+
+        dq_tick = best_of(lambda: pd.DataFrame(list(dq)))
+        ring_tick = best_of(lambda: to_df(ring))
+        print(f"{size:>8,} | {dq_bytes:>14.0f} | {ring_bytes:>13.0f} | {dq_tick * 1e3:>14.1f}ms | {ring_tick * 1e3:>13.3f}ms")
+
+
+if __name__ == "__main__":
+    main()
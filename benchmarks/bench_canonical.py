@@ -0,0 +1,39 @@
+"""
+Microbenchmark for the precompiled canonicalizer against the original
+json.dumps() form. Byte-for-byte equivalence is checked by
+tests/test_canonical.py.
+
+    python benchmarks/bench_canonical.py
+"""
+import json
+import os
+import sys
+import timeit
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "dashboard")))
+from integrity import HASH_FIELDS, canonical_payload
+
+
+def reference(payload):
+    clean = {k: payload.get(k) for k in HASH_FIELDS}
+    return json.dumps(clean, separators=(",", ":"), sort_keys=True)
+
+
+def main():
+    payload = {
+        "device_id": "boiler_01",
+        "timestamp": "2026-01-21T12:30:05.123456+00:00",
+        "temperature": 74.32,
+        "pressure": 29.18,
+        "status": "OK",
+        "hash": "0" * 64,
+    }
+    number = 200_000
+    old = min(timeit.repeat(lambda: reference(payload), number=number, repeat=5)) / number
+    new = min(timeit.repeat(lambda: canonical_payload(payload), number=number, repeat=5)) / number
+    print(f"json.dumps:      {old * 1e6:.2f} us/payload")
+    print(f"precompiled:     {new * 1e6:.2f} us/payload ({old / new:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
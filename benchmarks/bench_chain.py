@@ -0,0 +1,122 @@
+"""
+Dashboard-side verification cost per packet: one SHA-256 per packet
+(verify_hash) versus chain mode (ChainVerifier, one Merkle checkpoint per
+batch), for clean batches and with one tampered packet per batch. Also
+reports what chain mode detects for tampered, dropped and reordered
+packets.
+
+    python benchmarks/bench_chain.py [packets] [batch]
+"""
+import json
+import os
+import random
+import sys
+import time
+from datetime import datetime, timezone, timedelta
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "dashboard")))
+from integrity import sha256_hash, verify_hash, ChainSigner, ChainVerifier
+
+
+def make_payloads(n, seed=0):
+    rng = random.Random(seed)
+    start = datetime.now(timezone.utc) - timedelta(seconds=n)
+    return [
+        {
+            "device_id": "boiler_01",
+            "timestamp": (start + timedelta(seconds=i)).isoformat(),
+            "temperature": round(rng.uniform(65, 92), 2),
+            "pressure": round(rng.uniform(18, 42), 2),
+            "status": "OK",
+        }
+        for i in range(n)
+    ]
+
+
+def hashed_messages(payloads):
+    out = []
+    for p in payloads:
+        p = dict(p, hash=sha256_hash(p))
+        out.append(json.dumps(p).encode("utf-8"))
+    return out
+
+
+def chained_messages(payloads, batch):
+    signer = ChainSigner("boiler_01", batch)
+    out = []
+    for p in payloads:
+        message, checkpoint = signer.sign(dict(p))
+        out.append(message.encode("utf-8"))
+        if checkpoint is not None:
+            out.append(checkpoint.encode("utf-8"))
+    return out
+
+
+def tamper(message: bytes) -> bytes:
+    payload = json.loads(message)
+    payload["temperature"] = 100.0
+    return json.dumps(payload).encode("utf-8")
+
+
+def run_chain(messages):
+    """Ingest path for chain mode: parse, hold by seq, verify per checkpoint."""
+    verifier = ChainVerifier()
+    results = []
+    for message in messages:
+        payload = json.loads(message)
+        if "checkpoint" in payload:
+            results.extend(ok for _, _, ok in verifier.checkpoint(payload["checkpoint"]))
+        else:
+            results.extend(ok for _, _, ok in verifier.add(payload["seq"], message, payload, 0))
+    return results, verifier
+
+
+def run_hashed(messages):
+    return [verify_hash(json.loads(message)) for message in messages]
+
+
+def best_of(fn, repeats=5):
+    best = float("inf")
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        out = fn()
+        best = min(best, time.perf_counter() - t0)
+    return best, out
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    batch = int(sys.argv[2]) if len(sys.argv) > 2 else 256
+    payloads = make_payloads(n)
+
+    hashed = hashed_messages(payloads)
+    chained = chained_messages(payloads, batch)
+    # One tampered packet per batch (checkpoints are every batch+1 messages).
+    tampered = [tamper(m) if i % (batch + 1) == 7 else m for i, m in enumerate(chained)]
+
+    print(f"{n:,} packets, batch {batch}; parse + verify, µs per packet")
+    for label, fn in (("per-packet hash", lambda: run_hashed(hashed)),
+                      ("chain, clean", lambda: run_chain(chained)),
+                      ("chain, 1 tampered/batch", lambda: run_chain(tampered))):
+        seconds, _ = best_of(fn)
+        print(f"  {label:<26} {seconds / n * 1e6:>6.2f}")
+
+    results, _ = run_chain(tampered)
+    print(f"\ntampered: {results.count(False)} flagged, expected {n // batch}")
+
+    dropped = [m for i, m in enumerate(chained) if i % 1000 != 3]
+    results, verifier = run_chain(dropped)
+    print(f"dropped:  {verifier.missing} missing, {results.count(False)} flagged")
+
+    reordered = list(chained)
+    reordered[10], reordered[11] = reordered[11], reordered[10]
+    results, verifier = run_chain(reordered)
+    print(f"reordered in flight: {results.count(False)} flagged, {verifier.missing} missing")
+
+    lost_checkpoint = [m for i, m in enumerate(chained) if i != 2 * (batch + 1) - 1]
+    results, verifier = run_chain(lost_checkpoint)
+    print(f"lost checkpoint: {verifier.broken_links} broken link(s), {results.count(False)} released unverified")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,218 @@
+"""
+Per-tick hot path of the dashboard, run headless (no Streamlit server).
+
+For synthetic buffers of 1k, 10k and 100k packets this times each stage
+of one refresh -- ingest verification, frame building, the window, the
+chart builders and Plotly serialization -- and records wall time (median
+of --repeats, after --warmup untimed calls that fill caches such as
+Plotly's templates) and peak traced memory.
+
+Results are compared against benchmarks/baselines/dashboard.json; a stage
+slower or hungrier than its baseline by more than --tolerance fails the
+run with exit status 1. Wall times are first scaled by a fixed calibration
+workload timed in the same run and saved with the baseline, so a machine
+that is busier or slower overall does not read as a regression. Baselines
+are still machine specific: refresh them with --save after an intended
+change, on the machine that runs the check.
+
+    python benchmarks/bench_dashboard.py [--sizes 1000 10000] [--save]
+"""
+import argparse
+import hashlib
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone, timedelta
+
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "dashboard")))
+from integrity import sha256_hash, verify_hash
+from mqtt_client import parse_timestamp_ns
+from ring_buffer import TelemetryRingBuffer
+from frames import to_df, TelemetryWindow
+from theme import get_theme_colors
+from charts import create_gauge, create_line_chart, create_status_distribution, create_dual_axis_chart
+
+
+SIZES = [1_000, 10_000, 100_000]
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baselines", "dashboard.json")
+# Absolute slack on top of the relative tolerance, so sub-millisecond stages
+# don't flap on timer noise.
+SLACK = {"ms": 2.0, "peak_kb": 64.0}
+
+
+def make_payloads(n, seed=0):
+    rng = random.Random(seed)
+    start = datetime.now(timezone.utc) - timedelta(minutes=30)
+    step = timedelta(minutes=30) / n
+    temp, pressure = 75.0, 30.0
+    payloads = []
+    for i in range(n):
+        temp = max(50.0, min(110.0, temp + rng.uniform(-0.6, 0.8)))
+        pressure = max(10.0, min(55.0, pressure + (temp - 75.0) * 0.01 + rng.uniform(-0.4, 0.4)))
+        payload = {
+            "device_id": "boiler_01",
+            "timestamp": (start + i * step).isoformat(),
+            "temperature": round(temp, 2),
+            "pressure": round(pressure, 2),
+            "status": "Critical" if temp >= 95 else "Warning" if temp >= 85 else "OK",
+        }
+        payload["hash"] = sha256_hash(payload)
+        if i % 250 == 0:
+            payload["temperature"] = 100.0
+        payloads.append(payload)
+    return payloads
+
+
+def fill_buffer(payloads):
+    buf = TelemetryRingBuffer(len(payloads))
+    for p in payloads:
+        buf.append(parse_timestamp_ns(p["timestamp"]), p["temperature"], p["pressure"], p["status"],
+                   verify_hash(p), p["device_id"])
+    return buf
+
+
+def measure(fn, repeats, warmup):
+    for _ in range(warmup):
+        fn()
+    times = []
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t0)
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"ms": statistics.median(times) * 1e3, "peak_kb": peak / 1024}
+
+
+def calibrate(repeats=15) -> float:
+    """
+    Median ms of a fixed mix of the work the stages do (hashing, dict and
+    string handling, NumPy sorting), as a yardstick for this machine's
+    current speed.
+    """
+    rng = np.random.default_rng(0)
+    values = rng.random(200_000)
+    rows = [{"i": i, "v": float(v)} for i, v in enumerate(values[:5_000])]
+
+    def work():
+        for row in rows:
+            hashlib.sha256(json.dumps(row).encode("utf-8")).hexdigest()
+        np.sort(values)
+
+    return measure(work, repeats, warmup=2)["ms"]
+
+
+def stages(payloads):
+    colors = get_theme_colors()
+    buf = fill_buffer(payloads)
+    df = to_df(buf)
+    now_ns = int(df["ts_ns"].iloc[-1]) + 1
+    latest = df.iloc[-1]
+    line = create_line_chart(df, "temperature", "Temperature Trend", "°C", colors["accent_blue"], show_anomalies=True)
+
+    def window_refresh():
+        TelemetryWindow(buf, 30).refresh(now_ns)
+
+    def figures_per_tick():
+        # Every Plotly figure one refresh of the Live Monitoring and
+        # Security tabs builds, serialized as st.plotly_chart would.
+        for fig in (
+            create_gauge("TEMPERATURE", float(latest["temperature"]), "°C", 0, 120, colors["accent_blue"], "Average: 75.0°C"),
+            create_gauge("PRESSURE", float(latest["pressure"]), "PSI", 0, 60, colors["accent_purple"], "Average: 30.0 PSI"),
+            create_line_chart(df, "temperature", "Temperature Trend", "°C", colors["accent_blue"], show_anomalies=True),
+            create_line_chart(df, "pressure", "Pressure Trend", "PSI", colors["accent_purple"], show_anomalies=True),
+            create_dual_axis_chart(df),
+            create_status_distribution(df),
+        ):
+            fig.to_json()
+
+    return {
+        "verify_hash": lambda: [verify_hash(p) for p in payloads],
+        "to_df": lambda: to_df(buf),
+        "window_refresh": window_refresh,
+        "create_gauge": lambda: create_gauge("TEMPERATURE", float(latest["temperature"]), "°C", 0, 120,
+                                             colors["accent_blue"], "Average: 75.0°C"),
+        "create_line_chart": lambda: create_line_chart(df, "temperature", "Temperature Trend", "°C",
+                                                       colors["accent_blue"], show_anomalies=True),
+        "create_dual_axis_chart": lambda: create_dual_axis_chart(df),
+        "create_status_distribution": lambda: create_status_distribution(df),
+        "line_chart_to_json": lambda: line.to_json(),
+        "figures_per_tick": figures_per_tick,
+    }
+
+
+def compare(results, baseline, tolerance, speed=1.0):
+    """`speed` is this run's calibration time over the baseline's; wall times are divided by it."""
+    regressions = []
+    for size, by_stage in results.items():
+        for stage, metrics in by_stage.items():
+            base = baseline.get(size, {}).get(stage)
+            if not base:
+                continue
+            for key, slack in SLACK.items():
+                value = metrics[key] / speed if key == "ms" else metrics[key]
+                if value > base[key] * (1 + tolerance) + slack:
+                    regressions.append(f"{stage} @ {size}: {key} {value:.2f} vs baseline {base[key]:.2f}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES)
+    parser.add_argument("--repeats", type=int, default=9, help="timed calls per stage; the median is reported")
+    parser.add_argument("--warmup", type=int, default=2, help="untimed calls per stage before timing")
+    parser.add_argument("--tolerance", type=float, default=0.5, help="allowed slowdown/growth vs baseline (0.5 = +50%%)")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--save", action="store_true", help="write these results as the new baseline")
+    args = parser.parse_args()
+
+    baseline, base_calibration = {}, None
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            saved = json.load(f)
+        baseline, base_calibration = saved["results"], saved.get("calibration_ms")
+
+    calibration = calibrate()
+    speed = calibration / base_calibration if base_calibration else 1.0
+    print(f"calibration {calibration:.2f} ms" + (f", {speed:.2f}x the baseline's" if base_calibration else ""))
+
+    results = {}
+    for size in args.sizes:
+        key = str(size)
+        results[key] = {}
+        print(f"\n{size:,} packets")
+        print(f"  {'stage':<28} {'wall ms':>10} {'peak KB':>10} {'vs baseline':>12}")
+        for stage, fn in stages(make_payloads(size)).items():
+            metrics = measure(fn, args.repeats, args.warmup)
+            results[key][stage] = metrics
+            base = baseline.get(key, {}).get(stage)
+            delta = f"{metrics['ms'] / speed / base['ms'] - 1:+.0%}" if base and base["ms"] > 0 else "-"
+            print(f"  {stage:<28} {metrics['ms']:>10.2f} {metrics['peak_kb']:>10.0f} {delta:>12}")
+
+    if args.save:
+        os.makedirs(os.path.dirname(args.baseline), exist_ok=True)
+        merged = {**baseline, **results}
+        with open(args.baseline, "w") as f:
+            json.dump({"machine": platform.platform(), "python": platform.python_version(),
+                       "calibration_ms": calibration, "results": merged}, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"\nbaseline written to {args.baseline}")
+        return 0
+
+    regressions = compare(results, baseline, args.tolerance, speed)
+    for line in regressions:
+        print(f"REGRESSION {line}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
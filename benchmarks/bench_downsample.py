@@ -0,0 +1,61 @@
+"""
+Line-chart cost with and without downsampling: points sent per trace,
+serialized figure size and build + to_json time, for min-max and LTTB,
+plus whether the largest spike survives each method.
+
+    python benchmarks/bench_downsample.py
+"""
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "dashboard")))
+from charts import MAX_CHART_POINTS, create_line_chart
+from downsample import downsample_indices
+
+
+SIZES = [1_800, 18_000, 180_000]
+REPEATS = 5
+
+
+def make_frame(n, seed=0):
+    rng = np.random.default_rng(seed)
+    ts_ns = np.int64(1_700_000_000_000_000_000) + np.arange(n, dtype=np.int64) * (1_800_000_000_000 // n)
+    temperature = (75 + np.cumsum(rng.normal(0, 0.2, n))).astype(np.float32)
+    temperature[n // 3] += 40
+    return pd.DataFrame({"ts_ns": ts_ns, "timestamp": ts_ns.view("datetime64[ns]"), "temperature": temperature})
+
+
+def best_of(fn):
+    best = float("inf")
+    for _ in range(REPEATS):
+        t0 = time.perf_counter()
+        out = fn()
+        best = min(best, time.perf_counter() - t0)
+    return best, out
+
+
+def main():
+    print(f"{'samples':>8} | {'method':>6} | {'points':>7} | {'select':>9} | spike kept | {'json KB':>8} | {'build+json':>10}")
+    for size in SIZES:
+        df = make_frame(size)
+        x, y = df["ts_ns"].to_numpy(), df["temperature"].to_numpy()
+        spike = int(y.argmax())
+        for method in ("full", "minmax", "lttb"):
+            max_points = None if method == "full" else MAX_CHART_POINTS
+            select, idx = best_of(lambda: downsample_indices(x, y, max_points, method if max_points else "minmax"))
+            row = f"{size:>8,} | {method:>6} | {len(idx):>7,} | {select * 1e3:>6.2f} ms | {str(spike in idx):>10}"
+            if method == "lttb":
+                # The charts only plot min-max; LTTB is listed for comparison.
+                print(f"{row} | {'-':>8} | {'-':>10}")
+                continue
+            seconds, payload = best_of(lambda: create_line_chart(df, "temperature", "Temperature Trend", "°C",
+                                                                 "#3b82f6", max_points=max_points).to_json())
+            print(f"{row} | {len(payload) / 1024:>8.0f} | {seconds * 1e3:>7.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""
+Asyncio publisher engine (publisher/fleet_engine.py): achieved messages
+per second against the fleet's target rate and per-device publish lag, as
+the number of device coroutines grows, over the in-process loopback broker.
+
+    python benchmarks/bench_engine.py [seconds] [interval]
+"""
+import asyncio
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "publisher")))
+from fleet_engine import FleetEngine
+
+
+DEVICES = [100, 1_000, 5_000, 10_000]
+CONNECTIONS = 4
+
+
+def main():
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 5.0
+    interval = float(sys.argv[2]) if len(sys.argv) > 2 else 1.0
+    print(f"{seconds:g} s per fleet, {interval:g} s per device, {CONNECTIONS} connections")
+    print(f"  {'devices':>8} {'target/s':>9} {'msg/s':>9} {'missed':>7} {'lag p50 ms':>11} {'p99 ms':>8} {'max ms':>8}")
+    for n in DEVICES:
+        engine = FleetEngine(f"loopback://bench_engine_{n}", n, interval, connections=CONNECTIONS, seed=0)
+        engine.connect()
+        try:
+            snap = asyncio.run(engine.run(seconds, report_every=seconds, on_report=lambda snap: None))
+        finally:
+            engine.close()
+        print(f"  {n:>8,} {n / interval:>9,.0f} {snap['rate']:>9,.0f} {snap['missed']:>7,} "
+              f"{snap['lag_p50_ms']:>11.1f} {snap['lag_p99_ms']:>8.1f} {snap['lag_max_ms']:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
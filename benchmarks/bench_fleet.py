@@ -0,0 +1,80 @@
+"""
+Fleet-mode simulator: throughput of one vectorized step (walk, status,
+payloads, hashes) and a distribution check against the scalar path.
+
+    python benchmarks/bench_fleet.py [devices]
+"""
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "publisher")))
+from config import TEMP_MIN, TEMP_MAX, PRESSURE_MIN, PRESSURE_MAX
+from boiler_simulator import compute_status, compute_status_many, fleet_payloads, step_device, step_fleet
+
+
+STEPS = 120
+QUANTILES = [0.05, 0.25, 0.5, 0.75, 0.95]
+
+
+def scalar_walk(devices, steps):
+    temps, pressures, statuses = [], [], []
+    for _ in range(devices):
+        temp = random.uniform(TEMP_MIN, TEMP_MAX)
+        pressure = random.uniform(PRESSURE_MIN, PRESSURE_MAX)
+        for _ in range(steps):
+            temp, pressure = step_device(temp, pressure)
+        temps.append(temp)
+        pressures.append(pressure)
+        statuses.append(compute_status(temp, pressure))
+    return np.array(temps), np.array(pressures), np.array(statuses)
+
+
+def fleet_walk(devices, steps):
+    rng = np.random.default_rng()
+    temp = rng.uniform(TEMP_MIN, TEMP_MAX, devices)
+    pressure = rng.uniform(PRESSURE_MIN, PRESSURE_MAX, devices)
+    for _ in range(steps):
+        temp, pressure = step_fleet(rng, temp, pressure)
+    return temp, pressure, compute_status_many(temp, pressure)
+
+
+def describe(label, values):
+    q = np.quantile(values, QUANTILES)
+    print(f"  {label:>18}: mean {values.mean():7.2f}  std {values.std():6.2f}  q " + " ".join(f"{v:6.2f}" for v in q))
+
+
+def main():
+    devices = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+
+    rng = np.random.default_rng()
+    device_ids = [f"boiler_{i:05d}" for i in range(devices)]
+    temp = rng.uniform(TEMP_MIN, TEMP_MAX, devices)
+    pressure = rng.uniform(PRESSURE_MIN, PRESSURE_MAX, devices)
+
+    t0 = time.perf_counter()
+    temp, pressure = step_fleet(rng, temp, pressure)
+    t_step = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    fleet_payloads(device_ids, temp, pressure)
+    t_payloads = time.perf_counter() - t0
+    print(f"{devices:,} devices: walk+status {t_step * 1e3:.1f} ms, payloads+hashes {t_payloads * 1e3:.1f} ms "
+          f"({devices / (t_step + t_payloads):,.0f} samples/s)")
+
+    n = min(devices, 5_000)
+    print(f"distribution after {STEPS} steps over {n:,} devices (scalar vs fleet):")
+    s_temp, s_pres, s_status = scalar_walk(n, STEPS)
+    f_temp, f_pres, f_status = fleet_walk(n, STEPS)
+    describe("scalar temperature", s_temp)
+    describe("fleet temperature", f_temp)
+    describe("scalar pressure", s_pres)
+    describe("fleet pressure", f_pres)
+    for label in ("OK", "Warning", "Critical"):
+        print(f"  {label:>18}: scalar {np.mean(s_status == label):6.1%}  fleet {np.mean(f_status == label):6.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Per-tick cost of the dashboard as the ingest buffer fills.
+
+Compares the legacy path (re-verify every buffered packet on each tick)
+with verification done once in MqttBuffer._on_message.
+
+    python benchmarks/bench_ingest.py
+"""
+import json
+import os
+import random
+import sys
+import time
+from datetime import datetime, timezone, timedelta
+from types import SimpleNamespace
+
+import pandas as pd
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "dashboard")))
+from integrity import sha256_hash, verify_hash
+from mqtt_client import MqttBuffer
+from frames import to_df
+
+
+SIZES = [1_000, 2_500, 5_000, 10_000]
+NEW_PER_TICK = 1
+REPEATS = 5
+
+
+def make_messages(n):
+    start = datetime.now(timezone.utc) - timedelta(seconds=n)
+    messages = []
+    for i in range(n):
+        payload = {
+            "device_id": "boiler_01",
+            "timestamp": (start + timedelta(seconds=i)).isoformat(),
+            "temperature": round(random.uniform(65.0, 92.0), 2),
+            "pressure": round(random.uniform(18.0, 42.0), 2),
+            "status": "OK",
+        }
+        payload["hash"] = sha256_hash(payload)
+        messages.append(SimpleNamespace(topic="bench", payload=json.dumps(payload).encode("utf-8")))
+    return messages
+
+
+def legacy_to_df(buffer_list):
+    """The pre-ingest-verification to_df, kept here as the reference."""
+    df = pd.DataFrame(buffer_list)
+    df["timestamp"] = pd.to_datetime(df["timestamp"], errors="coerce", utc=True)
+    df = df.dropna(subset=["timestamp"])
+    df = df.sort_values("timestamp")
+
+    def check_integrity(row):
+        row_dict = row.to_dict()
+        if pd.notna(row_dict.get("timestamp")):
+            row_dict["timestamp"] = row_dict["timestamp"].isoformat()
+        return verify_hash(row_dict)
+
+    df["integrity_ok"] = df.apply(check_integrity, axis=1)
+    return df
+
+
+def best_of(fn, repeats=REPEATS):
+    best = float("inf")
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main():
+    messages = make_messages(max(SIZES) + NEW_PER_TICK)
+    buf = MqttBuffer(broker="localhost", port=1883, topic="bench", maxlen=max(SIZES) + NEW_PER_TICK)
+
+    print(f"{'buffer':>8} | {'ingest/pkt':>11} | {'legacy to_df/tick':>17} | {'to_df/tick':>10} | {'integrity read/tick':>19}")
+    filled = 0
+    for size in SIZES:
+        for msg in messages[filled:size]:
+            buf._on_message(None, None, msg)
+
+        # Cost of ingesting the packets that arrive during one tick.
+        tick_msgs = messages[size:size + NEW_PER_TICK]
+        t0 = time.perf_counter()
+        for msg in tick_msgs:
+            buf._on_message(None, None, msg)
+        ingest = (time.perf_counter() - t0) / len(tick_msgs)
+        filled = size + NEW_PER_TICK
+
+        raw = [json.loads(msg.payload) for msg in messages[:size]]
+        legacy = best_of(lambda: legacy_to_df(raw), repeats=1)
+        current = best_of(lambda: to_df(buf.partition("boiler_01").buffer))
+        df = to_df(buf.partition("boiler_01").buffer)
+        integrity_read = best_of(lambda: df["integrity_ok"].sum())
+
+        print(f"{size:>8,} | {ingest * 1e6:>9.1f}us | {legacy * 1e3:>15.1f}ms | {current * 1e3:>8.1f}ms | {integrity_read * 1e3:>17.3f}ms")
+
+
+if __name__ == "__main__":
+    main()
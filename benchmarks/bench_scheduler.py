@@ -0,0 +1,72 @@
+"""
+Publish loop pacing: the old `work(); time.sleep(interval)` loop versus
+scheduler.Ticker, at several target rates with a realistic per-sample cost
+(build payload, hash, serialize). Reports the achieved rate, its error
+against the target, Ticker misses and jitter.
+
+    python benchmarks/bench_scheduler.py [seconds per rate]
+"""
+import json
+import os
+import sys
+import time
+from datetime import datetime, timezone
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "dashboard")))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "publisher")))
+from integrity import sha256_hash
+from scheduler import Ticker
+
+
+RATES_HZ = [1, 10, 100, 1000, 5000]
+
+
+def work():
+    payload = {
+        "device_id": "boiler_01",
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "temperature": 75.25,
+        "pressure": 30.5,
+        "status": "OK",
+    }
+    payload["hash"] = sha256_hash(payload)
+    return json.dumps(payload)
+
+
+def run_sleep(interval, seconds):
+    n = 0
+    t0 = time.perf_counter()
+    while time.perf_counter() - t0 < seconds:
+        work()
+        n += 1
+        time.sleep(interval)
+    return n / (time.perf_counter() - t0)
+
+
+def run_ticker(interval, seconds):
+    ticker = Ticker(interval)
+    t0 = time.perf_counter()
+    while time.perf_counter() - t0 < seconds:
+        ticker.wait()
+        work()
+    return ticker
+
+
+def main():
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 3.0
+    print(f"{seconds:g} s per rate; achieved rate (error vs target)")
+    print(f"  {'target Hz':>9} {'sleep loop':>20} {'Ticker':>20} {'missed':>7} {'jitter mean/max µs':>19}")
+    for hz in RATES_HZ:
+        interval = 1 / hz
+        # 1 Hz needs a longer run to show more than rounding of the tick count.
+        duration = max(seconds, 5 * interval)
+        slept = run_sleep(interval, duration)
+        ticker = run_ticker(interval, duration)
+        mean, _, worst = ticker.jitter_us()
+        print(f"  {hz:>9,} {slept:>11,.1f} ({(slept / hz - 1) * 100:+5.1f}%) "
+              f"{ticker.rate:>11,.1f} ({(ticker.rate / hz - 1) * 100:+5.1f}%) "
+              f"{ticker.missed:>7,} {mean:>9.0f}/{worst:<9.0f}")
+
+
+if __name__ == "__main__":
+    main()
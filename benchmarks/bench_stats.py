@@ -0,0 +1,70 @@
+"""
+Per-tick cost of the window KPIs (mean/max per field and the ±2σ band):
+recomputed over the window frame versus read from the streaming
+WindowStats, with one new packet per tick.
+
+    python benchmarks/bench_stats.py
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "dashboard")))
+from ring_buffer import TelemetryRingBuffer
+from frames import TelemetryWindow
+from streaming_stats import WindowStats
+
+
+SIZES = [1_000, 10_000, 100_000]
+WINDOW_MIN = 30
+TICKS = 200
+FIELDS = ("temperature", "pressure")
+
+
+def recompute(df):
+    return {name: (df[name].mean(), df[name].std(), df[name].max()) for name in FIELDS}
+
+
+def main():
+    rng = random.Random(0)
+    window_ns = WINDOW_MIN * 60 * 1_000_000_000
+    print(f"{'window':>8} | {'recompute/tick':>14} | {'streaming/tick':>14} | {'ingest/packet':>13}")
+    for size in SIZES:
+        now_ns = time.time_ns()
+        step_ns = window_ns // size
+        buf = TelemetryRingBuffer(size)
+        stats = WindowStats(window_ns, buf)
+        for i in range(size):
+            ts = now_ns - (size - i) * step_ns
+            stats.make_room()
+            buf.append(ts, rng.gauss(75, 5), rng.gauss(30, 3), "OK", True, "boiler_01")
+            stats.add_last()
+        window = TelemetryWindow(buf, WINDOW_MIN)
+
+        recomputed = streaming = ingest = 0.0
+        for _ in range(TICKS):
+            now_ns += step_ns
+            t0 = time.perf_counter()
+            stats.make_room()
+            ingest += time.perf_counter() - t0
+            buf.append(now_ns, rng.gauss(75, 5), rng.gauss(30, 3), "OK", True, "boiler_01")
+            t0 = time.perf_counter()
+            stats.add_last()
+            ingest += time.perf_counter() - t0
+
+            df = window.refresh(now_ns)
+            t0 = time.perf_counter()
+            recompute(df)
+            recomputed += time.perf_counter() - t0
+
+            t0 = time.perf_counter()
+            stats.snapshot(now_ns)
+            streaming += time.perf_counter() - t0
+
+        print(f"{size:>8,} | {recomputed / TICKS * 1e3:>11.3f} ms | {streaming / TICKS * 1e3:>11.3f} ms"
+              f" | {ingest / TICKS * 1e6:>10.1f} µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+TelemetryStore ingest rate and range-query latency.
+
+Fills a temporary database with 30 days of 1 Hz telemetry for one device
+(plus the same volume spread over other devices), then times raw range
+queries and bucketed queries for 30-minute, 24-hour and 30-day windows.
+
+    python benchmarks/bench_store.py [days]
+"""
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "dashboard")))
+from telemetry_store import TelemetryStore
+
+
+NS = 1_000_000_000
+WINDOWS = {"30 min": 30 * 60 * NS, "24 h": 24 * 3600 * NS, "30 d": 30 * 24 * 3600 * NS}
+DEVICES = ["boiler_01", "boiler_02", "boiler_03"]
+PLOT_POINTS = 720
+FLUSH_EVERY = 200_000
+
+
+def timed(fn, repeats=3):
+    best = float("inf")
+    result = None
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - t0)
+    return result, best
+
+
+def main():
+    days = float(sys.argv[1]) if len(sys.argv) > 1 else 30
+    n = int(days * 24 * 3600)
+    now_ns = time.time_ns()
+    rng = np.random.default_rng(0)
+    ts = now_ns - (n - np.arange(n, dtype=np.int64)) * NS
+    temperature = rng.uniform(65, 92, n).round(2).tolist()
+    pressure = rng.uniform(18, 42, n).round(2).tolist()
+    ts = ts.tolist()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = TelemetryStore(os.path.join(tmp, "bench.db"), batch_size=5000, max_queue=FLUSH_EVERY)
+        store.start()
+
+        t0 = time.perf_counter()
+        queued = 0
+        for device in DEVICES:
+            for i in range(n):
+                store.add(device, ts[i], temperature[i], pressure[i], "OK", True, None)
+                queued += 1
+                if queued == FLUSH_EVERY:
+                    # Stay under the queue bound so the rate measured is the writer's.
+                    store.flush()
+                    queued = 0
+        store.flush()
+        elapsed = time.perf_counter() - t0
+        store.stop()
+        total = n * len(DEVICES)
+        size_mb = os.path.getsize(os.path.join(tmp, "bench.db")) / 1e6
+        print(f"ingest: {total:,} rows in {elapsed:.1f}s = {total / elapsed:,.0f} rows/s, {size_mb:.0f} MB on disk"
+              f" (dropped {store.dropped:,})")
+
+        print(f"{'window':>8} | {'rows':>10} | {'raw query':>10} | {'buckets':>8} | {'bucketed query':>14}")
+        for label, span_ns in WINDOWS.items():
+            raw, raw_t = timed(lambda: store.query(DEVICES[0], now_ns - span_ns, now_ns))
+            buckets, bucket_t = timed(lambda: store.query_buckets(DEVICES[0], now_ns - span_ns, now_ns, span_ns // PLOT_POINTS))
+            print(f"{label:>8} | {len(raw['ts_ns']):>10,} | {raw_t * 1e3:>8.1f}ms | {len(buckets['ts_ns']):>8,} | {bucket_t * 1e3:>12.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
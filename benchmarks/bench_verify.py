@@ -0,0 +1,57 @@
+"""
+Throughput of batch integrity verification against the per-row path.
+
+    python benchmarks/bench_verify.py [n_payloads]
+"""
+import os
+import random
+import sys
+import time
+from datetime import datetime, timezone, timedelta
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "dashboard")))
+from integrity import sha256_hash, verify_hash, verify_many
+
+
+def make_payloads(n):
+    start = datetime.now(timezone.utc) - timedelta(seconds=n)
+    payloads = []
+    for i in range(n):
+        payload = {
+            "device_id": f"boiler_{i % 500:03d}",
+            "timestamp": (start + timedelta(seconds=i)).isoformat(),
+            "temperature": round(random.uniform(65.0, 92.0), 2),
+            "pressure": round(random.uniform(18.0, 42.0), 2),
+            "status": "OK",
+        }
+        payload["hash"] = sha256_hash(payload)
+        if i % 97 == 0:
+            payload["temperature"] = 100.0
+        payloads.append(payload)
+    return payloads
+
+
+def timed(fn):
+    t0 = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - t0
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    payloads = make_payloads(n)
+    workers = os.cpu_count()
+
+    reference, base = timed(lambda: [verify_hash(p) for p in payloads])
+    print(f"{n:,} payloads, {workers} CPU(s)")
+    print(f"{'path':>22} | {'payloads/s':>12} | {'speedup':>7}")
+    print(f"{'per-row verify_hash':>22} | {n / base:>12,.0f} | {1.0:>6.2f}x")
+
+    for executor in ("inline", "thread", "process"):
+        result, elapsed = timed(lambda: verify_many(payloads, executor=executor, workers=workers))
+        assert result.tolist() == reference
+        print(f"{'verify_many ' + executor:>22} | {n / elapsed:>12,.0f} | {base / elapsed:>6.2f}x")
+
+
+if __name__ == "__main__":
+    main()
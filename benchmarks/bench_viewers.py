@@ -0,0 +1,70 @@
+"""
+Per-tick window cost as dashboard sessions are added: one TelemetryWindow
+and stats snapshot per session versus the process-wide SharedWindows, with
+one new packet per tick and every session refreshing once per tick.
+
+    python benchmarks/bench_viewers.py
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "dashboard")))
+from frames import TelemetryWindow, SharedWindows
+from mqtt_client import DevicePartition
+
+
+VIEWERS = [1, 4, 16, 64]
+SAMPLES = 10_000
+WINDOW_MIN = 30
+TICKS = 50
+
+
+def make_partition(rng, now_ns, step_ns):
+    partition = DevicePartition("boiler_01", SAMPLES, WINDOW_MIN * 60 * 1_000_000_000)
+    for i in range(SAMPLES):
+        partition.add(packet(rng), now_ns - (SAMPLES - i) * step_ns)
+    return partition
+
+
+def packet(rng):
+    return {"temperature": rng.gauss(75, 5), "pressure": rng.gauss(30, 3), "status": "OK", "integrity_ok": True}
+
+
+def main():
+    rng = random.Random(0)
+    step_ns = WINDOW_MIN * 60 * 1_000_000_000 // SAMPLES
+    print(f"{'viewers':>7} | {'per-session':>12} | {'shared':>10}")
+    for viewers in VIEWERS:
+        now_ns = time.time_ns()
+        partition = make_partition(rng, now_ns, step_ns)
+        own = [TelemetryWindow(partition.buffer, WINDOW_MIN) for _ in range(viewers)]
+        # Each tick is its own interval; expire the shared view explicitly.
+        shared = SharedWindows(WINDOW_MIN, min_interval_s=float("inf"))
+        for window in own:
+            window.refresh(now_ns)
+        shared.view(partition, now_ns)
+
+        per_session = sharing = 0.0
+        for _ in range(TICKS):
+            now_ns += step_ns
+            partition.add(packet(rng), now_ns)
+
+            t0 = time.perf_counter()
+            for window in own:
+                window.refresh(now_ns)
+                partition.window_stats(now_ns)
+            per_session += time.perf_counter() - t0
+
+            t0 = time.perf_counter()
+            shared._views.clear()
+            for _ in range(viewers):
+                shared.view(partition, now_ns)
+            sharing += time.perf_counter() - t0
+
+        print(f"{viewers:>7} | {per_session / TICKS * 1e3:>9.3f} ms | {sharing / TICKS * 1e3:>7.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Per-tick latency of the dashboard window: full rebuild and mask filter
+versus the incremental TelemetryWindow, with one new packet per tick.
+
+    python benchmarks/bench_window.py
+"""
+import os
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "dashboard")))
+from ring_buffer import TelemetryRingBuffer
+from frames import to_df, TelemetryWindow
+
+
+SIZES = [1_000, 10_000, 100_000]
+WINDOW_MIN = 30
+TICKS = 200
+
+
+def fill(buf, n, now_ns, step_ns):
+    for i in range(n):
+        buf.append(now_ns - (n - i) * step_ns, 75.0, 30.0, "OK", True, "boiler_01")
+
+
+def main():
+    print(f"{'history':>8} | {'rebuild+filter/tick':>19} | {'incremental/tick':>16}")
+    for size in SIZES:
+        now_ns = time.time_ns()
+        step_ns = WINDOW_MIN * 60 * 1_000_000_000 // size
+        buf = TelemetryRingBuffer(size)
+        fill(buf, size, now_ns, step_ns)
+        window = TelemetryWindow(buf, WINDOW_MIN)
+        window.refresh(now_ns)
+
+        rebuild = incremental = 0.0
+        for tick in range(TICKS):
+            now_ns += step_ns
+            buf.append(now_ns, 75.0, 30.0, "OK", True, "boiler_01")
+
+            t0 = time.perf_counter()
+            df = to_df(buf)
+            df[df["ts_ns"] >= now_ns - window.window_ns]
+            rebuild += time.perf_counter() - t0
+
+            t0 = time.perf_counter()
+            window.refresh(now_ns)
+            incremental += time.perf_counter() - t0
+
+        print(f"{size:>8,} | {rebuild / TICKS * 1e3:>17.3f}ms | {incremental / TICKS * 1e3:>14.3f}ms")
+
+
+if __name__ == "__main__":
+    main()
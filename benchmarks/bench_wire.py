@@ -0,0 +1,108 @@
+"""
+JSON versus the binary wire format (wire.py): bytes per message, publisher
+encode (hash + serialize), decode (parse + verify + timestamp) and the
+whole MqttBuffer ingest path per message.
+
+    python benchmarks/bench_wire.py [messages]
+"""
+import json
+import os
+import random
+import sys
+import time
+from datetime import datetime, timezone, timedelta
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "dashboard")))
+from integrity import sha256_hash, verify_hash
+from mqtt_client import MqttBuffer, parse_timestamp_ns
+from transport import LoopbackBroker, LoopbackTransport, Message
+import wire
+
+
+TOPIC = "cu/bca/boiler/secure_digital_twin"
+
+
+def make_payloads(n, seed=0):
+    rng = random.Random(seed)
+    start = datetime.now(timezone.utc) - timedelta(seconds=n)
+    return [
+        {
+            "device_id": f"boiler_{i % 100:05d}",
+            "timestamp": (start + timedelta(seconds=i)).isoformat(),
+            "temperature": round(rng.uniform(65, 92), 2),
+            "pressure": round(rng.uniform(18, 42), 2),
+            "status": rng.choice(["OK", "Warning", "Critical"]),
+        }
+        for i in range(n)
+    ]
+
+
+def encode_json(payloads):
+    out = []
+    for p in payloads:
+        p = dict(p)
+        p["hash"] = sha256_hash(p)
+        out.append(json.dumps(p).encode("utf-8"))
+    return out
+
+
+def encode_binary(payloads, ts):
+    return [wire.encode(p["device_id"], t, p["temperature"], p["pressure"], p["status"]) for p, t in zip(payloads, ts)]
+
+
+def decode_json(messages):
+    for m in messages:
+        p = json.loads(m.decode("utf-8"))
+        verify_hash(p)
+        parse_timestamp_ns(p["timestamp"])
+
+
+def decode_binary(messages, device_ids):
+    for m, d in zip(messages, device_ids):
+        wire.decode(d, m)
+
+
+def ingest(messages):
+    buf = MqttBuffer(broker="loopback", port=0, topic=TOPIC, maxlen=len(messages),
+                     transport=LoopbackTransport(LoopbackBroker(), "dashboard"))
+    for m in messages:
+        buf._on_message(None, None, m)
+    assert buf.total_packets == len(messages), buf.last_error
+
+
+def best_of(fn, repeats=5):
+    best = float("inf")
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    payloads = make_payloads(n)
+    ts = [parse_timestamp_ns(p["timestamp"]) for p in payloads]
+    device_ids = [p["device_id"] for p in payloads]
+    as_json = encode_json(payloads)
+    as_binary = encode_binary(payloads, ts)
+    json_msgs = [Message(f"{TOPIC}/{d}", m) for d, m in zip(device_ids, as_json)]
+    binary_msgs = [Message(wire.binary_topic(f"{TOPIC}/{d}"), m) for d, m in zip(device_ids, as_binary)]
+
+    rows = [
+        ("bytes/message", sum(map(len, as_json)) / n, sum(map(len, as_binary)) / n, ""),
+        ("encode", best_of(lambda: encode_json(payloads)), best_of(lambda: encode_binary(payloads, ts)), "msg/s"),
+        ("decode + verify", best_of(lambda: decode_json(as_json)),
+         best_of(lambda: decode_binary(as_binary, device_ids)), "msg/s"),
+        ("MqttBuffer ingest", best_of(lambda: ingest(json_msgs), 3), best_of(lambda: ingest(binary_msgs), 3), "msg/s"),
+    ]
+    print(f"{n:,} messages")
+    print(f"  {'':<18} {'JSON':>12} {'binary':>12}")
+    for label, a, b, unit in rows:
+        if unit:
+            a, b = n / a, n / b
+        print(f"  {label:<18} {a:>12,.0f} {b:>12,.0f} {unit}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,389 @@
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+
+from downsample import downsample_indices
+from theme import get_theme_colors
+
+
+# Upper bound on points per line trace, roughly one per horizontal pixel of
+# a chart; longer series are downsampled before they are sent to the browser.
+MAX_CHART_POINTS = 1000
+
+# Figure templates -- layout plus per-trace styling, as plain dicts -- keyed
+# by chart builder, its constant arguments and the theme colors.
+_templates = {}
+
+
+def _template(build, *args):
+    """
+    The figure `build(*args)` returns, as a plain dict. Built and validated
+    once per theme; later refreshes reuse it and only swap in new data.
+    """
+    key = (build.__name__, args, tuple(get_theme_colors().items()))
+    template = _templates.get(key)
+    if template is None:
+        template = _templates[key] = build(*args).to_plotly_json()
+    return template
+
+
+def _figure(data, layout):
+    # Styling in `layout` and the trace dicts was validated when the template
+    # was built; skipping validation here is what makes a refresh cheap.
+    return go.Figure({"data": data, "layout": layout}, _validate=False)
+
+
+def _plot_series(df, y_col, max_points, method="minmax"):
+    """(timestamps, values) of `y_col`, downsampled to at most ~max_points."""
+    x = df["ts_ns"].to_numpy() if "ts_ns" in df.columns else df["timestamp"].to_numpy().view("int64")
+    y = df[y_col].to_numpy()
+    idx = downsample_indices(x, y, max_points, method)
+    if len(idx) == len(y):
+        return df["timestamp"], df[y_col]
+    return df["timestamp"].to_numpy()[idx], y[idx]
+
+
+def _gauge_title(title, subtitle):
+    colors = get_theme_colors()
+    return f"{title}<br><span style='font-size:12px;color:{colors['text_secondary']}'>{subtitle if subtitle else ''}</span>"
+
+
+def create_gauge(title, value, unit, vmin, vmax, color, subtitle=None):
+    template = _template(_build_gauge, title, unit, vmin, vmax, color)
+    indicator = template["data"][0]
+    return _figure(
+        [{**indicator, "value": value, "title": {**indicator["title"], "text": _gauge_title(title, subtitle)}}],
+        template["layout"],
+    )
+
+
+def _build_gauge(title, unit, vmin, vmax, color):
+    colors = get_theme_colors()
+
+    muted_color = f"rgba({int(color[1:3], 16)}, {int(color[3:5], 16)}, {int(color[5:7], 16)}, 0.8)"
+    
+    # Determine status zones
+    warning_threshold = vmax * 0.7
+    critical_threshold = vmax * 0.85
+    
+    fig = go.Figure(go.Indicator(
+        mode="gauge+number",
+        value=vmin,
+        number={
+            "suffix": f" {unit}",
+            "font": {"size": 44, "color": colors['text_primary'], "family": "Inter", "weight": 900}
+        },
+        title={
+            "text": _gauge_title(title, None),
+            "font": {"size": 16, "color": colors['text_primary'], "family": "Inter", "weight": 700}
+        },
+        gauge={
+            "axis": {
+                "range": [vmin, vmax], 
+                "tickwidth": 2, 
+                "tickcolor": colors['grid'],
+                "tickfont": {"color": colors['text_secondary'], "size": 12, "family": "JetBrains Mono"}
+            },
+            "bar": {"color": muted_color, "thickness": 0.7},
+            "bgcolor": colors['card_bg'],
+            "borderwidth": 0,
+            "steps": [
+                {"range": [vmin, warning_threshold], "color": f"rgba(16, 185, 129, 0.08)"},
+                {"range": [warning_threshold, critical_threshold], "color": f"rgba(245, 158, 11, 0.12)"},
+                {"range": [critical_threshold, vmax], "color": f"rgba(239, 68, 68, 0.15)"}
+            ],
+            "threshold": {
+                "line": {"color": colors['accent_red'], "width": 4},
+                "thickness": 0.8,
+                "value": critical_threshold
+            }
+        }
+    ))
+    
+    fig.update_layout(
+        height=260,
+        margin=dict(l=20, r=20, t=80, b=20),
+        paper_bgcolor="rgba(0,0,0,0)",
+        plot_bgcolor="rgba(0,0,0,0)",
+        font={"color": colors['text_secondary'], "family": "Inter", "size": 12}
+    )
+    return fig
+
+
+def create_line_chart(df, y_col, title, unit, color, show_anomalies=False, stats=None, max_points=MAX_CHART_POINTS):
+    """
+    `stats` is an optional {"count", "mean", "std"} snapshot for `y_col`
+    (see WindowStats); when given, the ±2σ anomaly band is read from it
+    instead of being recomputed over `df`.
+
+    The line is min-max downsampled to `max_points` (None disables it);
+    anomaly markers are always taken from the full series.
+    """
+    template = _template(_build_line_chart, y_col, title, unit, color)
+    line, markers = template["data"]
+
+    x, y = _plot_series(df, y_col, max_points)
+    data = [{**line, "x": x, "y": y}]
+
+    # Add anomaly markers if requested
+    if show_anomalies and y_col in df.columns and (stats["count"] if stats else len(df)) > 10:
+        if stats:
+            mean_val, std_val = stats["mean"], stats["std"]
+        else:
+            mean_val = df[y_col].mean()
+            std_val = df[y_col].std()
+        anomalies = df[(df[y_col] > mean_val + 2*std_val) | (df[y_col] < mean_val - 2*std_val)]
+        
+        if not anomalies.empty:
+            data.append({**markers, "x": anomalies["timestamp"], "y": anomalies[y_col]})
+
+    return _figure(data, template["layout"])
+
+
+def _build_line_chart(y_col, title, unit, color):
+    colors = get_theme_colors()
+    
+    muted_line = f"rgba({int(color[1:3], 16)}, {int(color[3:5], 16)}, {int(color[5:7], 16)}, 0.9)"
+    
+    fig = go.Figure()
+    
+    # Main line
+    fig.add_trace(go.Scatter(
+        mode="lines",
+        name=y_col.capitalize(),
+        line=dict(color=muted_line, width=2.5, shape='spline'),
+        fill='tozeroy',
+        fillcolor=f'rgba({int(color[1:3], 16)}, {int(color[3:5], 16)}, {int(color[5:7], 16)}, 0.1)',
+        hovertemplate=f'<b>%{{y:.2f}} {unit}</b><br>%{{x|%H:%M:%S}}<extra></extra>'
+    ))
+    
+    # Anomaly markers, only added to a figure when there are anomalies
+    fig.add_trace(go.Scatter(
+        mode="markers",
+        name="Anomalies",
+        marker=dict(
+            size=12,
+            color=colors['accent_red'],
+            symbol='x',
+            line=dict(width=2, color=colors['accent_red'])
+        ),
+        hovertemplate=f'<b>ANOMALY</b><br>%{{y:.2f}} {unit}<br>%{{x|%H:%M:%S}}<extra></extra>'
+    ))
+    
+    fig.update_layout(
+        height=320,
+        margin=dict(l=20, r=20, t=60, b=50),
+        title={
+            "text": f"{title.upper()}",
+            "font": {"size": 14, "color": colors['text_primary'], "family": "Inter", "weight": 700},
+            "x": 0.02,
+            "xanchor": "left"
+        },
+        xaxis=dict(
+            title=None,
+            showgrid=True, 
+            gridcolor=f"rgba({int(colors['grid'][1:3], 16)}, {int(colors['grid'][3:5], 16)}, {int(colors['grid'][5:7], 16)}, 0.3)",
+            gridwidth=1,
+            tickfont={"color": colors['text_primary'], "size": 11, "family": "JetBrains Mono"},
+            linecolor=colors['border'],
+            tickformat="%H:%M:%S"
+        ),
+        yaxis=dict(
+            title=None,
+            showgrid=True, 
+            gridcolor=f"rgba({int(colors['grid'][1:3], 16)}, {int(colors['grid'][3:5], 16)}, {int(colors['grid'][5:7], 16)}, 0.3)",
+            gridwidth=1,
+            tickfont={"color": colors['text_primary'], "size": 11, "family": "JetBrains Mono"},
+            linecolor=colors['border'],
+            ticksuffix=f" {unit}"
+        ),
+        showlegend=False,
+        paper_bgcolor="rgba(0,0,0,0)",
+        plot_bgcolor="rgba(0,0,0,0)",
+        font={"color": colors['text_primary'], "family": "Inter", "size": 12},
+        hovermode="x unified",
+        hoverlabel=dict(
+            bgcolor=colors['card_bg_elevated'],
+            font_size=12,
+            font_family="JetBrains Mono",
+            bordercolor=colors['border']
+        )
+    )
+    
+    fig.update_xaxes(
+        rangeslider=dict(visible=False),
+        rangeselector=dict(
+            buttons=list([
+                dict(count=5, label="5M", step="minute", stepmode="backward"),
+                dict(count=15, label="15M", step="minute", stepmode="backward"),
+                dict(count=30, label="30M", step="minute", stepmode="backward"),
+                dict(step="all", label="ALL")
+            ]),
+            font=dict(color=colors['text_primary'], size=11, family="Inter", weight=600),
+            bgcolor=colors['card_bg'],
+            activecolor=colors['accent_blue'],
+            bordercolor=colors['border'],
+            borderwidth=1,
+            x=1.0,
+            xanchor="right",
+            y=1.15
+        )
+    )
+    
+    return fig
+
+
+def create_status_distribution(df):
+    """Create a pie chart showing status distribution"""
+    colors = get_theme_colors()
+    
+    if df.empty:
+        return None
+    
+    status_counts = df['status'].value_counts()
+    status_counts = status_counts[status_counts > 0]
+    
+    color_map = {
+        'ok': colors['accent_green'],
+        'OK': colors['accent_green'],
+        'warning': colors['accent_yellow'],
+        'WARNING': colors['accent_yellow'],
+        'critical': colors['accent_red'],
+        'CRITICAL': colors['accent_red']
+    }
+    
+    pie_colors = [color_map.get(status, colors['text_muted']) for status in status_counts.index]
+
+    template = _template(_build_status_distribution)
+    pie = template["data"][0]
+    layout = template["layout"]
+    total = layout["annotations"][0]
+    return _figure(
+        [{**pie, "labels": status_counts.index.to_numpy(), "values": status_counts.to_numpy(),
+          "marker": {**pie["marker"], "colors": pie_colors}}],
+        {**layout, "annotations": [{**total, "text": f'{len(df)}<br><span style="font-size:12px">TOTAL</span>'}]},
+    )
+
+
+def _build_status_distribution():
+    colors = get_theme_colors()
+    
+    fig = go.Figure(data=[go.Pie(
+        hole=0.6,
+        marker=dict(line=dict(color=colors['border'], width=2)),
+        textfont=dict(size=12, family="Inter", weight=600),
+        hovertemplate='<b>%{label}</b><br>Count: %{value}<br>%{percent}<extra></extra>'
+    )])
+    
+    fig.update_layout(
+        title={
+            "text": "STATUS DISTRIBUTION",
+            "font": {"size": 14, "color": colors['text_primary'], "family": "Inter", "weight": 700},
+            "x": 0.02,
+            "xanchor": "left"
+        },
+        annotations=[dict(x=0.5, y=0.5, font_size=18, font_family="Inter", 
+                         font_color=colors['text_primary'], font_weight=900, showarrow=False)],
+        height=280,
+        margin=dict(l=20, r=20, t=60, b=20),
+        paper_bgcolor="rgba(0,0,0,0)",
+        plot_bgcolor="rgba(0,0,0,0)",
+        showlegend=True,
+        legend=dict(
+            font=dict(color=colors['text_primary'], family="Inter", size=12),
+            bgcolor="rgba(0,0,0,0)",
+            bordercolor=colors['border'],
+            borderwidth=1
+        )
+    )
+    
+    return fig
+
+
+def create_dual_axis_chart(df, title="CORRELATED PARAMETER ANALYSIS", max_points=MAX_CHART_POINTS):
+    """Create a chart with dual y-axes for temperature and pressure"""
+    template = _template(_build_dual_axis_chart, title)
+    data = []
+    for trace, y_col in zip(template["data"], ("temperature", "pressure")):
+        x, y = _plot_series(df, y_col, max_points)
+        data.append({**trace, "x": x, "y": y})
+    return _figure(data, template["layout"])
+
+
+def _build_dual_axis_chart(title):
+    colors = get_theme_colors()
+    
+    fig = make_subplots(specs=[[{"secondary_y": True}]])
+    
+    fig.add_trace(
+        go.Scatter(
+            name="Temperature",
+            line=dict(color=colors['accent_blue'], width=2),
+            hovertemplate='<b>Temp:</b> %{y:.1f} °C<extra></extra>'
+        ),
+        secondary_y=False,
+    )
+    
+    fig.add_trace(
+        go.Scatter(
+            name="Pressure",
+            line=dict(color=colors['accent_purple'], width=2),
+            hovertemplate='<b>Pressure:</b> %{y:.1f} PSI<extra></extra>'
+        ),
+        secondary_y=True,
+    )
+    
+    fig.update_xaxes(
+        title_text=None,
+        showgrid=True,
+        gridcolor=f"rgba({int(colors['grid'][1:3], 16)}, {int(colors['grid'][3:5], 16)}, {int(colors['grid'][5:7], 16)}, 0.3)",
+        tickfont={"color": colors['text_primary'], "size": 11, "family": "JetBrains Mono"},
+        tickformat="%H:%M:%S"
+    )
+    
+    fig.update_yaxes(
+        title_text="Temperature (°C)",
+        title_font=dict(color=colors['accent_blue'], size=12, family="Inter"),
+        tickfont={"color": colors['accent_blue'], "size": 11, "family": "JetBrains Mono"},
+        showgrid=True,
+        gridcolor=f"rgba({int(colors['grid'][1:3], 16)}, {int(colors['grid'][3:5], 16)}, {int(colors['grid'][5:7], 16)}, 0.3)",
+        secondary_y=False
+    )
+    
+    fig.update_yaxes(
+        title_text="Pressure (PSI)",
+        title_font=dict(color=colors['accent_purple'], size=12, family="Inter"),
+        tickfont={"color": colors['accent_purple'], "size": 11, "family": "JetBrains Mono"},
+        showgrid=False,
+        secondary_y=True
+    )
+    
+    fig.update_layout(
+        title={
+            "text": title,
+            "font": {"size": 14, "color": colors['text_primary'], "family": "Inter", "weight": 700},
+            "x": 0.02,
+            "xanchor": "left"
+        },
+        height=320,
+        margin=dict(l=20, r=20, t=60, b=50),
+        paper_bgcolor="rgba(0,0,0,0)",
+        plot_bgcolor="rgba(0,0,0,0)",
+        hovermode="x unified",
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=1.02,
+            xanchor="right",
+            x=1,
+            font=dict(color=colors['text_primary'], family="Inter", size=12),
+            bgcolor="rgba(0,0,0,0)"
+        ),
+        hoverlabel=dict(
+            bgcolor=colors['card_bg_elevated'],
+            font_size=11,
+            font_family="JetBrains Mono",
+            bordercolor=colors['border']
+        )
+    )
+    
+    return fig
@@ -0,0 +1,76 @@
+import numpy as np
+
+
+def _edges(n: int, n_buckets: int) -> np.ndarray:
+    return np.linspace(0, n, n_buckets + 1).astype(np.int64)
+
+
+def minmax_indices(y: np.ndarray, max_points: int) -> np.ndarray:
+    """
+    Indices of the minimum and maximum sample in each of max_points // 2
+    equal-count buckets, plus the first and last sample, in order.
+    Every local extreme wider than a bucket survives, so peaks are exact.
+    """
+    n = len(y)
+    n_buckets = max((max_points - 2) // 2, 1)
+    if n <= max_points:
+        return np.arange(n)
+
+    size = -(-n // n_buckets)
+    pad = size * n_buckets - n
+    y = np.asarray(y, dtype=np.float64)
+    lo = np.concatenate([y, np.full(pad, np.inf)]).reshape(n_buckets, size)
+    hi = np.concatenate([y, np.full(pad, -np.inf)]).reshape(n_buckets, size)
+    lo[np.isnan(lo)] = np.inf
+    hi[np.isnan(hi)] = -np.inf
+    offsets = np.arange(n_buckets) * size
+    picks = np.concatenate([[0, n - 1], offsets + lo.argmin(axis=1), offsets + hi.argmax(axis=1)])
+    return np.unique(picks[picks < n])
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, max_points: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets: keeps the first and last sample and, per
+    bucket, the sample forming the largest triangle with the previously kept
+    sample and the next bucket's centroid. Follows the visual shape closely
+    but, unlike minmax_indices, may shave single-sample peaks.
+    """
+    n = len(y)
+    if n <= max_points or max_points < 3:
+        return np.arange(n)
+
+    x = np.asarray(x, dtype=np.float64)
+    x = x - x[0]
+    y = np.asarray(y, dtype=np.float64)
+    edges = _edges(n - 2, max_points - 2) + 1
+    picks = np.empty(max_points, dtype=np.int64)
+    picks[0], picks[-1] = 0, n - 1
+
+    # Bucket centroids, NaN-aware, computed up front; the last sample stands
+    # in for the bucket after the final one.
+    valid = ~np.isnan(y)
+    counts = np.add.reduceat(valid, edges[:-1])
+    sums = np.add.reduceat(np.where(valid, y, 0.0), edges[:-1])
+    cx = np.append(np.add.reduceat(x, edges[:-1]) / np.diff(edges), x[n - 1])
+    cy = np.append(np.divide(sums, counts, out=np.full(len(sums), np.nan), where=counts > 0), y[n - 1])
+
+    a = 0
+    for i in range(max_points - 2):
+        lo, hi = edges[i], edges[i + 1]
+        ax, ay = x[a], y[a] if valid[a] else 0.0
+        area = np.abs((ax - cx[i + 1]) * (y[lo:hi] - ay) - (ax - x[lo:hi]) * (cy[i + 1] - ay))
+        area[np.isnan(area)] = -1.0
+        a = lo + int(area.argmax())
+        picks[i + 1] = a
+    return picks
+
+
+def downsample_indices(x: np.ndarray, y: np.ndarray, max_points: int, method: str = "minmax") -> np.ndarray:
+    """Indices of at most ~max_points samples to plot in place of the full series."""
+    if max_points is None or len(y) <= max_points:
+        return np.arange(len(y))
+    if method == "minmax":
+        return minmax_indices(y, max_points)
+    if method == "lttb":
+        return lttb_indices(x, y, max_points)
+    raise ValueError(f"unknown downsampling method {method!r}, expected 'minmax' or 'lttb'")
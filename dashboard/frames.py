@@ -0,0 +1,192 @@
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+from ring_buffer import TelemetryRingBuffer
+
+
+def to_df(buffer, last=None):
+    """
+    Builds the dashboard DataFrame from the ingest ring buffer.
+    Integrity and timestamp parsing were already done once at ingest, and
+    the columns are views into the buffer; only out-of-order arrivals force
+    a sorted copy. `last` limits the frame to the most recent samples, which
+    are then copied with read_frame(), so the frame stays valid while the
+    ingest thread keeps appending.
+    """
+    if len(buffer) == 0:
+        return pd.DataFrame()
+
+    if last is None:
+        df = buffer.to_frame()
+    else:
+        df = buffer.read_frame(start_seq=buffer.seq - last)
+    ts = df["ts_ns"].to_numpy()
+    if len(ts) > 1 and not (ts[1:] >= ts[:-1]).all():
+        df = df.iloc[np.argsort(ts, kind="stable")]
+    return df
+
+
+def frame_stats(df, fields=("temperature", "pressure")) -> dict:
+    """
+    WindowStats.snapshot()-shaped count/mean/std/min/max per field, computed
+    directly over a frame's columns (NaN values ignored).
+    """
+    out = {}
+    for name in fields:
+        values = df[name].to_numpy(dtype=np.float64) if len(df) else np.empty(0)
+        values = values[~np.isnan(values)]
+        n = len(values)
+        out[name] = {
+            "count": n,
+            "mean": float(values.mean()) if n else np.nan,
+            "std": float(values.std(ddof=1)) if n > 1 else np.nan,
+            "min": float(values.min()) if n else np.nan,
+            "max": float(values.max()) if n else np.nan,
+        }
+    return out
+
+
+def data_quality(df, window_s: float, now_ns: int, interval_s: float) -> float:
+    """
+    Percentage of the expected samples that arrived. The expected count is
+    the publishers' configured `interval_s` over the window, or over the time
+    since the device's first sample in it if that is later, up to `now_ns`.
+    """
+    ts = df["ts_ns"].to_numpy() if len(df) else np.empty(0, dtype=np.int64)
+    if not len(ts):
+        return 0.0
+    span_ns = now_ns - max(int(ts[0]), now_ns - int(window_s * 1e9))
+    expected = max(span_ns, 0) / (interval_s * 1e9) + 1
+    return min(100.0, len(ts) / expected * 100)
+
+
+class TelemetryWindow:
+    """
+    Incrementally maintained, time-sorted view of the last `window_min`
+    minutes of an ingest ring buffer.
+
+    Each refresh copies only the samples that arrived since the previous
+    refresh (source.read(), safe while the ingest thread appends), sorts that
+    small batch, and evicts expired samples by moving the head forward. The
+    returned frame is a view over the window's own columns, so per-tick cost
+    follows the arrival rate rather than the history size.
+
+    Frames already handed out never change: an update that would rewrite
+    slots they cover (a late arrival re-merging the tail, or appending over
+    the slots of the oldest sample last returned) first moves the window
+    onto fresh arrays, leaving the old ones to those frames. The store
+    defaults to twice the source's capacity, so a full window of steady
+    arrivals makes that copy once per `capacity` samples, not every tick.
+    """
+
+    def __init__(self, source: TelemetryRingBuffer, window_min: float, capacity: int = None):
+        self.source = source
+        self.window_ns = int(window_min * 60 * 1_000_000_000)
+        self.store = TelemetryRingBuffer(capacity or 2 * source.capacity, share_devices_with=source)
+        self._seen_seq = 0
+        # Oldest store seq covered by a frame already returned; None if no
+        # returned frame shares the current store's arrays.
+        self._returned_head = None
+
+    def __len__(self):
+        return len(self.store)
+
+    def _detach(self):
+        """Moves the retained samples onto fresh arrays; returned frames keep the old ones."""
+        store = TelemetryRingBuffer(self.store.capacity, share_devices_with=self.source)
+        store.extend(self.store.columns())
+        self.store = store
+        self._returned_head = None
+
+    def _append_sorted(self, new: dict):
+        order = np.argsort(new["ts_ns"], kind="stable")
+        if (order[1:] < order[:-1]).any():
+            new = {name: col[order] for name, col in new.items()}
+
+        ts = self.store.columns()["ts_ns"]
+        if len(ts) and new["ts_ns"][0] < ts[-1]:
+            # Late arrival: re-merge only the tail it overlaps with.
+            k = int(np.searchsorted(ts, new["ts_ns"][0], side="right"))
+            tail = self.store.columns(start_seq=self.store.head + k)
+            merged = {name: np.concatenate([tail[name], new[name]]) for name in new}
+            order = np.argsort(merged["ts_ns"], kind="stable")
+            new = {name: col[order] for name, col in merged.items()}
+            self._detach()
+            self.store.truncate(self.store.head + k)
+        elif self._returned_head is not None and \
+                self.store.seq + len(new["ts_ns"]) - self._returned_head > self.store.capacity:
+            # The new samples wrap onto slots a returned frame still shows.
+            self._detach()
+
+        self.store.extend(new)
+
+    def refresh(self, now_ns: int = None) -> pd.DataFrame:
+        now_ns = time.time_ns() if now_ns is None else now_ns
+        cutoff = now_ns - self.window_ns
+        # Evict first so a steady stream fits without appending past capacity.
+        self.store.evict_before(cutoff)
+        start, new = self.source.read(self._seen_seq)
+        if len(new["ts_ns"]):
+            self._append_sorted(new)
+        self._seen_seq = start + len(new["ts_ns"])
+
+        self.store.evict_before(cutoff)
+        self._returned_head = self.store.head
+        return self.store.to_frame()
+
+
+class SharedWindows:
+    """
+    One TelemetryWindow per device, shared by every dashboard session in the
+    process.
+
+    view() refreshes a device's window and snapshots its window statistics
+    at most once per `min_interval_s`; every session asking within that
+    interval gets the same frame and snapshot, so per-tick cost stays flat
+    as viewers are added. Callers must treat the frame as read-only.
+
+    history() does the same for long-range store queries, per device, span
+    and point count.
+    """
+
+    def __init__(self, window_min: float, min_interval_s: float = 1.0):
+        self.window_min = window_min
+        self.min_interval_s = min_interval_s
+        self._windows = {}
+        self._views = {}
+        self._lock = threading.Lock()
+        self._history = {}
+        self._history_lock = threading.Lock()
+
+    def view(self, partition, now_ns: int = None):
+        """(frame, window stats) for `partition`, as of this tick."""
+        with self._lock:
+            cached = self._views.get(partition.device_id)
+            if cached is not None and time.monotonic() - cached[0] < self.min_interval_s:
+                return cached[1], cached[2]
+
+            window = self._windows.get(partition.device_id)
+            if window is None:
+                window = self._windows[partition.device_id] = TelemetryWindow(partition.buffer, self.window_min)
+            now_ns = time.time_ns() if now_ns is None else now_ns
+            df = window.refresh(now_ns)
+            stats = partition.window_stats(now_ns)
+            self._views[partition.device_id] = (time.monotonic(), df, stats)
+            return df, stats
+
+    def history(self, store, device_id: str, span_ns: int, points: int, now_ns: int = None) -> dict:
+        """store.query_buckets() over the last `span_ns` in `points` buckets, as of this tick."""
+        key = (device_id, span_ns, points)
+        # A separate lock, so a slow query does not hold up view().
+        with self._history_lock:
+            cached = self._history.get(key)
+            if cached is not None and time.monotonic() - cached[0] < self.min_interval_s:
+                return cached[1]
+
+            now_ns = time.time_ns() if now_ns is None else now_ns
+            result = store.query_buckets(device_id, now_ns - span_ns, now_ns, max(span_ns // points, 1))
+            self._history[key] = (time.monotonic(), result)
+            return result
@@ -1,15 +1,103 @@
 import hashlib
 import json
+import os
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor
+from json.encoder import encode_basestring_ascii
+
+import numpy as np
 
 HASH_FIELDS = ["device_id", "timestamp", "temperature", "pressure", "status"]
 
-def canonical_payload(payload: dict) -> str:
+# Generic fallback for values the fast path does not special-case. It is
+# configured exactly like the original json.dumps call.
+_CANONICAL_ENCODER = json.JSONEncoder(separators=(",", ":"), sort_keys=True)
+
+EXECUTORS = ("inline", "thread", "process")
+
+
+def _encode_float(value: float) -> str:
+    if value - value == 0.0:
+        return float.__repr__(value)
+    # NaN and +/-Infinity
+    return _CANONICAL_ENCODER.encode(value)
+
+
+# Exact types only: subclasses (IntEnum, str subclasses, ...) take the
+# generic encoder so the output always matches json.dumps.
+_VALUE_ENCODERS = {
+    str: encode_basestring_ascii,
+    float: _encode_float,
+    int: int.__repr__,
+    bool: lambda value: "true" if value else "false",
+    type(None): lambda value: "null",
+}
+
+
+def _compile_canonicalizer(fields):
+    """
+    Builds canonical_payload for a fixed field list.
+
+    The output is byte-identical to
+    json.dumps({k: payload.get(k) for k in fields}, separators=(",", ":"), sort_keys=True):
+    keys are sorted once here, and the per-field lookups and type dispatch
+    are unrolled into a generated function.
     """
+    keys = sorted(fields)
+    template = "{" + ",".join(encode_basestring_ascii(k).replace("%", "%%") + ":%s" for k in keys) + "}"
+    lines = ["def canonical_payload(payload):", "    get = payload.get"]
+    for i, key in enumerate(keys):
+        lines.append(f"    v{i} = get({key!r})")
+    encoded = ", ".join(f"lookup(type(v{i}), fallback)(v{i})" for i in range(len(keys)))
+    lines.append(f"    return template % ({encoded},)")
+
+    namespace = {"template": template, "lookup": _VALUE_ENCODERS.get, "fallback": _CANONICAL_ENCODER.encode}
+    exec("\n".join(lines), namespace)
+    fn = namespace["canonical_payload"]
+    fn.__doc__ = """
     Creates a stable string from selected fields only.
     This ensures consistent hashing across systems.
     """
-    clean = {k: payload.get(k) for k in HASH_FIELDS}
-    return json.dumps(clean, separators=(",", ":"), sort_keys=True)
+    return fn
+
+
+canonical_payload = _compile_canonicalizer(HASH_FIELDS)
+
+
+def _compile_column_canonicalizer(fields):
+    """
+    Builds canonical_columns for a fixed field list: canonical_payload() for
+    a whole batch, one field column at a time. A column whose values all
+    share one fast-path type is encoded with a single map(); the strings are
+    then filled into the same template, one % per payload.
+    """
+    keys = sorted(fields)
+    template = "{" + ",".join(encode_basestring_ascii(k).replace("%", "%%") + ":%s" for k in keys) + "}"
+    lookup, fallback = _VALUE_ENCODERS.get, _CANONICAL_ENCODER.encode
+
+    def encode_column(values):
+        types = set(map(type, values))
+        kind = types.pop() if len(types) == 1 else None
+        encoder = lookup(kind)
+        if encoder is None:
+            return [lookup(type(v), fallback)(v) for v in values]
+        # Telemetry columns repeat a lot (device ids, rounded readings), so
+        # each distinct value is encoded once. 0.0 and -0.0 are equal as dict
+        # keys but encode differently; such columns skip the cache.
+        distinct = dict.fromkeys(values)
+        if len(distinct) == len(values) or (kind is float and 0.0 in distinct):
+            return list(map(encoder, values))
+        encoded = {v: encoder(v) for v in distinct}
+        return list(map(encoded.__getitem__, values))
+
+    def canonical_columns(payloads) -> list:
+        """canonical_payload() for each of `payloads`, in order."""
+        columns = [encode_column([p.get(key) for p in payloads]) for key in keys]
+        return [template % row for row in zip(*columns)]
+
+    return canonical_columns
+
+
+canonical_columns = _compile_column_canonicalizer(HASH_FIELDS)
 
 def sha256_hash(payload: dict) -> str:
     msg = canonical_payload(payload).encode("utf-8")
@@ -20,3 +108,276 @@ def verify_hash(payload: dict) -> bool:
         return False
     expected = sha256_hash(payload)
     return expected == payload["hash"]
+
+
+def sha256_many(payloads) -> list:
+    """sha256_hash() for a batch of payloads."""
+    sha256 = hashlib.sha256
+    return [sha256(c.encode("utf-8")).hexdigest() for c in canonical_columns(payloads)]
+
+
+def canonical_many(payloads) -> list:
+    """
+    Canonical hash input for a batch of payloads, as UTF-8 bytes.
+    Identical to canonical_payload() for each element.
+    """
+    return [c.encode("utf-8") for c in canonical_columns(payloads)]
+
+
+def batch_hash(payloads) -> str:
+    """
+    One SHA-256 over the canonical forms of a batch of payloads, in order,
+    newline-separated. Covers the same fields as sha256_hash() per payload.
+    """
+    return hashlib.sha256(b"\n".join(canonical_many(payloads))).hexdigest()
+
+
+def _verify_chunk(payloads) -> list:
+    sha256 = hashlib.sha256
+    return [
+        "hash" in p and sha256(c.encode("utf-8")).hexdigest() == p["hash"]
+        for p, c in zip(payloads, canonical_columns(payloads))
+    ]
+
+
+def verify_many(payloads, executor="inline", workers: int = None, chunk_size: int = 4096) -> np.ndarray:
+    """
+    Verifies a batch of payloads and returns a boolean array aligned with the input.
+
+    `executor` is "inline", "thread", "process", or an existing
+    concurrent.futures.Executor, which is reused and left running.
+    Thread pools only help once payloads are large enough for hashlib to
+    release the GIL; for typical telemetry, "process" is the one that scales.
+    """
+    payloads = list(payloads)
+    if not payloads:
+        return np.zeros(0, dtype=bool)
+
+    if executor == "inline":
+        return np.array(_verify_chunk(payloads), dtype=bool)
+
+    chunks = [payloads[i:i + chunk_size] for i in range(0, len(payloads), chunk_size)]
+
+    if isinstance(executor, Executor):
+        results = list(executor.map(_verify_chunk, chunks))
+    elif executor in ("thread", "process"):
+        pool_cls = ThreadPoolExecutor if executor == "thread" else ProcessPoolExecutor
+        with pool_cls(max_workers=workers or os.cpu_count()) as pool:
+            results = list(pool.map(_verify_chunk, chunks))
+    else:
+        raise ValueError(f"unknown executor {executor!r}, expected one of {EXECUTORS} or an Executor")
+
+    return np.fromiter((ok for chunk in results for ok in chunk), dtype=bool, count=len(payloads))
+
+
+# ---------- Chain mode ----------
+# Instead of a hash per packet, a publisher numbers its packets with `seq`
+# and after every batch publishes a checkpoint: the Merkle root of the
+# batch's raw message bytes, chained to the previous checkpoint's root.
+# The checkpoint also lists the leaf digests, which are only consulted to
+# pinpoint the bad packets once a root fails to match.
+
+GENESIS_ROOT = "0" * 64
+
+
+def merkle_root(leaves) -> bytes:
+    """
+    Root of a binary SHA-256 Merkle tree over `leaves` (digests, in order).
+    An unpaired node is carried up a level unchanged.
+    """
+    sha256 = hashlib.sha256
+    level = list(leaves)
+    if not level:
+        return sha256(b"").digest()
+    while len(level) > 1:
+        paired = [sha256(level[i] + level[i + 1]).digest() for i in range(0, len(level) - 1, 2)]
+        if len(level) % 2:
+            paired.append(level[-1])
+        level = paired
+    return level[0]
+
+
+def chain_root(prev_root: str, leaves) -> str:
+    """Checkpoint root: the batch's Merkle root linked to the previous checkpoint root."""
+    return hashlib.sha256(bytes.fromhex(prev_root) + merkle_root(leaves)).hexdigest()
+
+
+class ChainSigner:
+    """
+    Publisher side of chain mode for one device. sign() stamps the next
+    `seq` on a payload and returns the message to publish, plus the
+    checkpoint message once `batch_size` packets have been signed.
+    """
+
+    def __init__(self, device_id: str, batch_size: int):
+        self.device_id = device_id
+        self.batch_size = batch_size
+        self.seq = 0
+        self.prev_root = GENESIS_ROOT
+        self._leaves = []
+
+    def sign(self, payload: dict):
+        payload["seq"] = self.seq
+        self.seq += 1
+        message = json.dumps(payload)
+        self._leaves.append(hashlib.sha256(message.encode("utf-8")).digest())
+        if len(self._leaves) < self.batch_size:
+            return message, None
+        return message, json.dumps(self.checkpoint())
+
+    @property
+    def pending(self) -> int:
+        """Packets signed since the last checkpoint."""
+        return len(self._leaves)
+
+    def checkpoint(self) -> dict:
+        """Closes the current batch; call directly to flush a partial batch."""
+        root = chain_root(self.prev_root, self._leaves)
+        checkpoint = {
+            "device_id": self.device_id,
+            "checkpoint": {
+                "first_seq": self.seq - len(self._leaves),
+                "count": len(self._leaves),
+                "prev": self.prev_root,
+                "root": root,
+                "leaves": [leaf.hex() for leaf in self._leaves],
+            },
+        }
+        self.prev_root = root
+        self._leaves = []
+        return checkpoint
+
+
+class ChainVerifier:
+    """
+    Dashboard side of chain mode for one device.
+
+    Packets are held by `seq` until the checkpoint covering them arrives.
+    A batch whose root matches is accepted with one comparison; otherwise
+    each packet is checked against the checkpoint's leaf list, and packets
+    the checkpoint covers but that never arrived are counted in `missing`.
+    Checkpoints whose `prev` does not continue the last root seen (a lost
+    or replayed batch) are counted in `broken_links`.
+
+    Both add() and checkpoint() return the packets they release, in seq
+    order, as (payload, ts_ns, ok) tuples. Packets left pending past
+    `max_pending`, or older than a checkpoint that has gone by, are released
+    as unverified.
+
+    Every seq below `released_below` has been dealt with; a QoS-1
+    redelivery of one of those packets (same seq, same bytes) or of its
+    checkpoint is dropped and counted in `duplicates` instead of being
+    released a second time. Any other packet below the mark is held, since
+    it may start a new chain: a checkpoint from seq 0 off GENESIS_ROOT that
+    is not a redelivery means the publisher restarted, and resets the mark.
+
+    Checkpoints that cannot belong to this chain (count not matching the
+    leaf list or above `max_pending`, or starting further than
+    `max_pending` past anything seen) are counted in `rejected` and leave
+    the state untouched.
+    """
+
+    def __init__(self, max_pending: int = 4096):
+        self.max_pending = max_pending
+        self.pending = {}
+        self.last_root = None
+        self.missing = 0
+        self.broken_links = 0
+        self.duplicates = 0
+        self.rejected = 0
+        self.released_below = 0
+        self._released = {}
+        self._genesis_root = None
+
+    def add(self, seq: int, message: bytes, payload: dict, ts_ns: int) -> list:
+        if seq < self.released_below and self._released.get(seq) == hashlib.sha256(message).digest():
+            self.duplicates += 1
+            return []
+        self.pending.setdefault(seq, (message, payload, ts_ns))
+        if len(self.pending) <= self.max_pending:
+            return []
+        oldest = min(self.pending)
+        message, payload, ts_ns = self.pending.pop(oldest)
+        self._release_below(oldest + 1, {oldest: hashlib.sha256(message).digest()})
+        return [(payload, ts_ns, False)]
+
+    def checkpoint(self, checkpoint: dict) -> list:
+        first, count = int(checkpoint["first_seq"]), int(checkpoint["count"])
+        leaves_hex = checkpoint.get("leaves")
+        horizon = max(self.released_below, max(self.pending, default=-1) + 1) + self.max_pending
+        if not (0 < count <= self.max_pending and isinstance(leaves_hex, list) and len(leaves_hex) == count
+                and 0 <= first <= horizon):
+            self.rejected += 1
+            return []
+
+        prev, root = checkpoint["prev"], checkpoint["root"]
+        released = []
+        if first == 0 and prev == GENESIS_ROOT:
+            if root == self._genesis_root:
+                self.duplicates += 1
+                return []
+            if self._genesis_root is not None or self.released_below:
+                released = self._restart(count)
+            self._genesis_root = root
+        elif first + count <= self.released_below:
+            self.duplicates += 1
+            return []
+
+        stale = sorted(seq for seq in self.pending if seq < first)
+        released += [(self.pending[seq][1], self.pending[seq][2], False) for seq in stale]
+        for seq in stale:
+            del self.pending[seq]
+
+        entries = [self.pending.pop(seq, None) for seq in range(first, first + count)]
+        sha256 = hashlib.sha256
+        leaves = [sha256(entry[0]).digest() if entry else None for entry in entries]
+        self.missing += leaves.count(None)
+        self._release_below(first + count, {first + i: leaf for i, leaf in enumerate(leaves) if leaf})
+
+        expected_prev = GENESIS_ROOT if self.last_root is None and first == 0 else self.last_root
+        if expected_prev is not None and prev != expected_prev:
+            self.broken_links += 1
+        self.last_root = root
+
+        if None not in leaves and chain_root(prev, leaves) == root:
+            ok = [True] * count
+        elif self._leaves_match_root(checkpoint, count):
+            ok = [leaf is not None and leaf.hex() == expected for leaf, expected in zip(leaves, leaves_hex)]
+        else:
+            # The checkpoint itself was altered; nothing in it can be trusted.
+            ok = [False] * count
+
+        released.extend((entry[1], entry[2], good) for entry, good in zip(entries, ok) if entry)
+        return released
+
+    def _release_below(self, seq: int, digests: dict):
+        """Moves the low-water mark to `seq`, remembering digests for redelivery checks."""
+        self.released_below = max(self.released_below, seq)
+        self._released.update(digests)
+        floor = self.released_below - self.max_pending
+        if len(self._released) > self.max_pending:
+            self._released = {s: d for s, d in self._released.items() if s >= floor}
+
+    def _restart(self, count: int) -> list:
+        """
+        Forgets the previous chain. Packets it left pending are released as
+        unverified, except the ones the new genesis checkpoint covers.
+        """
+        old = sorted(seq for seq in self.pending if seq >= count)
+        released = [(self.pending[seq][1], self.pending[seq][2], False) for seq in old]
+        for seq in old:
+            del self.pending[seq]
+        self.released_below = 0
+        self._released = {}
+        self.last_root = None
+        return released
+
+    @staticmethod
+    def _leaves_match_root(checkpoint: dict, count: int) -> bool:
+        expected = checkpoint.get("leaves")
+        if not isinstance(expected, list) or len(expected) != count:
+            return False
+        try:
+            return chain_root(checkpoint["prev"], [bytes.fromhex(leaf) for leaf in expected]) == checkpoint["root"]
+        except (TypeError, ValueError):
+            return False
@@ -0,0 +1,207 @@
+import bisect
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+# Upper bounds in seconds; a sample lands in the first bucket >= its value.
+VERIFY_BUCKETS = (5e-6, 1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 1e-3, 1e-2)
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0)
+
+
+class Histogram:
+    """Fixed-bucket histogram with Prometheus semantics (cumulative on export)."""
+
+    def __init__(self, buckets):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> list:
+        """[(le, count)] including +Inf."""
+        out, total = [], 0
+        for le, n in zip(self.buckets + (float("inf"),), self.counts):
+            total += n
+            out.append((le, total))
+        return out
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding quantile `q` (inf past the last bucket)."""
+        if not self.count:
+            return 0.0
+        target = q * self.count
+        for le, total in self.cumulative():
+            if total >= target:
+                return le
+        return float("inf")
+
+
+class RateMeter:
+    """Events per second over the last `window` whole seconds."""
+
+    def __init__(self, window: int = 10):
+        self.window = window
+        self._counts = [0] * window
+        self._second = 0
+
+    def add(self, n: int = 1, now: float = None):
+        second = int(time.monotonic() if now is None else now)
+        if second != self._second:
+            for s in range(self._second + 1, min(second, self._second + self.window) + 1):
+                self._counts[s % self.window] = 0
+            self._second = second
+        self._counts[second % self.window] += n
+
+    def rate(self, now: float = None) -> float:
+        second = int(time.monotonic() if now is None else now)
+        # Only complete seconds that are still inside the window count.
+        return sum(self._counts[s % self.window] for s in range(second - self.window + 1, second)
+                   if self._second - self.window < s <= self._second) / (self.window - 1)
+
+
+class IngestMetrics:
+    """
+    Counters and histograms updated on the ingest thread by MqttBuffer.
+    Single writer; readers (dashboard, scrape endpoint) only read numbers,
+    so no lock is taken on the hot path.
+    """
+
+    def __init__(self):
+        self.messages = 0
+        self.decode_failures = 0
+        self.duplicates = 0
+        self.message_rate = RateMeter()
+        self.verify_seconds = Histogram(VERIFY_BUCKETS)
+        self.latency_seconds = Histogram(LATENCY_BUCKETS)
+
+    def message(self):
+        self.messages += 1
+        self.message_rate.add()
+
+
+def collect(mqtt) -> dict:
+    """
+    Point-in-time view of an MqttBuffer's operational state: its ingest
+    metrics plus counters already kept by the partitions, chain verifiers
+    and store.
+    """
+    partitions = list(mqtt.partitions.values())
+    chains = [p.chain for p in partitions if p.chain is not None]
+    m = mqtt.metrics
+    return {
+        "connected": mqtt.connected,
+        "last_error": mqtt.last_error,
+        "messages": m.messages,
+        "message_rate": m.message_rate.rate(),
+        "decode_failures": m.decode_failures,
+        "duplicates": m.duplicates,
+        "samples": mqtt.total_packets,
+        "integrity_violations": mqtt.integrity_violations,
+        "dropped_packets": mqtt.dropped_packets,
+        "devices": len(partitions),
+        "buffered": sum(len(p.buffer) for p in partitions),
+        "capacity": mqtt.maxlen * len(partitions),
+        "evictions": sum(p.buffer.head for p in partitions),
+        "chain_missing": sum(c.missing for c in chains),
+        "chain_broken_links": sum(c.broken_links for c in chains),
+        "chain_pending": sum(len(c.pending) for c in chains),
+        "chain_rejected": sum(c.rejected for c in chains),
+        "store_dropped": mqtt.store.dropped if mqtt.store is not None else 0,
+        "verify_seconds": m.verify_seconds,
+        "latency_seconds": m.latency_seconds,
+    }
+
+
+_METRICS = (
+    # name, key, type, help
+    ("boiler_ingest_connected", "connected", "gauge", "1 while the broker connection is up."),
+    ("boiler_ingest_messages_total", "messages", "counter", "Transport messages received."),
+    ("boiler_ingest_messages_per_second", "message_rate", "gauge", "Messages received per second, last 10 s."),
+    ("boiler_ingest_decode_failures_total", "decode_failures", "counter", "Messages that could not be decoded or routed."),
+    ("boiler_ingest_duplicates_total", "duplicates", "counter", "QoS-1 redelivered samples dropped before routing."),
+    ("boiler_ingest_samples_total", "samples", "counter", "Samples routed into device partitions."),
+    ("boiler_ingest_integrity_violations_total", "integrity_violations", "counter", "Samples that failed verification."),
+    ("boiler_ingest_dropped_total", "dropped_packets", "counter", "Samples dropped because max_devices was reached."),
+    ("boiler_ingest_devices", "devices", "gauge", "Device partitions."),
+    ("boiler_buffer_samples", "buffered", "gauge", "Samples held across all partition ring buffers."),
+    ("boiler_buffer_capacity", "capacity", "gauge", "Ring buffer capacity across all partitions."),
+    ("boiler_buffer_evictions_total", "evictions", "counter", "Samples evicted from full ring buffers."),
+    ("boiler_chain_missing_total", "chain_missing", "counter", "Chain-mode packets a checkpoint covered but never arrived."),
+    ("boiler_chain_broken_links_total", "chain_broken_links", "counter", "Chain checkpoints that did not extend the previous root."),
+    ("boiler_chain_pending", "chain_pending", "gauge", "Chain-mode packets waiting for their checkpoint."),
+    ("boiler_chain_rejected_total", "chain_rejected", "counter", "Chain checkpoints rejected as malformed or out of range."),
+    ("boiler_store_dropped_total", "store_dropped", "counter", "Samples the persistence queue dropped."),
+)
+
+_HISTOGRAMS = (
+    ("boiler_ingest_verify_seconds", "verify_seconds", "Time to verify one message's samples."),
+    ("boiler_ingest_latency_seconds", "latency_seconds", "Receive time minus sample timestamp."),
+)
+
+
+def _format_value(value) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(int(value))
+
+
+def render(mqtt) -> str:
+    """The metrics in Prometheus text exposition format (version 0.0.4)."""
+    values = collect(mqtt)
+    lines = []
+    for name, key, kind, help_ in _METRICS:
+        lines += [f"# HELP {name} {help_}", f"# TYPE {name} {kind}", f"{name} {_format_value(values[key])}"]
+    for name, key, help_ in _HISTOGRAMS:
+        hist = values[key]
+        lines += [f"# HELP {name} {help_}", f"# TYPE {name} histogram"]
+        lines += [f'{name}_bucket{{le="{_format_value(le)}"}} {n}' for le, n in hist.cumulative()]
+        lines += [f"{name}_sum {hist.sum!r}", f"{name}_count {hist.count}"]
+    return "\n".join(lines) + "\n"
+
+
+class MetricsServer:
+    """
+    Serves render(mqtt) at http://host:port/metrics from a daemon thread.
+    Binds to localhost by default; set host to expose it further.
+    """
+
+    def __init__(self, mqtt, port: int, host: str = "127.0.0.1"):
+        self.mqtt = mqtt
+        self.host = host
+        self.port = port
+        self._server = None
+
+    def start(self):
+        mqtt = self.mqtt
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?", 1)[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = render(mqtt).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((self.host, self.port), Handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        threading.Thread(target=self._server.serve_forever, name="metrics-server", daemon=True).start()
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
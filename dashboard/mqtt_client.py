@@ -1,21 +1,167 @@
 import json
+import threading
 import time
 from collections import deque
+from datetime import datetime, timezone, timedelta
 
-import paho.mqtt.client as mqtt
+from integrity import verify_hash, verify_many, batch_hash, ChainVerifier
+import wire
+from metrics import IngestMetrics
+from ring_buffer import TelemetryRingBuffer
+from streaming_stats import WindowStats
+from transport import PahoTransport
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+# Samples per partition remembered for dropping QoS-1 redeliveries.
+RECENT_SAMPLES = 1024
+
+
+def parse_timestamp_ns(value):
+    """
+    Parses an ISO-8601 timestamp into integer nanoseconds since the epoch.
+    Naive timestamps are treated as UTC. Returns None if the value is unusable.
+    """
+    if not isinstance(value, str):
+        return None
+    try:
+        dt = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return (dt - _EPOCH) // timedelta(microseconds=1) * 1000
+
+
+def fleet_topic(topic: str) -> str:
+    """Wildcard covering `topic` itself and every per-device subtopic under it."""
+    return topic.rstrip("/") + "/#"
+
+
+class DevicePartition:
+    """
+    History, counters, latest raw packet and sliding-window statistics for
+    one device. The statistics are updated per packet here, so readers get
+    window KPIs without scanning the buffer; they read their values from the
+    buffer and cover at most the samples it still holds.
+    """
+
+    def __init__(self, device_id: str, capacity: int, stats_window_ns: int):
+        self.device_id = device_id
+        self.buffer = TelemetryRingBuffer(capacity)
+        self.stats = WindowStats(stats_window_ns, self.buffer)
+        self.latest = None
+        self.total_packets = 0
+        self.integrity_violations = 0
+        self.chain = None
+        self._stats_lock = threading.Lock()
+        self._recent = set()
+        self._recent_order = deque()
+
+    def seen(self, ts_ns: int, digest, integrity_ok: bool) -> bool:
+        """
+        True if the same sample was added among the last RECENT_SAMPLES, i.e.
+        this is a redelivery. Keys are hashed to one int to keep the memory
+        per partition small; a tampered copy differs in `integrity_ok`.
+        """
+        key = hash((ts_ns, digest, integrity_ok))
+        if key in self._recent:
+            return True
+        self._recent.add(key)
+        self._recent_order.append(key)
+        if len(self._recent_order) > RECENT_SAMPLES:
+            self._recent.discard(self._recent_order.popleft())
+        return False
+
+    def add(self, payload: dict, ts_ns: int):
+        self.latest = payload
+        with self._stats_lock:
+            self.stats.make_room()
+        self.buffer.append(
+            ts_ns,
+            payload.get("temperature"),
+            payload.get("pressure"),
+            payload.get("status"),
+            payload["integrity_ok"],
+            self.device_id,
+        )
+        with self._stats_lock:
+            self.stats.add_last()
+        self.total_packets += 1
+        if not payload["integrity_ok"]:
+            self.integrity_violations += 1
+
+    def window_stats(self, now_ns: int = None) -> dict:
+        """Mean/std/min/max per field over the stats window ending at `now_ns`."""
+        with self._stats_lock:
+            return self.stats.snapshot(now_ns)
 
 
 class MqttBuffer:
-    def __init__(self, broker: str, port: int, topic: str, qos: int = 1, maxlen: int = 5000):
+    """
+    Subscribes to `topic` and every subtopic under it and routes each packet
+    into a per-device partition keyed by its (hashed) device_id. Every
+    partition has its own ring buffer of `maxlen` samples, so a noisy
+    device only ever evicts its own history. At most `max_devices`
+    partitions are created; packets for further device ids are dropped and
+    counted in `dropped_packets`.
+
+    If a TelemetryStore is given, every routed sample is also queued for
+    persistence; the store's writer thread is started and stopped with the
+    MQTT loop.
+
+    `transport` defaults to paho against broker:port; pass a
+    LoopbackTransport to run the ingest path without a network broker.
+
+    Each partition keeps streaming statistics over the last
+    `stats_window_min` minutes of sample time.
+
+    Packets carrying a `seq` instead of a `hash` come from a publisher in
+    chain mode (see integrity.ChainSigner); they are held per device and
+    routed once their batch checkpoint has been verified.
+
+    Topics ending in `/bin` carry the fixed-layout binary encoding from
+    wire.py instead of JSON, for the device named in the topic.
+
+    A message may carry several samples: a JSON {"batch": [...]} object,
+    with a hash per sample or one `batch_hash` over all of them, or
+    back-to-back binary packets. Batches are unpacked into the same
+    per-sample path.
+
+    `version` increases with every routed packet; readers block on
+    wait_for_update() instead of polling the partitions.
+
+    `metrics` counts messages, decode failures, verification time and
+    receive latency on the ingest thread (see metrics.py).
+
+    QoS-1 redeliveries of a sample already routed to a partition (same
+    timestamp, hash and verdict) are dropped and counted in
+    `metrics.duplicates`, so live counts agree with the store.
+    """
+
+    def __init__(self, broker: str, port: int, topic: str, qos: int = 1, maxlen: int = 5000, max_devices: int = 1024,
+                 store=None, transport=None, stats_window_min: float = 30):
         self.broker = broker
         self.port = port
         self.topic = topic
         self.qos = qos
-        self.buffer = deque(maxlen=maxlen)
+        self.maxlen = maxlen
+        self.max_devices = max_devices
+        self.store = store
+        self.stats_window_ns = int(stats_window_min * 60 * 1_000_000_000)
+        self.partitions = {}
+        self.latest = None
+        self.total_packets = 0
+        self.integrity_violations = 0
+        self.dropped_packets = 0
         self.connected = False
         self.last_error = None
+        self.version = 0
+        self.metrics = IngestMetrics()
+        self._updated = threading.Condition()
 
-        self.client = mqtt.Client(client_id="streamlit_soc_dashboard", clean_session=True)
+        self.client = transport or PahoTransport(broker, port, client_id="streamlit_soc_dashboard")
         self.client.on_connect = self._on_connect
         self.client.on_message = self._on_message
         self.client.on_disconnect = self._on_disconnect
@@ -23,22 +169,173 @@ class MqttBuffer:
     def _on_connect(self, client, userdata, flags, rc):
         self.connected = (rc == 0)
         if self.connected:
-            client.subscribe(self.topic, qos=self.qos)
+            client.subscribe(fleet_topic(self.topic), qos=self.qos)
 
     def _on_disconnect(self, client, userdata, rc):
         self.connected = False
 
     def _on_message(self, client, userdata, msg):
+        self.metrics.message()
+        if msg.topic.endswith(wire.BINARY_SUFFIX):
+            self._on_binary(msg)
+            return
         try:
             payload = json.loads(msg.payload.decode("utf-8"))
+            if "checkpoint" in payload:
+                self._on_checkpoint(payload)
+                return
+            if "batch" in payload:
+                self._on_batch(payload)
+                return
+
             payload["_received_ts"] = time.time()
-            self.buffer.append(payload)
+            chained = "seq" in payload and "hash" not in payload
+            if not chained:
+                # Verify once here, against the publisher's original timestamp
+                # string, so the dashboard never has to re-hash the buffer.
+                t0 = time.perf_counter()
+                payload["integrity_ok"] = verify_hash(payload)
+                self.metrics.verify_seconds.observe(time.perf_counter() - t0)
+                self.latest = payload
+
+            ts_ns = parse_timestamp_ns(payload.get("timestamp"))
+            if ts_ns is None:
+                self.metrics.decode_failures += 1
+                self.last_error = f"invalid timestamp: {payload.get('timestamp')!r}"
+                return
+
+            partition = self._partition_for(str(payload.get("device_id")))
+            if partition is None:
+                self.dropped_packets += 1
+                return
+            if not chained:
+                self._route(partition, payload, ts_ns)
+                return
+
+            # Chain mode: held until the batch checkpoint verifies it.
+            if partition.chain is None:
+                partition.chain = ChainVerifier()
+            for released in partition.chain.add(int(payload["seq"]), msg.payload, payload, ts_ns):
+                self._route(partition, *released)
+        except Exception as e:
+            self.metrics.decode_failures += 1
+            self.last_error = str(e)
+
+    def _on_batch(self, message: dict):
+        samples = message["batch"]
+        received = time.time()
+        t0 = time.perf_counter()
+        if "batch_hash" in message:
+            ok = batch_hash(samples) == message["batch_hash"]
+            verdicts = [ok] * len(samples)
+        else:
+            verdicts = verify_many(samples).tolist()
+        self.metrics.verify_seconds.observe(time.perf_counter() - t0)
+
+        for payload, ok in zip(samples, verdicts):
+            payload["_received_ts"] = received
+            payload["integrity_ok"] = ok
+            ts_ns = parse_timestamp_ns(payload.get("timestamp"))
+            if ts_ns is None:
+                self.metrics.decode_failures += 1
+                self.last_error = f"invalid timestamp: {payload.get('timestamp')!r}"
+                continue
+            partition = self._partition_for(str(payload.get("device_id")))
+            if partition is None:
+                self.dropped_packets += 1
+                continue
+            self._route(partition, payload, ts_ns)
+
+    def _on_binary(self, msg):
+        try:
+            device_id = wire.device_from_topic(msg.topic)
+            received = time.time()
+            t0 = time.perf_counter()
+            payloads = wire.decode_many(device_id, msg.payload)
+            self.metrics.verify_seconds.observe(time.perf_counter() - t0)
+            # Only a message that decodes may claim a partition, so garbage on
+            # made-up topics cannot use up max_devices.
+            partition = self._partition_for(device_id)
+            if partition is None:
+                self.dropped_packets += len(payloads)
+                return
+            for payload in payloads:
+                payload["_received_ts"] = received
+                self._route(partition, payload, payload["ts_ns"])
         except Exception as e:
+            self.metrics.decode_failures += 1
             self.last_error = str(e)
 
+    def _on_checkpoint(self, payload: dict):
+        partition = self.partitions.get(str(payload.get("device_id")))
+        if partition is None or partition.chain is None:
+            return
+        t0 = time.perf_counter()
+        released = partition.chain.checkpoint(payload["checkpoint"])
+        self.metrics.verify_seconds.observe(time.perf_counter() - t0)
+        for sample in released:
+            self._route(partition, *sample)
+
+    def _route(self, partition: DevicePartition, payload: dict, ts_ns: int, integrity_ok: bool = None):
+        if integrity_ok is not None:
+            payload["integrity_ok"] = integrity_ok
+        if partition.seen(ts_ns, payload.get("hash"), payload["integrity_ok"]):
+            # QoS-1 redelivery; the store would ignore it too.
+            self.metrics.duplicates += 1
+            return
+        # Parsed once; the ISO string stays only because it is what was hashed.
+        payload["ts_ns"] = ts_ns
+        self.latest = payload
+        partition.add(payload, ts_ns)
+        received = payload.get("_received_ts")
+        if received is not None:
+            self.metrics.latency_seconds.observe(max(0.0, received - ts_ns / 1e9))
+        if self.store is not None:
+            self.store.add(
+                partition.device_id,
+                ts_ns,
+                payload.get("temperature"),
+                payload.get("pressure"),
+                payload.get("status"),
+                payload["integrity_ok"],
+                payload.get("hash"),
+            )
+
+        self.total_packets += 1
+        if not payload["integrity_ok"]:
+            self.integrity_violations += 1
+        with self._updated:
+            self.version += 1
+            self._updated.notify_all()
+
+    def wait_for_update(self, since: int, timeout: float = None) -> int:
+        """
+        Blocks until `version` moves past `since` or `timeout` seconds pass,
+        and returns the current version. Take `since` from `version` before
+        reading the partitions, so packets routed meanwhile are not missed.
+        """
+        with self._updated:
+            self._updated.wait_for(lambda: self.version > since, timeout)
+            return self.version
+
+    def _partition_for(self, device_id: str):
+        partition = self.partitions.get(device_id)
+        if partition is None and len(self.partitions) < self.max_devices:
+            partition = DevicePartition(device_id, self.maxlen, self.stats_window_ns)
+            self.partitions[device_id] = partition
+        return partition
+
+    def partition(self, device_id: str):
+        return self.partitions.get(device_id)
+
+    def device_ids(self) -> list:
+        return list(self.partitions)
+
     def start(self):
+        if self.store is not None:
+            self.store.start()
         try:
-            self.client.connect(self.broker, self.port, keepalive=60)
+            self.client.connect()
             self.client.loop_start()
         except Exception as e:
             self.last_error = str(e)
@@ -49,3 +346,5 @@ class MqttBuffer:
             self.client.disconnect()
         except Exception:
             pass
+        if self.store is not None:
+            self.store.stop()
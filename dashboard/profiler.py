@@ -0,0 +1,80 @@
+import cProfile
+import io
+import pstats
+import time
+from collections import deque
+
+import numpy as np
+import pandas as pd
+
+
+class RenderProfiler:
+    """
+    Wall time per dashboard stage over the last `ticks` redraws.
+
+    Call start_tick() when a redraw begins, lap(stage) at the end of each
+    stage (the time since the previous lap is charged to it) and end_tick()
+    when the redraw is done. Laps are cheap enough to leave in place when
+    nobody is looking at the numbers.
+
+    profile_next() arms cProfile for the following tick only; its stats
+    are kept as text in `last_profile` and, if `dump_path` is set, written
+    there in pstats format for snakeviz and friends.
+    """
+
+    def __init__(self, ticks: int = 200, dump_path: str = None):
+        self.history = {}
+        self.ticks = ticks
+        self.dump_path = dump_path
+        self.last_profile = None
+        self._tick = None
+        self._last = None
+        self._armed = False
+        self._profile = None
+
+    def start_tick(self):
+        self._tick = {}
+        self._last = time.perf_counter()
+        if self._armed:
+            self._armed = False
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+
+    def lap(self, stage: str):
+        if self._tick is None:
+            return
+        now = time.perf_counter()
+        self._tick[stage] = self._tick.get(stage, 0.0) + (now - self._last)
+        self._last = now
+
+    def end_tick(self):
+        if self._tick is None:
+            return
+        if self._profile is not None:
+            self._profile.disable()
+            out = io.StringIO()
+            pstats.Stats(self._profile, stream=out).sort_stats("cumulative").print_stats(40)
+            self.last_profile = out.getvalue()
+            if self.dump_path:
+                self._profile.dump_stats(self.dump_path)
+            self._profile = None
+        self._tick["total"] = sum(self._tick.values())
+        for stage, seconds in self._tick.items():
+            samples = self.history.get(stage)
+            if samples is None:
+                samples = self.history[stage] = deque(maxlen=self.ticks)
+            samples.append(seconds)
+        self._tick = None
+
+    def profile_next(self):
+        self._armed = True
+
+    def summary(self) -> pd.DataFrame:
+        """p50/p95/p99/last per stage in milliseconds, in stage order."""
+        rows = []
+        for stage, samples in self.history.items():
+            ms = np.asarray(samples) * 1e3
+            p50, p95, p99 = np.percentile(ms, [50, 95, 99])
+            rows.append({"Stage": stage, "p50 ms": p50, "p95 ms": p95, "p99 ms": p99,
+                         "Last ms": ms[-1], "Ticks": len(ms)})
+        return pd.DataFrame(rows, columns=["Stage", "p50 ms", "p95 ms", "p99 ms", "Last ms", "Ticks"])
@@ -0,0 +1,193 @@
+import math
+
+import numpy as np
+import pandas as pd
+
+
+STATUS_LABELS = ["OK", "Warning", "Critical", "Unknown"]
+STATUS_CODES = {label: code for code, label in enumerate(STATUS_LABELS)}
+UNKNOWN_STATUS = STATUS_CODES["Unknown"]
+
+COLUMN_DTYPES = {
+    "ts_ns": np.int64,
+    "temperature": np.float32,
+    "pressure": np.float32,
+    "status": np.uint8,
+    "integrity_ok": np.bool_,
+    "device": np.uint16,
+}
+
+
+def status_code(status) -> int:
+    return STATUS_CODES.get(status, UNKNOWN_STATUS)
+
+
+def as_float(value) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+class TelemetryRingBuffer:
+    """
+    Fixed-capacity columnar ring buffer for telemetry samples.
+
+    Every sample is written twice, at slot i and slot i + capacity, so any run
+    of up to `capacity` consecutive samples is one contiguous slice. Windows
+    are therefore handed to pandas and Plotly as views, never copies.
+
+    Samples are addressed by a monotonic sequence number: `head` is the seq of
+    the oldest retained sample and `seq` the seq the next sample will get.
+
+    Threading: one writer thread appends; any other thread reads through
+    read()/read_frame(), which copy just the requested samples without a
+    lock and drop any the writer overwrote meanwhile. columns()/to_frame()
+    views are for the writer's own thread (or buffers no other thread
+    writes): the writer reuses a slot once it has appended `capacity` more
+    samples, and a view over that slot changes with it.
+    """
+
+    def __init__(self, capacity: int, share_devices_with=None):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self.head = 0
+        self.seq = 0
+        if share_devices_with is not None:
+            # Same interning table, so raw device indexes can be copied across.
+            self.device_ids = share_devices_with.device_ids
+            self._device_index = share_devices_with._device_index
+        else:
+            self.device_ids = []
+            self._device_index = {}
+        self._cols = {name: np.zeros(2 * capacity, dtype=dtype) for name, dtype in COLUMN_DTYPES.items()}
+
+    def __len__(self):
+        return self.seq - self.head
+
+    @property
+    def nbytes(self) -> int:
+        return sum(col.nbytes for col in self._cols.values())
+
+    def intern_device(self, device_id) -> int:
+        idx = self._device_index.get(device_id)
+        if idx is None:
+            idx = len(self.device_ids)
+            self.device_ids.append(device_id)
+            self._device_index[device_id] = idx
+        return idx
+
+    def append(self, ts_ns: int, temperature, pressure, status, integrity_ok: bool, device_id):
+        values = (
+            ts_ns,
+            as_float(temperature),
+            as_float(pressure),
+            status_code(status),
+            bool(integrity_ok),
+            self.intern_device(device_id),
+        )
+        # Evict before reusing the slot, so read() can tell it was reused.
+        if self.seq - self.head >= self.capacity:
+            self.head = self.seq + 1 - self.capacity
+        lo = self.seq % self.capacity
+        hi = lo + self.capacity
+        for col, value in zip(self._cols.values(), values):
+            col[lo] = value
+            col[hi] = value
+        self.seq += 1
+
+    def extend(self, columns: dict):
+        """
+        Appends a batch of already-encoded samples, e.g. views returned by
+        `columns()` on a buffer that shares this one's device table.
+        """
+        n = len(columns["ts_ns"])
+        if n > self.capacity:
+            columns = {name: col[n - self.capacity:] for name, col in columns.items()}
+            self.seq += n - self.capacity
+            n = self.capacity
+        if n == 0:
+            return
+
+        if self.seq + n - self.head > self.capacity:
+            self.head = self.seq + n - self.capacity
+        lo = self.seq % self.capacity
+        first = min(n, self.capacity - lo)
+        rest = n - first
+        for name, col in self._cols.items():
+            src = columns[name]
+            col[lo:lo + first] = src[:first]
+            col[lo + self.capacity:lo + self.capacity + first] = src[:first]
+            if rest:
+                col[:rest] = src[first:]
+                col[self.capacity:self.capacity + rest] = src[first:]
+        self.seq += n
+
+    def truncate(self, end_seq: int):
+        """Drops every sample from `end_seq` onwards."""
+        self.seq = max(self.head, min(end_seq, self.seq))
+
+    def evict_before(self, ts_ns: int):
+        """Drops samples older than `ts_ns` from the front. Requires time-sorted contents."""
+        ts = self.columns()["ts_ns"]
+        self.head += int(np.searchsorted(ts, ts_ns, side="left"))
+
+    def _bounds(self, start_seq=None, end_seq=None):
+        start = self.head if start_seq is None else max(start_seq, self.head)
+        end = self.seq if end_seq is None else min(end_seq, self.seq)
+        end = max(start, end)
+        lo = start % self.capacity
+        return lo, lo + (end - start)
+
+    def read(self, start_seq=None, end_seq=None):
+        """
+        Copies the retained samples in [start_seq, end_seq) and returns
+        (first_seq, columns). Safe against one concurrent appender: the
+        writer moves `head` past a slot before reusing it, so samples that
+        fall below `head` while being copied are dropped from the front.
+        `first_seq` can therefore be later than asked for; every returned
+        sample is intact and in seq order.
+        """
+        end = self.seq if end_seq is None else min(end_seq, self.seq)
+        start = min(max(self.head, 0 if start_seq is None else start_seq), end)
+        lo = start % self.capacity
+        cols = {name: col[lo:lo + (end - start)].copy() for name, col in self._cols.items()}
+
+        safe = self.head
+        if start < safe:
+            drop = min(safe - start, end - start)
+            cols = {name: col[drop:] for name, col in cols.items()}
+            start += drop
+        return start, cols
+
+    def read_frame(self, start_seq=None, end_seq=None) -> pd.DataFrame:
+        """to_frame() over a read() copy, for threads other than the writer."""
+        return self._frame(self.read(start_seq, end_seq)[1])
+
+    def columns(self, start_seq=None, end_seq=None) -> dict:
+        """Zero-copy views of every column for the retained samples in [start_seq, end_seq)."""
+        lo, hi = self._bounds(start_seq, end_seq)
+        return {name: col[lo:hi] for name, col in self._cols.items()}
+
+    def to_frame(self, start_seq=None, end_seq=None) -> pd.DataFrame:
+        """
+        DataFrame over the retained samples in arrival order.
+        Numeric columns share memory with the buffer; `timestamp` is a naive
+        UTC datetime64 view of `ts_ns`.
+        """
+        return self._frame(self.columns(start_seq, end_seq))
+
+    def _frame(self, cols: dict) -> pd.DataFrame:
+        return pd.DataFrame(
+            {
+                "timestamp": cols["ts_ns"].view("datetime64[ns]"),
+                "ts_ns": cols["ts_ns"],
+                "temperature": cols["temperature"],
+                "pressure": cols["pressure"],
+                "status": pd.Categorical.from_codes(cols["status"].astype(np.int8), categories=STATUS_LABELS),
+                "integrity_ok": cols["integrity_ok"],
+                "device_id": pd.Categorical.from_codes(cols["device"].astype(np.int32), categories=self.device_ids),
+            },
+            copy=False,
+        )
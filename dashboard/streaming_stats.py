@@ -0,0 +1,160 @@
+import math
+from array import array
+
+import numpy as np
+
+
+class RollingStats:
+    """
+    Mean, sample standard deviation, min and max of one ring buffer column
+    over a run of consecutive seqs, in O(1) amortised per sample.
+
+    push(seq) takes in the sample at `seq` and pop(seq) drops the oldest
+    one, which must be `seq`. Values are read from the buffer's column, so
+    nothing is copied; a sample must be popped before the buffer reuses its
+    slot. Mean and variance are kept with Welford's recurrence, run
+    backwards on pop; min and max come from monotonic queues of (slot,
+    value) in fixed-size typed arrays. NaN values are ignored.
+    """
+
+    def __init__(self, column: np.ndarray, capacity: int):
+        self.column = column
+        self.capacity = capacity
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        # Monotonic queues, front at lo; lo and hi count up and wrap modulo
+        # capacity. array, not NumPy: they are indexed one element at a time.
+        self._min, self._min_values = array("i", bytes(4 * capacity)), array("d", bytes(8 * capacity))
+        self._max, self._max_values = array("i", bytes(4 * capacity)), array("d", bytes(8 * capacity))
+        self._min_lo = self._min_hi = 0
+        self._max_lo = self._max_hi = 0
+
+    def push(self, seq: int):
+        cap = self.capacity
+        slot = seq % cap
+        value = float(self.column[slot])
+        if value != value:
+            return
+
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+
+        values, lo, hi = self._min_values, self._min_lo, self._min_hi
+        while hi > lo and values[(hi - 1) % cap] >= value:
+            hi -= 1
+        self._min[hi % cap] = slot
+        values[hi % cap] = value
+        self._min_hi = hi + 1
+
+        values, lo, hi = self._max_values, self._max_lo, self._max_hi
+        while hi > lo and values[(hi - 1) % cap] <= value:
+            hi -= 1
+        self._max[hi % cap] = slot
+        values[hi % cap] = value
+        self._max_hi = hi + 1
+
+    def pop(self, seq: int):
+        cap = self.capacity
+        slot = seq % cap
+        value = float(self.column[slot])
+        if value != value:
+            return
+
+        self.count -= 1
+        if self.count == 0:
+            self.mean = self._m2 = 0.0
+        else:
+            delta = value - self.mean
+            self.mean -= delta / self.count
+            self._m2 = max(self._m2 - delta * (value - self.mean), 0.0)
+        if self._min_hi > self._min_lo and self._min[self._min_lo % cap] == slot:
+            self._min_lo += 1
+        if self._max_hi > self._max_lo and self._max[self._max_lo % cap] == slot:
+            self._max_lo += 1
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self._m2 / (self.count - 1)) if self.count > 1 else math.nan
+
+    @property
+    def min(self) -> float:
+        if self._min_hi == self._min_lo:
+            return math.nan
+        return self._min_values[self._min_lo % self.capacity]
+
+    @property
+    def max(self) -> float:
+        if self._max_hi == self._max_lo:
+            return math.nan
+        return self._max_values[self._max_lo % self.capacity]
+
+    def snapshot(self) -> dict:
+        return {
+            "count": self.count,
+            "mean": self.mean if self.count else math.nan,
+            "std": self.std,
+            "min": self.min,
+            "max": self.max,
+        }
+
+
+class WindowStats:
+    """
+    RollingStats for each of `fields` over the samples appended to a
+    TelemetryRingBuffer in the last `window_ns` of sample time, expired in
+    arrival order.
+
+    The values stay in the buffer: call make_room() before each append and
+    add_last() after it. make_room() expires the sample the append is about
+    to overwrite, so the statistics never cover more than the buffer holds.
+    """
+
+    def __init__(self, window_ns: int, buffer, fields=("temperature", "pressure")):
+        self.window_ns = window_ns
+        self.buffer = buffer
+        self.capacity = buffer.capacity
+        # Samples [head, tail) are in the statistics.
+        self.head = self.tail = buffer.seq
+        self._ts = buffer._cols["ts_ns"]
+        self.fields = {name: RollingStats(buffer._cols[name], buffer.capacity) for name in fields}
+
+    def make_room(self):
+        """Expires the sample the buffer's next append will overwrite."""
+        end_seq = self.buffer.seq + 1 - self.capacity
+        if end_seq > self.head:
+            self._expire_to(end_seq)
+
+    def add_last(self):
+        """Takes in the sample the buffer appended last."""
+        seq = self.buffer.seq - 1
+        for stats in self.fields.values():
+            stats.push(seq)
+        self.tail = seq + 1
+        self.expire(int(self._ts[seq % self.capacity]) - self.window_ns)
+
+    def expire(self, cutoff_ns: int):
+        """Drops samples stamped before `cutoff_ns` from the front of the window."""
+        ts, cap = self._ts, self.capacity
+        seq = self.head
+        while seq < self.tail and ts[seq % cap] < cutoff_ns:
+            seq += 1
+        self._expire_to(seq)
+
+    def _expire_to(self, end_seq: int):
+        end_seq = min(end_seq, self.tail)
+        if end_seq <= self.head:
+            return
+        for stats in self.fields.values():
+            pop = stats.pop
+            for seq in range(self.head, end_seq):
+                pop(seq)
+        self.head = end_seq
+
+    def snapshot(self, now_ns: int = None) -> dict:
+        """Per-field stats; with `now_ns`, samples older than the window are expired first."""
+        if now_ns is not None:
+            self.expire(now_ns - self.window_ns)
+        return {name: stats.snapshot() for name, stats in self.fields.items()}
@@ -0,0 +1,244 @@
+import queue
+import sqlite3
+import threading
+import time
+
+import numpy as np
+
+from ring_buffer import status_code, as_float
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS telemetry (
+    device_id TEXT NOT NULL,
+    ts_ns INTEGER NOT NULL,
+    temperature REAL,
+    pressure REAL,
+    status INTEGER NOT NULL,
+    integrity_ok INTEGER NOT NULL,
+    hash TEXT,
+    PRIMARY KEY (device_id, ts_ns)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS telemetry_rollup (
+    device_id TEXT NOT NULL,
+    bucket_ns INTEGER NOT NULL,
+    first_ts_ns INTEGER NOT NULL,
+    temperature_sum REAL,
+    temperature_count INTEGER NOT NULL,
+    temperature_min REAL,
+    temperature_max REAL,
+    pressure_sum REAL,
+    pressure_count INTEGER NOT NULL,
+    pressure_min REAL,
+    pressure_max REAL,
+    status INTEGER NOT NULL,
+    count INTEGER NOT NULL,
+    integrity_violations INTEGER NOT NULL,
+    PRIMARY KEY (device_id, bucket_ns)
+) WITHOUT ROWID;
+"""
+
+# Rollup buckets are recomputed from the raw rows they cover, so duplicate
+# inserts ignored by the primary key are never double counted.
+ROLLUP_NS = 60 * 1_000_000_000
+
+ROLLUP_REFRESH = """
+INSERT OR REPLACE INTO telemetry_rollup
+SELECT device_id, ts_ns / :rollup * :rollup, MIN(ts_ns),
+       SUM(temperature), COUNT(temperature), MIN(temperature), MAX(temperature),
+       SUM(pressure), COUNT(pressure), MIN(pressure), MAX(pressure),
+       MAX(status), COUNT(*), COUNT(*) - SUM(integrity_ok)
+FROM telemetry
+WHERE device_id = :device_id AND ts_ns >= :start AND ts_ns < :end
+GROUP BY 2
+"""
+
+INSERT = "INSERT OR IGNORE INTO telemetry VALUES (?, ?, ?, ?, ?, ?, ?)"
+
+RANGE_QUERY = """
+SELECT ts_ns, temperature, pressure, status, integrity_ok
+FROM telemetry
+WHERE device_id = ? AND ts_ns >= ? AND ts_ns < ?
+ORDER BY ts_ns
+"""
+
+BUCKET_QUERY = """
+SELECT MIN(ts_ns),
+       AVG(temperature), MIN(temperature), MAX(temperature),
+       AVG(pressure), MIN(pressure), MAX(pressure),
+       MAX(status), COUNT(*), COUNT(*) - SUM(integrity_ok)
+FROM telemetry
+WHERE device_id = ? AND ts_ns >= ? AND ts_ns < ?
+GROUP BY ts_ns / ?
+ORDER BY 1
+"""
+
+ROLLUP_BUCKET_QUERY = """
+SELECT MIN(first_ts_ns),
+       SUM(temperature_sum) / SUM(temperature_count), MIN(temperature_min), MAX(temperature_max),
+       SUM(pressure_sum) / SUM(pressure_count), MIN(pressure_min), MAX(pressure_max),
+       MAX(status), SUM(count), SUM(integrity_violations)
+FROM telemetry_rollup
+WHERE device_id = ? AND bucket_ns >= ? AND bucket_ns < ?
+GROUP BY bucket_ns / ?
+ORDER BY 1
+"""
+
+BUCKET_COLUMNS = {
+    "ts_ns": np.int64,
+    "temperature": np.float64,
+    "temperature_min": np.float64,
+    "temperature_max": np.float64,
+    "pressure": np.float64,
+    "pressure_min": np.float64,
+    "pressure_max": np.float64,
+    "status": np.uint8,
+    "count": np.int64,
+    "integrity_violations": np.int64,
+}
+
+
+class TelemetryStore:
+    """
+    Append-only SQLite store for ingested telemetry, clustered on
+    (device_id, ts_ns) so time-range queries per device are index scans.
+
+    add() only enqueues, so it is safe and cheap to call from the MQTT
+    network thread; a background writer commits queued rows in batches of up
+    to `batch_size`, and at the latest `flush_interval` seconds after the
+    first row of a batch was taken off the queue. QoS-1 redeliveries of
+    the same (device_id, timestamp) are ignored.
+
+    The writer also maintains per-minute aggregates in telemetry_rollup, so
+    bucketed queries over long windows read one row per device-minute
+    instead of one per sample.
+    """
+
+    def __init__(self, path: str, batch_size: int = 1000, flush_interval: float = 0.5, max_queue: int = 100_000):
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.dropped = 0
+        self.last_error = None
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._local = threading.local()
+        self._writer = None
+
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _reader(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = self._connect()
+        return conn
+
+    def start(self):
+        if self._writer is None:
+            self._writer = threading.Thread(target=self._run, name="telemetry-store-writer", daemon=True)
+            self._writer.start()
+
+    def stop(self):
+        if self._writer is not None:
+            self._queue.put(None)
+            self._writer.join()
+            self._writer = None
+
+    def flush(self):
+        """Blocks until every row queued so far is committed."""
+        self._queue.join()
+
+    def add(self, device_id: str, ts_ns: int, temperature, pressure, status, integrity_ok: bool, hash_=None):
+        row = (device_id, ts_ns, as_float(temperature), as_float(pressure),
+               status_code(status), int(bool(integrity_ok)), hash_)
+        try:
+            self._queue.put_nowait(row)
+        except queue.Full:
+            self.dropped += 1
+
+    def _run(self):
+        conn = self._connect()
+        stopping = False
+        while not stopping:
+            try:
+                item = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                continue
+
+            batch = []
+            deadline = time.monotonic() + self.flush_interval
+            while True:
+                if item is None:
+                    stopping = True
+                else:
+                    batch.append(item)
+                if stopping or len(batch) >= self.batch_size:
+                    break
+                remaining = deadline - time.monotonic()
+                try:
+                    item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+                except queue.Empty:
+                    break
+
+            try:
+                with conn:
+                    conn.executemany(INSERT, batch)
+                    self._refresh_rollup(conn, batch)
+            except Exception as e:
+                self.last_error = str(e)
+            finally:
+                for _ in range(len(batch) + stopping):
+                    self._queue.task_done()
+        conn.close()
+
+    @staticmethod
+    def _refresh_rollup(conn, batch):
+        # Only the minutes the batch touched; a stray timestamp far from the
+        # rest must not rescan everything in between.
+        buckets = {(row[0], row[1] // ROLLUP_NS * ROLLUP_NS) for row in batch}
+        conn.executemany(ROLLUP_REFRESH, (
+            {"rollup": ROLLUP_NS, "device_id": device_id, "start": start, "end": start + ROLLUP_NS}
+            for device_id, start in buckets
+        ))
+
+    def query(self, device_id: str, start_ns: int, end_ns: int) -> dict:
+        """Every stored sample for `device_id` in [start_ns, end_ns), as NumPy columns."""
+        rows = self._reader().execute(RANGE_QUERY, (device_id, start_ns, end_ns)).fetchall()
+        ts, temperature, pressure, status, integrity_ok = zip(*rows) if rows else ((),) * 5
+        return {
+            "ts_ns": np.array(ts, dtype=np.int64),
+            "temperature": np.array(temperature, dtype=np.float32),
+            "pressure": np.array(pressure, dtype=np.float32),
+            "status": np.array(status, dtype=np.uint8),
+            "integrity_ok": np.array(integrity_ok, dtype=bool),
+        }
+
+    def query_buckets(self, device_id: str, start_ns: int, end_ns: int, bucket_ns: int) -> dict:
+        """
+        Per-bucket aggregates (mean/min/max, worst status, packet and violation
+        counts) for windows too long to plot sample by sample. `ts_ns` is the
+        first timestamp in each bucket.
+
+        Buckets of a minute or more are served from the rollup table, with
+        the window widened to whole minutes.
+        """
+        if bucket_ns >= ROLLUP_NS:
+            start = start_ns // ROLLUP_NS * ROLLUP_NS
+            rows = self._reader().execute(ROLLUP_BUCKET_QUERY, (device_id, start, end_ns, bucket_ns)).fetchall()
+        else:
+            rows = self._reader().execute(BUCKET_QUERY, (device_id, start_ns, end_ns, bucket_ns)).fetchall()
+        columns = list(zip(*rows)) if rows else [()] * len(BUCKET_COLUMNS)
+        return {
+            name: np.array(values, dtype=dtype)
+            for (name, dtype), values in zip(BUCKET_COLUMNS.items(), columns)
+        }
+
+    def device_ids(self) -> list:
+        return [row[0] for row in self._reader().execute("SELECT DISTINCT device_id FROM telemetry")]
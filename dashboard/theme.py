@@ -0,0 +1,786 @@
+import re
+from functools import lru_cache
+from types import MappingProxyType
+
+
+# ---------- Enhanced Theme Colors ----------
+@lru_cache(maxsize=None)
+def get_theme_colors():
+    """
+    The theme palette, built once per process. Read-only, since every caller
+    shares the same mapping; call get_theme_colors.cache_clear() after
+    changing the theme.
+    """
+    return MappingProxyType({
+        # Backgrounds
+        "bg": "#0a0e1a",
+        "card_bg": "#111827",
+        "card_bg_elevated": "#1a2332",
+        "sidebar_bg": "#0f1419",
+        
+        # Borders
+        "border": "#1e293b",
+        "border_hover": "#334155",
+        "border_accent": "#3b82f6",
+        
+        # Text - Enhanced visibility
+        "text_primary": "#ffffff",
+        "text_secondary": "#e2e8f0",
+        "text_muted": "#94a3b8",
+        "text_dim": "#64748b",
+        
+        # Accents
+        "accent_blue": "#3b82f6",
+        "accent_cyan": "#06b6d4",
+        "accent_purple": "#8b5cf6",
+        "accent_green": "#10b981",
+        "accent_emerald": "#059669",
+        "accent_red": "#ef4444",
+        "accent_orange": "#f97316",
+        "accent_yellow": "#f59e0b",
+        "accent_amber": "#fbbf24",
+        
+        # Status colors
+        "success": "#22c55e",
+        "warning": "#f59e0b",
+        "danger": "#ef4444",
+        "info": "#3b82f6",
+        
+        # Grid and charts
+        "grid": "#1e293b",
+        "chart_bg": "rgba(0,0,0,0)",
+        
+        # Gradients
+        "gradient_blue": "linear-gradient(135deg, #3b82f6 0%, #1d4ed8 100%)",
+        "gradient_purple": "linear-gradient(135deg, #8b5cf6 0%, #6d28d9 100%)",
+        "gradient_red": "linear-gradient(135deg, #ef4444 0%, #dc2626 100%)",
+        "gradient_green": "linear-gradient(135deg, #10b981 0%, #059669 100%)",
+    })
+
+# ---------- Professional SOC Styling ----------
+def get_custom_css():
+    """
+    The dashboard stylesheet as a <style> block, minified. Rendered once per
+    theme palette and reused on every rerun.
+    """
+    return _render_css(tuple(get_theme_colors().items()))
+
+
+def _minify_css(css):
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    return re.sub(r"\s*([{};,>])\s*|(:)\s+", r"\1\2", css).replace(";}", "}").strip()
+
+
+@lru_cache(maxsize=4)
+def _render_css(palette):
+    colors = dict(palette)
+
+    return _minify_css(f"""
+<style>
+@import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700;800;900&display=swap');
+@import url('https://fonts.googleapis.com/css2?family=JetBrains+Mono:wght@300;400;500;600;700&display=swap');
+
+/* ========== GLOBAL RESET ========== */
+* {{
+    font-family: 'Inter', -apple-system, BlinkMacSystemFont, sans-serif !important;
+}}
+
+.stApp {{
+    background: {colors['bg']};
+    background-image: 
+        radial-gradient(at 0% 0%, rgba(59, 130, 246, 0.05) 0px, transparent 50%),
+        radial-gradient(at 100% 0%, rgba(139, 92, 246, 0.05) 0px, transparent 50%),
+        radial-gradient(at 100% 100%, rgba(59, 130, 246, 0.03) 0px, transparent 50%);
+}}
+
+.block-container {{
+    padding-top: 2rem;
+    padding-bottom: 2rem;
+    max-width: 1600px;
+}}
+
+/* ========== TYPOGRAPHY ========== */
+h1, h2, h3, h4, h5, h6 {{
+    font-family: 'Inter', sans-serif !important;
+    font-weight: 700 !important;
+    color: {colors['text_primary']} !important;
+    letter-spacing: -0.025em !important;
+    line-height: 1.2 !important;
+}}
+
+h1 {{ 
+    font-size: 2rem !important; 
+    margin-bottom: 0.5rem !important;
+}}
+
+p, span, div {{
+    font-family: 'Inter', sans-serif !important;
+}}
+
+/* SOC Header */
+.soc-header {{
+    background: {colors['card_bg']};
+    border: 1px solid {colors['border']};
+    border-radius: 12px;
+    padding: 1.5rem 2rem;
+    margin-bottom: 2rem;
+    display: flex;
+    align-items: center;
+    justify-content: space-between;
+    box-shadow: 0 4px 6px -1px rgba(0, 0, 0, 0.3), 0 2px 4px -1px rgba(0, 0, 0, 0.2);
+    position: relative;
+    overflow: hidden;
+}}
+
+.soc-header::before {{
+    content: '';
+    position: absolute;
+    top: 0;
+    left: 0;
+    right: 0;
+    height: 3px;
+    background: {colors['gradient_blue']};
+}}
+
+.soc-title {{
+    font-family: 'Inter', sans-serif !important;
+    font-size: 1.75rem !important;
+    font-weight: 900 !important;
+    color: {colors['text_primary']} !important;
+    letter-spacing: 0.05em !important;
+    margin: 0 !important;
+    text-transform: uppercase !important;
+}}
+
+.soc-subtitle {{
+    font-family: 'JetBrains Mono', monospace !important;
+    font-size: 0.7rem !important;
+    color: {colors['text_secondary']} !important;
+    font-weight: 500 !important;
+    letter-spacing: 0.1em !important;
+    text-transform: uppercase !important;
+    margin-top: 0.35rem !important;
+}}
+
+.soc-status {{
+    display: flex;
+    align-items: center;
+    gap: 1rem;
+}}
+
+.status-indicator {{
+    display: flex;
+    align-items: center;
+    gap: 0.5rem;
+    padding: 0.5rem 1rem;
+    background: rgba(16, 185, 129, 0.1);
+    border: 1px solid {colors['accent_green']};
+    border-radius: 6px;
+    font-size: 0.75rem;
+    font-weight: 600;
+    color: {colors['accent_green']};
+    letter-spacing: 0.05em;
+}}
+
+.status-dot {{
+    width: 8px;
+    height: 8px;
+    background: {colors['accent_green']};
+    border-radius: 50%;
+    animation: pulse 2s ease-in-out infinite;
+}}
+
+@keyframes pulse {{
+    0%, 100% {{ 
+        opacity: 1;
+        box-shadow: 0 0 0 0 rgba(16, 185, 129, 0.7);
+    }}
+    50% {{ 
+        opacity: 0.7;
+        box-shadow: 0 0 0 8px rgba(16, 185, 129, 0);
+    }}
+}}
+
+/* ========== METRIC CARDS ========== */
+div[data-testid="stMetric"] {{
+    background: {colors['card_bg']};
+    border: 1px solid {colors['border']};
+    border-radius: 10px;
+    padding: 1.5rem 1.25rem !important;
+    transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
+    min-height: 120px;
+    display: flex;
+    flex-direction: column;
+    justify-content: center;
+    position: relative;
+    overflow: hidden;
+    box-shadow: 0 1px 3px 0 rgba(0, 0, 0, 0.3);
+}}
+
+div[data-testid="stMetric"]::before {{
+    content: '';
+    position: absolute;
+    top: 0;
+    left: 0;
+    right: 0;
+    height: 3px;
+    background: {colors['border']};
+    transition: all 0.3s ease;
+}}
+
+div[data-testid="stMetric"]:hover {{
+    border-color: {colors['border_accent']};
+    transform: translateY(-4px);
+    box-shadow: 0 10px 20px -5px rgba(59, 130, 246, 0.3), 0 4px 6px -2px rgba(0, 0, 0, 0.3);
+}}
+
+div[data-testid="stMetric"]:hover::before {{
+    background: {colors['gradient_blue']};
+}}
+
+/* Metric Label */
+div[data-testid="stMetricLabel"] {{
+    font-family: 'Inter', sans-serif !important;
+    font-size: 0.7rem !important;
+    font-weight: 700 !important;
+    color: {colors['text_secondary']} !important;
+    text-transform: uppercase !important;
+    letter-spacing: 0.12em !important;
+    margin-bottom: 0.75rem !important;
+    line-height: 1.3 !important;
+}}
+
+div[data-testid="stMetricLabel"] * {{
+    font-family: 'Inter', sans-serif !important;
+    color: {colors['text_secondary']} !important;
+    font-size: 0.7rem !important;
+    font-weight: 700 !important;
+    text-transform: uppercase !important;
+    letter-spacing: 0.12em !important;
+}}
+
+/* Metric Value */
+div[data-testid="stMetricValue"] {{
+    font-family: 'Inter', sans-serif !important;
+    font-size: 2.5rem !important;
+    font-weight: 900 !important;
+    color: {colors['text_primary']} !important;
+    letter-spacing: -0.02em !important;
+    line-height: 1 !important;
+}}
+
+div[data-testid="stMetricValue"] * {{
+    font-family: 'Inter', sans-serif !important;
+    font-size: 2.5rem !important;
+    font-weight: 900 !important;
+}}
+
+/* Metric Delta */
+div[data-testid="stMetricDelta"] {{
+    font-family: 'JetBrains Mono', monospace !important;
+    font-size: 0.75rem !important;
+    margin-top: 0.5rem !important;
+}}
+
+/* Risk-based Metric Colors */
+.metric-normal div[data-testid="stMetric"]::before {{
+    background: {colors['gradient_green']};
+}}
+
+.metric-normal div[data-testid="stMetricValue"],
+.metric-normal div[data-testid="stMetricValue"] * {{
+    color: {colors['text_primary']} !important;
+}}
+
+.metric-warning div[data-testid="stMetric"]::before {{
+    background: {colors['gradient_purple']};
+}}
+
+.metric-warning div[data-testid="stMetricValue"],
+.metric-warning div[data-testid="stMetricValue"] * {{
+    color: {colors['accent_amber']} !important;
+}}
+
+.metric-critical div[data-testid="stMetric"]::before {{
+    background: {colors['gradient_red']};
+    animation: criticalPulse 2s ease-in-out infinite;
+}}
+
+.metric-critical div[data-testid="stMetricValue"],
+.metric-critical div[data-testid="stMetricValue"] * {{
+    color: {colors['accent_red']} !important;
+}}
+
+@keyframes criticalPulse {{
+    0%, 100% {{ opacity: 1; }}
+    50% {{ opacity: 0.6; }}
+}}
+
+/* ========== STATUS BADGES ========== */
+.badge-container {{
+    display: flex;
+    align-items: center;
+    justify-content: center;
+    height: 100%;
+    min-height: 120px;
+}}
+
+.badge {{
+    display: inline-flex;
+    align-items: center;
+    justify-content: center;
+    gap: 0.5rem;
+    padding: 1.25rem 2rem;
+    border-radius: 10px;
+    font-family: 'Inter', sans-serif !important;
+    font-size: 0.85rem !important;
+    font-weight: 800 !important;
+    letter-spacing: 0.15em !important;
+    text-transform: uppercase !important;
+    min-height: 70px;
+    min-width: 180px;
+    cursor: default;
+    border: 2px solid transparent;
+    transition: all 0.3s ease;
+    position: relative;
+    overflow: hidden;
+}}
+
+.badge::before {{
+    content: '';
+    position: absolute;
+    top: 50%;
+    left: 50%;
+    width: 0;
+    height: 0;
+    border-radius: 50%;
+    background: rgba(255, 255, 255, 0.1);
+    transform: translate(-50%, -50%);
+    transition: width 0.6s, height 0.6s;
+}}
+
+.badge:hover::before {{
+    width: 300px;
+    height: 300px;
+}}
+
+/* Badge Icons */
+.badge-icon {{
+    font-size: 1.1rem;
+    font-weight: 400;
+}}
+
+/* OK Badge */
+.badge-ok {{ 
+    background: linear-gradient(135deg, rgba(16, 185, 129, 0.15) 0%, rgba(5, 150, 105, 0.15) 100%);
+    color: {colors['accent_green']} !important;
+    border-color: {colors['accent_green']};
+    box-shadow: 0 0 20px rgba(16, 185, 129, 0.2);
+}}
+
+/* WARNING Badge */
+.badge-warning {{ 
+    background: linear-gradient(135deg, rgba(245, 158, 11, 0.15) 0%, rgba(217, 119, 6, 0.15) 100%);
+    color: {colors['accent_amber']} !important;
+    border-color: {colors['accent_yellow']};
+    box-shadow: 0 0 20px rgba(245, 158, 11, 0.2);
+}}
+
+/* CRITICAL Badge */
+.badge-critical {{ 
+    background: linear-gradient(135deg, rgba(239, 68, 68, 0.2) 0%, rgba(220, 38, 38, 0.2) 100%);
+    color: {colors['accent_red']} !important;
+    border: 2px solid {colors['accent_red']};
+    animation: criticalGlow 2s ease-in-out infinite;
+    box-shadow: 0 0 30px rgba(239, 68, 68, 0.4);
+}}
+
+@keyframes criticalGlow {{
+    0%, 100% {{ 
+        box-shadow: 0 0 20px rgba(239, 68, 68, 0.4), 0 0 40px rgba(239, 68, 68, 0.2);
+        border-color: {colors['accent_red']};
+    }}
+    50% {{ 
+        box-shadow: 0 0 30px rgba(239, 68, 68, 0.6), 0 0 60px rgba(239, 68, 68, 0.3);
+        border-color: #ff6b6b;
+    }}
+}}
+
+/* VERIFIED Badge */
+.badge-secure {{ 
+    background: linear-gradient(135deg, rgba(16, 185, 129, 0.15) 0%, rgba(5, 150, 105, 0.15) 100%);
+    color: {colors['accent_green']} !important;
+    border: 2px solid {colors['accent_green']};
+    box-shadow: 0 0 20px rgba(16, 185, 129, 0.3);
+}}
+
+/* TAMPERED Badge */
+.badge-tampered {{ 
+    background: linear-gradient(135deg, rgba(239, 68, 68, 0.2) 0%, rgba(220, 38, 38, 0.2) 100%);
+    color: {colors['accent_red']} !important;
+    border: 2px solid {colors['accent_red']};
+    animation: alarmPulse 1s ease-in-out infinite;
+    box-shadow: 0 0 30px rgba(239, 68, 68, 0.5);
+}}
+
+@keyframes alarmPulse {{
+    0%, 100% {{ 
+        box-shadow: 0 0 20px rgba(239, 68, 68, 0.5), 0 0 40px rgba(239, 68, 68, 0.3);
+        border-color: {colors['accent_red']};
+    }}
+    50% {{ 
+        box-shadow: 0 0 40px rgba(239, 68, 68, 0.8), 0 0 80px rgba(239, 68, 68, 0.4);
+        border-color: #ff6b6b;
+    }}
+}}
+
+/* ========== ALERT BOX ========== */
+.alert-box {{
+    background: linear-gradient(135deg, rgba(239, 68, 68, 0.1) 0%, rgba(220, 38, 38, 0.1) 100%);
+    border: 1px solid {colors['accent_red']};
+    border-left: 4px solid {colors['accent_red']};
+    border-radius: 10px;
+    padding: 1.25rem 1.5rem;
+    margin: 1.5rem 0;
+    color: {colors['text_primary']} !important;
+    font-family: 'Inter', sans-serif !important;
+    font-size: 0.9rem !important;
+    font-weight: 500 !important;
+    display: flex;
+    align-items: center;
+    gap: 1rem;
+    box-shadow: 0 0 30px rgba(239, 68, 68, 0.2);
+    animation: alertPulse 2s ease-in-out infinite;
+}}
+
+@keyframes alertPulse {{
+    0%, 100% {{ 
+        box-shadow: 0 0 20px rgba(239, 68, 68, 0.2);
+    }}
+    50% {{ 
+        box-shadow: 0 0 40px rgba(239, 68, 68, 0.4);
+    }}
+}}
+
+.alert-icon {{
+    font-size: 1.5rem;
+    min-width: 24px;
+}}
+
+.alert-box strong {{
+    color: {colors['accent_red']} !important;
+    font-weight: 700 !important;
+    font-family: 'Inter', sans-serif !important;
+}}
+
+/* ========== CHARTS ========== */
+[data-testid="stPlotlyChart"] {{
+    background: {colors['card_bg']};
+    border: 1px solid {colors['border']};
+    border-radius: 10px;
+    padding: 0.75rem;
+    margin-bottom: 1rem;
+    box-shadow: 0 1px 3px 0 rgba(0, 0, 0, 0.3);
+    transition: all 0.3s ease;
+}}
+
+[data-testid="stPlotlyChart"]:hover {{
+    border-color: {colors['border_hover']};
+    box-shadow: 0 4px 12px rgba(0, 0, 0, 0.4);
+}}
+
+/* ========== INFO CARDS ========== */
+.info-card {{
+    background: {colors['card_bg']};
+    border: 1px solid {colors['border']};
+    border-radius: 10px;
+    overflow: hidden;
+    margin-bottom: 1rem;
+    box-shadow: 0 1px 3px 0 rgba(0, 0, 0, 0.3);
+    transition: all 0.3s ease;
+}}
+
+.info-card:hover {{
+    border-color: {colors['border_hover']};
+    box-shadow: 0 4px 12px rgba(0, 0, 0, 0.4);
+}}
+
+.info-card-header {{
+    font-family: 'Inter', sans-serif !important;
+    font-size: 0.75rem !important;
+    font-weight: 700 !important;
+    color: {colors['text_secondary']} !important;
+    text-transform: uppercase !important;
+    letter-spacing: 0.15em !important;
+    padding: 1rem 1.25rem;
+    background: {colors['card_bg_elevated']};
+    border-bottom: 1px solid {colors['border']};
+}}
+
+.info-card-body {{
+    padding: 1.25rem;
+}}
+
+/* KPI Card */
+.kpi-card {{
+    background: {colors['card_bg']};
+    border: 1px solid {colors['border']};
+    border-radius: 10px;
+    padding: 1.5rem;
+    text-align: center;
+    transition: all 0.3s ease;
+    box-shadow: 0 1px 3px 0 rgba(0, 0, 0, 0.3);
+    height: 100%;
+    display: flex;
+    flex-direction: column;
+    justify-content: center;
+    align-items: center;
+}}
+
+.kpi-card:hover {{
+    transform: translateY(-4px);
+    box-shadow: 0 8px 16px rgba(0, 0, 0, 0.4);
+    border-color: {colors['border_accent']};
+}}
+
+.kpi-label {{
+    font-family: 'Inter', sans-serif !important;
+    font-size: 0.7rem !important;
+    font-weight: 700 !important;
+    color: {colors['text_secondary']} !important;
+    text-transform: uppercase !important;
+    letter-spacing: 0.12em !important;
+    margin-bottom: 0.75rem !important;
+}}
+
+.kpi-value {{
+    font-family: 'Inter', sans-serif !important;
+    font-size: 2rem !important;
+    font-weight: 900 !important;
+    color: {colors['text_primary']} !important;
+    margin-bottom: 0.5rem !important;
+    letter-spacing: -0.01em !important;
+}}
+
+.kpi-subtitle {{
+    font-family: 'JetBrains Mono', monospace !important;
+    font-size: 0.75rem !important;
+    color: {colors['text_muted']} !important;
+    font-weight: 500 !important;
+}}
+
+.kpi-change {{
+    font-family: 'JetBrains Mono', monospace !important;
+    font-size: 0.75rem !important;
+    font-weight: 600 !important;
+}}
+
+.kpi-change.positive {{
+    color: {colors['accent_green']} !important;
+}}
+
+.kpi-change.negative {{
+    color: {colors['accent_red']} !important;
+}}
+
+/* ========== TABS ========== */
+.stTabs [data-baseweb="tab-list"] {{
+    gap: 0.5rem;
+    background: transparent;
+    border-bottom: 2px solid {colors['border']};
+    padding: 0 0.5rem;
+    margin-bottom: 2rem;
+}}
+
+.stTabs [data-baseweb="tab"] {{
+    background: transparent !important;
+    border: 1px solid transparent;
+    border-bottom: 3px solid transparent;
+    color: {colors['text_muted']} !important;
+    font-family: 'Inter', sans-serif !important;
+    font-weight: 700 !important;
+    font-size: 0.8rem !important;
+    text-transform: uppercase !important;
+    letter-spacing: 0.1em !important;
+    padding: 0.875rem 1.75rem;
+    margin-bottom: -2px;
+    transition: all 0.3s ease;
+    border-radius: 8px 8px 0 0;
+}}
+
+.stTabs [data-baseweb="tab"]:hover {{
+    color: {colors['text_primary']} !important;
+    background: rgba(59, 130, 246, 0.05) !important;
+    border-color: {colors['border_hover']};
+    border-bottom-color: {colors['border_hover']};
+}}
+
+.stTabs [aria-selected="true"] {{
+    color: {colors['accent_blue']} !important;
+    border-bottom-color: {colors['accent_blue']} !important;
+    background: rgba(59, 130, 246, 0.08) !important;
+    border-color: {colors['border']};
+}}
+
+/* ========== DATAFRAME ========== */
+[data-testid="stDataFrame"] {{
+    border: 1px solid {colors['border']};
+    border-radius: 10px;
+    overflow: hidden;
+    box-shadow: 0 1px 3px 0 rgba(0, 0, 0, 0.3);
+}}
+
+[data-testid="stDataFrame"] table {{
+    font-family: 'JetBrains Mono', monospace !important;
+    font-size: 0.75rem !important;
+}}
+
+[data-testid="stDataFrame"] th {{
+    font-family: 'Inter', sans-serif !important;
+    font-size: 0.75rem !important;
+    font-weight: 700 !important;
+    text-transform: uppercase !important;
+    letter-spacing: 0.1em !important;
+    color: {colors['text_secondary']} !important;
+    background: {colors['card_bg_elevated']} !important;
+}}
+
+[data-testid="stDataFrame"] td {{
+    font-family: 'JetBrains Mono', monospace !important;
+    font-size: 0.8rem !important;
+    color: {colors['text_primary']} !important;
+}}
+
+/* ========== JSON DISPLAY ========== */
+[data-testid="stJson"] {{
+    background: {colors['card_bg']} !important;
+    border: 1px solid {colors['border']} !important;
+    border-radius: 10px !important;
+    padding: 1.25rem !important;
+    box-shadow: 0 1px 3px 0 rgba(0, 0, 0, 0.3) !important;
+    overflow-x: auto !important;
+    max-width: 100% !important;
+}}
+
+[data-testid="stJson"] * {{
+    font-family: 'JetBrains Mono', monospace !important;
+    font-size: 0.75rem !important;
+    letter-spacing: 0.02em !important;
+    line-height: 1.7 !important;
+    word-break: break-all !important;
+    overflow-wrap: break-word !important;
+    white-space: pre-wrap !important;
+}}
+
+/* ========== DIVIDER ========== */
+hr {{
+    border-color: {colors['border']} !important;
+    margin: 2rem 0 !important;
+    opacity: 0.5;
+}}
+
+/* ========== SCROLLBAR ========== */
+::-webkit-scrollbar {{
+    width: 12px;
+    height: 12px;
+}}
+
+::-webkit-scrollbar-track {{
+    background: {colors['bg']};
+}}
+
+::-webkit-scrollbar-thumb {{
+    background: {colors['border']};
+    border-radius: 6px;
+    border: 2px solid {colors['bg']};
+}}
+
+::-webkit-scrollbar-thumb:hover {{
+    background: {colors['border_hover']};
+}}
+
+/* ========== THREAT INDICATOR ========== */
+.threat-level {{
+    display: inline-flex;
+    align-items: center;
+    gap: 0.5rem;
+    padding: 0.5rem 1rem;
+    border-radius: 6px;
+    font-family: 'Inter', sans-serif !important;
+    font-size: 0.7rem !important;
+    font-weight: 700 !important;
+    letter-spacing: 0.08em !important;
+    text-transform: uppercase !important;
+}}
+
+.threat-level-low {{
+    background: rgba(16, 185, 129, 0.1);
+    border: 1px solid {colors['accent_green']};
+    color: {colors['accent_green']};
+}}
+
+.threat-level-medium {{
+    background: rgba(245, 158, 11, 0.1);
+    border: 1px solid {colors['accent_yellow']};
+    color: {colors['accent_amber']};
+}}
+
+.threat-level-high {{
+    background: rgba(239, 68, 68, 0.1);
+    border: 1px solid {colors['accent_red']};
+    color: {colors['accent_red']};
+}}
+
+/* ========== TIMELINE ========== */
+.timeline-item {{
+    display: flex;
+    gap: 1rem;
+    padding: 0.75rem 0;
+    border-left: 2px solid {colors['border']};
+    padding-left: 1.5rem;
+    position: relative;
+    margin-left: 0.5rem;
+}}
+
+.timeline-item::before {{
+    content: '';
+    position: absolute;
+    left: -6px;
+    top: 1rem;
+    width: 10px;
+    height: 10px;
+    border-radius: 50%;
+    background: {colors['accent_blue']};
+    border: 2px solid {colors['bg']};
+}}
+
+.timeline-time {{
+    font-family: 'JetBrains Mono', monospace !important;
+    font-size: 0.7rem !important;
+    color: {colors['text_muted']} !important;
+    min-width: 80px;
+}}
+
+.timeline-content {{
+    font-family: 'Inter', sans-serif !important;
+    font-size: 0.8rem !important;
+    color: {colors['text_secondary']} !important;
+}}
+
+/* ========== STATS GRID ========== */
+.stats-grid {{
+    display: grid;
+    grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
+    gap: 1rem;
+    margin: 1rem 0;
+}}
+
+/* ========== SPACING ========== */
+.spacing-xs {{ margin-bottom: 0.5rem; }}
+.spacing-sm {{ margin-bottom: 0.75rem; }}
+.spacing-md {{ margin-bottom: 1.5rem; }}
+.spacing-lg {{ margin-bottom: 2rem; }}
+.spacing-xl {{ margin-bottom: 3rem; }}
+</style>
+""")
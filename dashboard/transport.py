@@ -0,0 +1,207 @@
+import queue
+import random
+import threading
+from urllib.parse import urlparse
+
+import paho.mqtt.client as mqtt
+
+
+def topic_matches(pattern: str, topic: str) -> bool:
+    """
+    MQTT topic filter matching: `+` matches one level, a trailing `#`
+    matches any number of levels including none ("a/#" matches "a").
+    """
+    p_levels = pattern.split("/")
+    t_levels = topic.split("/")
+    if topic.startswith("$") and p_levels[0] in ("+", "#"):
+        return False
+    for i, p in enumerate(p_levels):
+        if p == "#":
+            return True
+        if i >= len(t_levels):
+            return False
+        if p != "+" and p != t_levels[i]:
+            return False
+    return len(p_levels) == len(t_levels)
+
+
+class Message:
+    """The subset of paho's MQTTMessage that subscribers use."""
+
+    __slots__ = ("topic", "payload", "qos", "retain", "dup", "mid")
+
+    def __init__(self, topic: str, payload: bytes, qos: int = 0, retain: bool = False, dup: bool = False, mid: int = 0):
+        self.topic = topic
+        self.payload = payload
+        self.qos = qos
+        self.retain = retain
+        self.dup = dup
+        self.mid = mid
+
+
+class PahoTransport(mqtt.Client):
+    """
+    Network transport backed by paho-mqtt. The broker address is bound at
+    construction so connect() takes no arguments, matching LoopbackTransport;
+    everything else is paho's own client.
+    """
+
+    def __init__(self, broker: str, port: int, client_id: str, clean_session: bool = True, keepalive: int = 60):
+        super().__init__(client_id=client_id, clean_session=clean_session)
+        self.broker = broker
+        self.port = port
+        self.keepalive = keepalive
+
+    def connect(self):
+        return super().connect(self.broker, self.port, keepalive=self.keepalive)
+
+
+class LoopbackBroker:
+    """
+    In-process MQTT broker for offline runs and benchmarks.
+
+    Routes every publish to the subscribers whose filters match, at the
+    lower of the publish and subscription QoS. To mimic at-least-once
+    delivery, a QoS-1 message is redelivered with `dup=True` with
+    probability `duplicate_rate`.
+    """
+
+    _named = {}
+    _named_lock = threading.Lock()
+
+    def __init__(self, duplicate_rate: float = 0.0, seed=None):
+        self.duplicate_rate = duplicate_rate
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._subscriptions = []
+        self._mid = 0
+
+    @classmethod
+    def named(cls, name: str) -> "LoopbackBroker":
+        """Process-wide broker registry, so loopback:// URLs with the same name meet."""
+        with cls._named_lock:
+            broker = cls._named.get(name)
+            if broker is None:
+                broker = cls._named[name] = cls()
+            return broker
+
+    def subscribe(self, transport, pattern: str, qos: int):
+        with self._lock:
+            self._subscriptions = [s for s in self._subscriptions if s[:2] != (transport, pattern)]
+            self._subscriptions.append((transport, pattern, qos))
+
+    def detach(self, transport):
+        with self._lock:
+            self._subscriptions = [s for s in self._subscriptions if s[0] is not transport]
+
+    def publish(self, topic: str, payload: bytes, qos: int = 0, retain: bool = False):
+        with self._lock:
+            self._mid += 1
+            mid = self._mid
+            subscriptions = self._subscriptions
+
+        delivered = set()
+        for transport, pattern, sub_qos in subscriptions:
+            # A client with overlapping filters gets one copy, like most brokers.
+            if transport in delivered or not topic_matches(pattern, topic):
+                continue
+            delivered.add(transport)
+            effective_qos = min(qos, sub_qos)
+            transport._deliver(Message(topic, payload, effective_qos, retain, False, mid))
+            if effective_qos >= 1 and self.duplicate_rate and self._rng.random() < self.duplicate_rate:
+                transport._deliver(Message(topic, payload, effective_qos, retain, True, mid))
+        return mid
+
+
+class LoopbackTransport:
+    """
+    Client side of LoopbackBroker with paho's callback signatures. Inbound
+    messages are queued and dispatched on a background thread started by
+    loop_start(), like paho's network loop, or synchronously via loop().
+    """
+
+    def __init__(self, broker: LoopbackBroker, client_id: str = ""):
+        self.broker = broker
+        self.client_id = client_id
+        self.on_connect = None
+        self.on_message = None
+        self.on_disconnect = None
+        self._inbox = queue.SimpleQueue()
+        self._thread = None
+        self._connected = False
+
+    def connect(self):
+        self._connected = True
+        if self.on_connect:
+            self.on_connect(self, None, {}, 0)
+
+    def loop_start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name=f"loopback-{self.client_id}", daemon=True)
+            self._thread.start()
+
+    def loop_stop(self):
+        if self._thread is not None:
+            self._inbox.put(None)
+            self._thread.join()
+            self._thread = None
+
+    def loop(self, timeout: float = 0.0) -> int:
+        """Dispatches queued messages on the calling thread; returns how many."""
+        count = 0
+        try:
+            msg = self._inbox.get(timeout=timeout) if timeout else self._inbox.get_nowait()
+            while msg is not None:
+                self._dispatch(msg)
+                count += 1
+                msg = self._inbox.get_nowait()
+        except queue.Empty:
+            pass
+        return count
+
+    def pending(self) -> int:
+        """Messages delivered to this client but not yet dispatched."""
+        return self._inbox.qsize()
+
+    def disconnect(self):
+        self.broker.detach(self)
+        if self._connected:
+            self._connected = False
+            if self.on_disconnect:
+                self.on_disconnect(self, None, 0)
+
+    def subscribe(self, topic: str, qos: int = 0):
+        self.broker.subscribe(self, topic, qos)
+
+    def publish(self, topic: str, payload, qos: int = 0, retain: bool = False):
+        if isinstance(payload, str):
+            payload = payload.encode("utf-8")
+        return self.broker.publish(topic, payload, qos, retain)
+
+    def _deliver(self, msg: Message):
+        self._inbox.put(msg)
+
+    def _dispatch(self, msg: Message):
+        if self.on_message:
+            self.on_message(self, None, msg)
+
+    def _run(self):
+        while True:
+            msg = self._inbox.get()
+            if msg is None:
+                return
+            self._dispatch(msg)
+
+
+def create_transport(url: str, client_id: str):
+    """
+    Builds a transport from a URL:
+      mqtt://host[:port]   paho-mqtt against a real broker (default port 1883)
+      loopback://name      in-process LoopbackBroker shared by that name
+    """
+    parsed = urlparse(url)
+    if parsed.scheme == "mqtt":
+        return PahoTransport(parsed.hostname, parsed.port or 1883, client_id)
+    if parsed.scheme == "loopback":
+        return LoopbackTransport(LoopbackBroker.named(parsed.netloc or "default"), client_id)
+    raise ValueError(f"unsupported transport URL {url!r}, expected mqtt:// or loopback://")
@@ -0,0 +1,76 @@
+import hashlib
+import struct
+
+from ring_buffer import STATUS_LABELS, status_code
+
+
+# Packets published on `<device topic>/bin` use this fixed layout instead of
+# JSON; the device id is taken from the topic.
+#
+#   version  u8     WIRE_VERSION
+#   ts_ns    i64    epoch nanoseconds, UTC
+#   temp     f64    °C
+#   pressure f64    PSI
+#   status   u8     index into ring_buffer.STATUS_LABELS
+#   digest   32s    SHA-256 of the canonical form (see canonical_bytes)
+#
+# All fields little-endian, 58 bytes per packet.
+BINARY_SUFFIX = "/bin"
+WIRE_VERSION = 1
+
+_FIELDS = struct.Struct("<BqddB")
+_PACKET = struct.Struct("<BqddB32s")
+PACKET_SIZE = _PACKET.size
+
+
+def binary_topic(device_topic: str) -> str:
+    return device_topic + BINARY_SUFFIX
+
+
+def device_from_topic(topic: str) -> str:
+    """Device id of a `<base>/<device_id>/bin` topic."""
+    return topic[:-len(BINARY_SUFFIX)].rsplit("/", 1)[-1]
+
+
+def canonical_bytes(device_id: str, fields: bytes) -> bytes:
+    """
+    Hash input for a binary packet: the UTF-8 device id, a NUL, then the
+    packed fields exactly as sent. Covers the same values as HASH_FIELDS.
+    """
+    return device_id.encode("utf-8") + b"\0" + fields
+
+
+def encode(device_id: str, ts_ns: int, temperature: float, pressure: float, status: str) -> bytes:
+    fields = _FIELDS.pack(WIRE_VERSION, ts_ns, temperature, pressure, status_code(status))
+    return fields + hashlib.sha256(canonical_bytes(device_id, fields)).digest()
+
+
+def decode(device_id: str, data: bytes) -> dict:
+    """
+    Unpacks and verifies a binary packet into the payload dict the JSON path
+    produces, with `integrity_ok` set. The timestamp is only carried as
+    `ts_ns`; no ISO string is built. Raises ValueError for a packet of the
+    wrong size or version.
+    """
+    if len(data) != PACKET_SIZE:
+        raise ValueError(f"binary packet is {len(data)} bytes, expected {PACKET_SIZE}")
+    version, ts_ns, temperature, pressure, status, digest = _PACKET.unpack(data)
+    if version != WIRE_VERSION:
+        raise ValueError(f"unsupported wire version {version}")
+    fields = data[:_FIELDS.size]
+    return {
+        "device_id": device_id,
+        "ts_ns": ts_ns,
+        "temperature": temperature,
+        "pressure": pressure,
+        "status": STATUS_LABELS[status] if status < len(STATUS_LABELS) else "Unknown",
+        "hash": digest.hex(),
+        "integrity_ok": hashlib.sha256(canonical_bytes(device_id, fields)).digest() == digest,
+    }
+
+
+def decode_many(device_id: str, data: bytes) -> list:
+    """decode() for a message of back-to-back packets (a batch)."""
+    if not data or len(data) % PACKET_SIZE:
+        raise ValueError(f"binary batch is {len(data)} bytes, not a multiple of {PACKET_SIZE}")
+    return [decode(device_id, data[i:i + PACKET_SIZE]) for i in range(0, len(data), PACKET_SIZE)]
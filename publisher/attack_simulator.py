@@ -1,65 +1,75 @@
 import json
-import time
 import random
 from datetime import datetime, timezone
 
-import paho.mqtt.client as mqtt
-
 from config import (
-    BROKER, PORT, TOPIC, QOS, DEVICE_ID, PUBLISH_INTERVAL_SEC,
+    DEVICE_TOPIC, QOS, DEVICE_ID, PUBLISH_INTERVAL_SEC, TRANSPORT_URL,
     TEMP_MIN, TEMP_MAX, PRESSURE_MIN, PRESSURE_MAX
 )
+from scheduler import Ticker
 
 import sys
 import os
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "dashboard")))
 from integrity import sha256_hash
+from transport import create_transport
 
 
-def main():
-    client = mqtt.Client(client_id=f"{DEVICE_ID}_attacker", clean_session=True)
-    client.connect(BROKER, PORT, keepalive=60)
-    client.loop_start()
+def tampered_payload(temp: float, pressure: float, device_id: str = DEVICE_ID) -> dict:
+    # Build a legitimate payload first
+    legit_payload = {
+        "device_id": device_id,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "temperature": round(temp, 2),
+        "pressure": round(pressure, 2),
+        "status": "OK"
+    }
+
+    legit_payload["hash"] = sha256_hash(legit_payload)
+
+    # Now tamper with temperature but keep old hash
+    tampered = dict(legit_payload)
+    tampered["temperature"] = 100.0
+    tampered["status"] = "OK"
+    # hash remains the same intentionally (tamper simulation)
+    return tampered
+
 
+def run_attack(client, ticker: Ticker):
     temp = random.uniform(TEMP_MIN, TEMP_MAX)
     pressure = random.uniform(PRESSURE_MIN, PRESSURE_MAX)
 
-    print(f"ATTACK MODE publishing to broker={BROKER}, topic={TOPIC}")
+    print(f"ATTACK MODE publishing to transport={TRANSPORT_URL}, topic={DEVICE_TOPIC}")
     print("This script will inject a false temperature while keeping status OK and not updating hash.")
 
-    try:
-        while True:
-            temp += random.uniform(-0.4, 0.6)
-            temp = max(50.0, min(110.0, temp))
+    while True:
+        ticker.wait()
+        temp += random.uniform(-0.4, 0.6)
+        temp = max(50.0, min(110.0, temp))
 
-            pressure += random.uniform(-0.3, 0.3)
-            pressure = max(10.0, min(55.0, pressure))
+        pressure += random.uniform(-0.3, 0.3)
+        pressure = max(10.0, min(55.0, pressure))
 
-            # Build a legitimate payload first
-            legit_payload = {
-                "device_id": DEVICE_ID,
-                "timestamp": datetime.now(timezone.utc).isoformat(),
-                "temperature": round(temp, 2),
-                "pressure": round(pressure, 2),
-                "status": "OK"
-            }
+        payload = tampered_payload(temp, pressure)
 
-            legit_payload["hash"] = sha256_hash(legit_payload)
+        client.publish(DEVICE_TOPIC, json.dumps(payload), qos=QOS, retain=False)
 
-            # Now tamper with temperature but keep old hash
-            tampered_payload = dict(legit_payload)
-            tampered_payload["temperature"] = 100.0
-            tampered_payload["status"] = "OK"
-            # hash remains the same intentionally (tamper simulation)
+        print(payload)
 
-            client.publish(TOPIC, json.dumps(tampered_payload), qos=QOS, retain=False)
 
-            print(tampered_payload)
-            time.sleep(PUBLISH_INTERVAL_SEC)
+def main():
+    client = create_transport(TRANSPORT_URL, f"{DEVICE_ID}_attacker")
+    client.connect()
+    client.loop_start()
+    ticker = Ticker(PUBLISH_INTERVAL_SEC)
+
+    try:
+        run_attack(client, ticker)
 
     except KeyboardInterrupt:
         print("\nStopping attacker...")
+        print(ticker.summary())
 
     finally:
         client.loop_stop()
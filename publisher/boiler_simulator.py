@@ -1,21 +1,30 @@
+import argparse
 import json
+import math
 import time
 import random
 from datetime import datetime, timezone
 
-import paho.mqtt.client as mqtt
+import numpy as np
 
 from config import (
-    BROKER, PORT, TOPIC, QOS, DEVICE_ID, PUBLISH_INTERVAL_SEC,
+    TOPIC, DEVICE_TOPIC, QOS, DEVICE_ID, PUBLISH_INTERVAL_SEC, TRANSPORT_URL,
     TEMP_MIN, TEMP_MAX, PRESSURE_MIN, PRESSURE_MAX
 )
+from scheduler import Ticker
 
 import sys
 import os
 
 # Import integrity module from dashboard folder
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "dashboard")))
-from integrity import sha256_hash
+from integrity import sha256_hash, sha256_many, batch_hash, ChainSigner
+from mqtt_client import parse_timestamp_ns
+from transport import create_transport
+import wire
+
+
+STATUS_LABELS = np.array(["OK", "Warning", "Critical"])
 
 
 def compute_status(temp_c: float, pressure_psi: float) -> str:
@@ -26,46 +35,266 @@ def compute_status(temp_c: float, pressure_psi: float) -> str:
     return "OK"
 
 
-def main():
-    client = mqtt.Client(client_id=f"{DEVICE_ID}_publisher", clean_session=True)
-    client.connect(BROKER, PORT, keepalive=60)
-    client.loop_start()
+def step_device(temp: float, pressure: float):
+    """Advances one device's random walk by one sample."""
+    # Smooth-ish drift + noise
+    temp += random.uniform(-0.6, 0.8)
+    temp = max(50.0, min(110.0, temp))
 
-    temp = random.uniform(TEMP_MIN, TEMP_MAX)
-    pressure = random.uniform(PRESSURE_MIN, PRESSURE_MAX)
+    # Pressure follows temperature slightly + noise
+    pressure += (temp - 75.0) * 0.01 + random.uniform(-0.4, 0.4)
+    pressure = max(10.0, min(55.0, pressure))
+    return temp, pressure
+
+
+def compute_status_many(temp_c: np.ndarray, pressure_psi: np.ndarray) -> np.ndarray:
+    """Vectorized compute_status: same thresholds, one label per device."""
+    codes = np.where(
+        (temp_c >= 95.0) | (pressure_psi >= 45.0), 2,
+        np.where((temp_c >= 85.0) | (pressure_psi >= 35.0), 1, 0),
+    )
+    return STATUS_LABELS[codes]
+
+
+def step_fleet(rng: np.random.Generator, temp: np.ndarray, pressure: np.ndarray):
+    """
+    Advances every device's random walk by one sample. Draws, clamps and the
+    pressure/temperature coupling match step_device() exactly.
+    """
+    temp = np.clip(temp + rng.uniform(-0.6, 0.8, temp.size), 50.0, 110.0)
+    pressure = np.clip(pressure + (temp - 75.0) * 0.01 + rng.uniform(-0.4, 0.4, pressure.size), 10.0, 55.0)
+    return temp, pressure
 
-    print(f"Publishing to broker={BROKER}, topic={TOPIC}")
-    try:
-        while True:
-            # Smooth-ish drift + noise
-            temp += random.uniform(-0.6, 0.8)
-            temp = max(50.0, min(110.0, temp))
 
-            # Pressure follows temperature slightly + noise
-            pressure += (temp - 75.0) * 0.01 + random.uniform(-0.4, 0.4)
-            pressure = max(10.0, min(55.0, pressure))
+def fleet_payloads(device_ids, temp: np.ndarray, pressure: np.ndarray, hashed: bool = True) -> list:
+    timestamp = datetime.now(timezone.utc).isoformat()
+    statuses = compute_status_many(temp, pressure).tolist()
+    payloads = [
+        {"device_id": d, "timestamp": timestamp, "temperature": t, "pressure": p, "status": s}
+        for d, t, p, s in zip(device_ids, np.round(temp, 2).tolist(), np.round(pressure, 2).tolist(), statuses)
+    ]
+    if hashed:
+        for payload, digest in zip(payloads, sha256_many(payloads)):
+            payload["hash"] = digest
+    return payloads
 
-            status = compute_status(temp, pressure)
 
-            payload = {
-                "device_id": DEVICE_ID,
-                "timestamp": datetime.now(timezone.utc).isoformat(),
-                "temperature": round(temp, 2),
-                "pressure": round(pressure, 2),
-                "status": status
-            }
+class SamplePublisher:
+    """
+    Encodes and publishes samples in the configured mode: JSON with a hash
+    per sample (default), chain mode (`chain` samples per checkpoint) or the
+    binary wire format.
 
+    With `batch` > 1 or `batch_ms` > 0, samples are collected per topic and
+    sent as one message once `batch` samples have accumulated or the oldest
+    is `batch_ms` milliseconds old: a JSON {"batch": [...]} object, whose
+    samples carry their own hashes or, with `batch_hash`, share one, or
+    back-to-back binary packets. The age limit is only checked when a
+    sample is published or flush_due() is called, so callers that publish
+    less often than `batch_ms` should call flush_due() in between. Call
+    flush() before disconnecting to send partially filled batches and
+    checkpoint the open chain batches.
+    """
+
+    def __init__(self, client, chain: int = 0, binary: bool = False, batch: int = 1, batch_ms: float = 0,
+                 batch_hash: bool = False):
+        self.client = client
+        self.chain = chain
+        self.binary = binary
+        self.batch = batch
+        self.batch_ms = batch_ms
+        self.batch_hash = batch_hash
+        self.batched = batch > 1 or batch_ms > 0
+        self._signers = {}
+        self._pending = {}
+        self._opened = {}
+
+    def publish_many(self, topics, payloads, ts_ns: int):
+        """publish() for one sample per topic, all stamped `ts_ns`."""
+        if not (self.chain or self.binary or self.batch_hash):
+            for payload, digest in zip(payloads, sha256_many(payloads)):
+                payload["hash"] = digest
+        for topic, payload in zip(topics, payloads):
+            self._publish(topic, payload, ts_ns)
+
+    def publish(self, topic: str, payload: dict, ts_ns: int):
+        if not (self.chain or self.binary or self.batch_hash):
             payload["hash"] = sha256_hash(payload)
+        self._publish(topic, payload, ts_ns)
+
+    def _publish(self, topic: str, payload: dict, ts_ns: int):
+        if self.chain:
+            signer = self._signers.get(topic)
+            if signer is None:
+                signer = self._signers[topic] = ChainSigner(payload["device_id"], self.chain)
+            message, checkpoint = signer.sign(payload)
+            self._send(topic, message)
+            if checkpoint is not None:
+                self._send(topic, checkpoint)
+            return
+
+        item = payload
+        if self.binary:
+            topic = wire.binary_topic(topic)
+            item = wire.encode(payload["device_id"], ts_ns, payload["temperature"], payload["pressure"],
+                               payload["status"])
+        if not self.batched:
+            self._send(topic, item if self.binary else json.dumps(item))
+            return
+
+        pending = self._pending.setdefault(topic, [])
+        if not pending:
+            self._opened[topic] = time.monotonic()
+        pending.append(item)
+        if (self.batch > 1 and len(pending) >= self.batch) or \
+                (self.batch_ms > 0 and (time.monotonic() - self._opened[topic]) * 1e3 >= self.batch_ms):
+            self._send_batch(topic)
+
+    def _send_batch(self, topic: str):
+        items = self._pending.pop(topic)
+        del self._opened[topic]
+        if self.binary:
+            self._send(topic, b"".join(items))
+        elif self.batch_hash:
+            self._send(topic, json.dumps({"batch": items, "batch_hash": batch_hash(items)}))
+        else:
+            self._send(topic, json.dumps({"batch": items}))
+
+    def _send(self, topic: str, message):
+        self.client.publish(topic, message, qos=QOS, retain=False)
+
+    def flush_due(self, now: float = None) -> float:
+        """
+        Sends every batch whose oldest sample is at least `batch_ms` old and
+        returns the seconds until the next open batch falls due (inf if none).
+        """
+        if self.batch_ms <= 0:
+            return math.inf
+        now = time.monotonic() if now is None else now
+        limit = self.batch_ms / 1e3
+        next_due = math.inf
+        for topic, opened in list(self._opened.items()):
+            age = now - opened
+            if age >= limit:
+                self._send_batch(topic)
+            else:
+                next_due = min(next_due, limit - age)
+        return next_due
+
+    def flush(self):
+        """Sends partially filled batches and closes open chain batches with a checkpoint."""
+        for topic in list(self._pending):
+            self._send_batch(topic)
+        for topic, signer in self._signers.items():
+            if signer.pending:
+                self._send(topic, json.dumps(signer.checkpoint()))
 
-            client.publish(TOPIC, json.dumps(payload), qos=QOS, retain=False)
 
+def wait_tick(ticker: Ticker, publisher: SamplePublisher) -> int:
+    """ticker.wait(), sending `batch_ms` batches as they fall due before the tick."""
+    due = publisher.flush_due()
+    while due < ticker.remaining():
+        time.sleep(due)
+        due = publisher.flush_due()
+    return ticker.wait()
+
+
+def run_fleet(publisher: SamplePublisher, size: int, ticker: Ticker):
+    rng = np.random.default_rng()
+    device_ids = [f"boiler_{i:05d}" for i in range(size)]
+    topics = [f"{TOPIC}/{d}" for d in device_ids]
+
+    temp = rng.uniform(TEMP_MIN, TEMP_MAX, size)
+    pressure = rng.uniform(PRESSURE_MIN, PRESSURE_MAX, size)
+
+    print(f"Fleet mode: {size:,} devices publishing to transport={TRANSPORT_URL}, topic={TOPIC}/<device_id>")
+    while True:
+        wait_tick(ticker, publisher)
+        t0 = time.perf_counter()
+        temp, pressure = step_fleet(rng, temp, pressure)
+        payloads = fleet_payloads(device_ids, temp, pressure, hashed=False)
+        publisher.publish_many(topics, payloads, parse_timestamp_ns(payloads[0]["timestamp"]))
+
+        elapsed = time.perf_counter() - t0
+        critical = sum(p["status"] == "Critical" for p in payloads)
+        print(f"{payloads[0]['timestamp']} published {size:,} payloads in {elapsed * 1e3:.0f} ms ({critical} critical), "
+              f"{ticker.missed} missed")
+
+
+def run_device(publisher: SamplePublisher, ticker: Ticker):
+    temp = random.uniform(TEMP_MIN, TEMP_MAX)
+    pressure = random.uniform(PRESSURE_MIN, PRESSURE_MAX)
+
+    # Printing every sample would cap the rate; above 1 Hz print a summary every second instead.
+    every = max(1, round(1 / ticker.interval))
+
+    print(f"Publishing to transport={TRANSPORT_URL}, topic={DEVICE_TOPIC}")
+    while True:
+        tick = wait_tick(ticker, publisher)
+        temp, pressure = step_device(temp, pressure)
+        status = compute_status(temp, pressure)
+
+        payload = {
+            "device_id": DEVICE_ID,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "temperature": round(temp, 2),
+            "pressure": round(pressure, 2),
+            "status": status
+        }
+
+        publisher.publish(DEVICE_TOPIC, payload, parse_timestamp_ns(payload["timestamp"]))
+
+        if every == 1:
             print(payload)
-            time.sleep(PUBLISH_INTERVAL_SEC)
+        elif tick % every == 0:
+            print(ticker.summary())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Boiler digital twin publisher")
+    parser.add_argument("--fleet", type=int, default=0, metavar="N",
+                        help="simulate N boilers with vectorized updates instead of a single device")
+    parser.add_argument("--chain", type=int, default=0, metavar="B",
+                        help="chain mode: number packets and sign every B of them with one Merkle checkpoint "
+                             "instead of hashing each packet")
+    parser.add_argument("--binary", action="store_true",
+                        help="publish the compact binary encoding on <device topic>/bin instead of JSON")
+    parser.add_argument("--interval", type=float, default=PUBLISH_INTERVAL_SEC, metavar="SEC",
+                        help="seconds between samples (default %(default)s)")
+    parser.add_argument("--batch", type=int, default=1, metavar="N",
+                        help="pack up to N samples per device into one message")
+    parser.add_argument("--batch-ms", type=float, default=0, metavar="T",
+                        help="send a device's batch once its oldest sample is T ms old, even if no further sample arrives")
+    parser.add_argument("--batch-hash", action="store_true",
+                        help="protect each JSON batch with one hash instead of a hash per sample")
+    args = parser.parse_args()
+    if args.binary and args.chain:
+        parser.error("--binary and --chain cannot be combined")
+    if args.chain and (args.batch > 1 or args.batch_ms > 0):
+        parser.error("--chain cannot be combined with --batch/--batch-ms")
+    if args.batch_hash and (args.binary or not (args.batch > 1 or args.batch_ms > 0)):
+        parser.error("--batch-hash needs JSON batches (--batch or --batch-ms)")
+
+    client_id = f"{DEVICE_ID}_publisher" if not args.fleet else f"fleet_{args.fleet}_publisher"
+    client = create_transport(TRANSPORT_URL, client_id)
+    client.connect()
+    client.loop_start()
+    publisher = SamplePublisher(client, chain=args.chain, binary=args.binary, batch=args.batch,
+                                batch_ms=args.batch_ms, batch_hash=args.batch_hash)
+    ticker = Ticker(args.interval)
+
+    try:
+        if args.fleet:
+            run_fleet(publisher, args.fleet, ticker)
+        else:
+            run_device(publisher, ticker)
 
     except KeyboardInterrupt:
         print("\nStopping publisher...")
+        print(ticker.summary())
 
     finally:
+        publisher.flush()
         client.loop_stop()
         client.disconnect()
 
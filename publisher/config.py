@@ -1,11 +1,21 @@
+import os
+
 BROKER = "test.mosquitto.org"
 PORT = 1883
 TOPIC = "cu/bca/boiler/secure_digital_twin"
 QOS = 1
 
-DEVICE_ID = "boiler_01"
+# mqtt://host:port for a real broker, loopback://name for the in-process one
+TRANSPORT_URL = os.environ.get("BOILER_TRANSPORT", f"mqtt://{BROKER}:{PORT}")
+
+# Override per process to simulate several boilers, e.g. BOILER_DEVICE_ID=boiler_02
+DEVICE_ID = os.environ.get("BOILER_DEVICE_ID", "boiler_01")
+
+# Each device publishes on its own subtopic; the dashboard subscribes to TOPIC/#
+DEVICE_TOPIC = f"{TOPIC}/{DEVICE_ID}"
 
-PUBLISH_INTERVAL_SEC = 1.0
+# Shared with the dashboard, which expects one sample per device per interval
+PUBLISH_INTERVAL_SEC = float(os.environ.get("BOILER_PUBLISH_INTERVAL", 1.0))
 
 # Boiler ranges
 TEMP_MIN = 65.0
@@ -0,0 +1,253 @@
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from datetime import datetime, timezone
+
+from config import TOPIC, TRANSPORT_URL, PUBLISH_INTERVAL_SEC, TEMP_MIN, TEMP_MAX, PRESSURE_MIN, PRESSURE_MAX
+from boiler_simulator import SamplePublisher, compute_status
+
+import sys
+import os
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "dashboard")))
+from transport import create_transport
+
+
+class DriftModel:
+    """
+    One boiler's random walk with its own bias and noise, so devices in a
+    fleet wander apart instead of moving in lockstep. Bias and noise default
+    to a random draw around step_device()'s values.
+    """
+
+    __slots__ = ("temp", "pressure", "temp_bias", "temp_noise", "pressure_noise")
+
+    def __init__(self, rng: random.Random):
+        self.temp = rng.uniform(TEMP_MIN, TEMP_MAX)
+        self.pressure = rng.uniform(PRESSURE_MIN, PRESSURE_MAX)
+        self.temp_bias = rng.uniform(-0.1, 0.3)
+        self.temp_noise = rng.uniform(0.4, 0.9)
+        self.pressure_noise = rng.uniform(0.2, 0.6)
+
+    def step(self, rng: random.Random):
+        temp = self.temp + self.temp_bias + rng.uniform(-self.temp_noise, self.temp_noise)
+        self.temp = max(50.0, min(110.0, temp))
+        pressure = self.pressure + (self.temp - 75.0) * 0.01 + rng.uniform(-self.pressure_noise, self.pressure_noise)
+        self.pressure = max(10.0, min(55.0, pressure))
+        return self.temp, self.pressure
+
+
+class FleetEngine:
+    """
+    Runs one asyncio coroutine per simulated device over a small pool of
+    broker connections (device i publishes on connection i % connections).
+
+    Every device keeps its own schedule: an interval of `interval` scaled by
+    up to ±`spread`, a random phase, and monotonic deadlines like
+    scheduler.Ticker, so one slow device does not shift the others. Lag is
+    how late a device published past its deadline; a device more than a
+    full interval behind skips the overdue samples and counts them missed.
+    Publisher modes (chain, binary, batch) are those of SamplePublisher;
+    with `batch_ms`, one task per connection sends batches as they fall due.
+    """
+
+    def __init__(self, transport_url: str, devices: int, interval: float, connections: int = 4,
+                 spread: float = 0.0, seed=None, **publisher_options):
+        self.transport_url = transport_url
+        self.devices = devices
+        self.interval = interval
+        self.connections = max(1, min(connections, devices))
+        self.spread = spread
+        self.publisher_options = publisher_options
+        self.rng = random.Random(seed)
+
+        self.device_ids = [f"boiler_{i:05d}" for i in range(devices)]
+        self.intervals = [interval * (1 + self.rng.uniform(-spread, spread)) for _ in range(devices)]
+        self.sent = [0] * devices
+        self.missed = [0] * devices
+        self.lag_max = [0.0] * devices
+        self.lag_max_total = [0.0] * devices
+        self.clients = []
+        self.publishers = []
+
+    def connect(self):
+        for c in range(self.connections):
+            client = create_transport(self.transport_url, f"fleet_engine_{os.getpid()}_{c}")
+            client.connect()
+            client.loop_start()
+            self.clients.append(client)
+            self.publishers.append(SamplePublisher(client, **self.publisher_options))
+
+    def close(self):
+        for publisher in self.publishers:
+            publisher.flush()
+        for client in self.clients:
+            client.loop_stop()
+            client.disconnect()
+
+    async def _device(self, i: int, stop: asyncio.Event):
+        loop = asyncio.get_running_loop()
+        device_id = self.device_ids[i]
+        topic = f"{TOPIC}/{device_id}"
+        publisher = self.publishers[i % self.connections]
+        interval = self.intervals[i]
+        model = DriftModel(self.rng)
+        rng = random.Random(self.rng.random())
+
+        start = loop.time() + rng.uniform(0, interval)
+        k = 0
+        while not stop.is_set():
+            deadline = start + k * interval
+            delay = deadline - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+                if stop.is_set():
+                    return
+            lag = loop.time() - deadline
+            if lag >= interval:
+                skipped = int(lag // interval)
+                self.missed[i] += skipped
+                k += skipped
+                lag -= skipped * interval
+
+            temp, pressure = model.step(rng)
+            now_ns = time.time_ns()
+            payload = {
+                "device_id": device_id,
+                "timestamp": datetime.fromtimestamp(now_ns / 1e9, timezone.utc).isoformat(),
+                "temperature": round(temp, 2),
+                "pressure": round(pressure, 2),
+                "status": compute_status(temp, pressure),
+            }
+            publisher.publish(topic, payload, now_ns)
+
+            self.sent[i] += 1
+            if lag > self.lag_max[i]:
+                self.lag_max[i] = lag
+                if lag > self.lag_max_total[i]:
+                    self.lag_max_total[i] = lag
+            k += 1
+
+    async def _flush_batches(self, publisher: SamplePublisher, stop: asyncio.Event):
+        # Samples only arrive on device deadlines; without this a batch would
+        # wait for the next sample on its topic, however old it was by then.
+        limit = publisher.batch_ms / 1e3
+        while not stop.is_set():
+            due = publisher.flush_due()
+            try:
+                await asyncio.wait_for(stop.wait(), min(due, limit))
+            except asyncio.TimeoutError:
+                pass
+
+    def snapshot(self, interim: bool = True) -> dict:
+        """
+        Totals since start plus the distribution of per-device maximum lag
+        (median, p99 and worst device, in ms): since the last interim
+        snapshot, which resets it, or with `interim=False` since start.
+        """
+        if interim:
+            lags = sorted(self.lag_max)
+            self.lag_max = [0.0] * self.devices
+        else:
+            lags = sorted(self.lag_max_total)
+        p99 = lags[min(len(lags) - 1, int(len(lags) * 0.99))] if lags else 0.0
+        return {
+            "sent": sum(self.sent),
+            "missed": sum(self.missed),
+            "lag_p50_ms": statistics.median(lags) * 1e3 if lags else 0.0,
+            "lag_p99_ms": p99 * 1e3,
+            "lag_max_ms": lags[-1] * 1e3 if lags else 0.0,
+        }
+
+    async def _report(self, every: float, stop: asyncio.Event, on_report):
+        last_sent, last_t = 0, time.perf_counter()
+        while not stop.is_set():
+            try:
+                await asyncio.wait_for(stop.wait(), every)
+            except asyncio.TimeoutError:
+                pass
+            now = time.perf_counter()
+            snap = self.snapshot()
+            snap["rate"] = (snap["sent"] - last_sent) / (now - last_t)
+            last_sent, last_t = snap["sent"], now
+            on_report(snap)
+
+    async def run(self, duration: float = 0, report_every: float = 5.0, on_report=None) -> dict:
+        """
+        Publishes until `duration` seconds have passed (0 = until cancelled)
+        and returns the final snapshot with the overall achieved rate.
+        """
+        stop = asyncio.Event()
+        on_report = on_report or (lambda snap: print(format_snapshot(snap)))
+        t0 = time.perf_counter()
+        tasks = [asyncio.create_task(self._device(i, stop)) for i in range(self.devices)]
+        reporter = asyncio.create_task(self._report(report_every, stop, on_report))
+        tasks += [asyncio.create_task(self._flush_batches(publisher, stop))
+                  for publisher in self.publishers if publisher.batch_ms > 0]
+        try:
+            if duration:
+                await asyncio.sleep(duration)
+            else:
+                await asyncio.Event().wait()
+        finally:
+            elapsed = time.perf_counter() - t0
+            stop.set()
+            await asyncio.gather(*tasks, reporter, return_exceptions=True)
+        snap = self.snapshot(interim=False)
+        snap["rate"] = snap["sent"] / elapsed
+        return snap
+
+
+def format_snapshot(snap: dict) -> str:
+    return (f"{snap['rate']:,.0f} msg/s, {snap['sent']:,} sent, {snap['missed']:,} missed, "
+            f"device lag p50 {snap['lag_p50_ms']:.1f} ms, p99 {snap['lag_p99_ms']:.1f} ms, "
+            f"max {snap['lag_max_ms']:.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Asyncio publisher engine for many simulated boilers")
+    parser.add_argument("--devices", type=int, default=1000, metavar="N", help="number of simulated boilers")
+    parser.add_argument("--connections", type=int, default=4, metavar="C", help="broker connections shared by the devices")
+    parser.add_argument("--interval", type=float, default=PUBLISH_INTERVAL_SEC, metavar="SEC",
+                        help="seconds between samples per device (default %(default)s)")
+    parser.add_argument("--spread", type=float, default=0.0, metavar="F",
+                        help="vary each device's interval by up to ±F (0.1 = ±10%%)")
+    parser.add_argument("--duration", type=float, default=0, metavar="SEC", help="stop after SEC seconds (0 = run until ^C)")
+    parser.add_argument("--report", type=float, default=5.0, metavar="SEC", help="seconds between progress reports")
+    parser.add_argument("--binary", action="store_true", help="publish the compact binary encoding")
+    parser.add_argument("--chain", type=int, default=0, metavar="B",
+                        help="chain mode: number packets and sign every B of them with one Merkle checkpoint "
+                             "instead of hashing each packet")
+    parser.add_argument("--batch", type=int, default=1, metavar="N",
+                        help="pack up to N samples per device into one message")
+    parser.add_argument("--batch-ms", type=float, default=0, metavar="T",
+                        help="send a device's batch once its oldest sample is T ms old, even if no further sample arrives")
+    parser.add_argument("--batch-hash", action="store_true",
+                        help="protect each JSON batch with one hash instead of a hash per sample")
+    args = parser.parse_args()
+    if args.binary and args.chain:
+        parser.error("--binary and --chain cannot be combined")
+    if args.chain and (args.batch > 1 or args.batch_ms > 0):
+        parser.error("--chain cannot be combined with --batch/--batch-ms")
+    if args.batch_hash and (args.binary or not (args.batch > 1 or args.batch_ms > 0)):
+        parser.error("--batch-hash needs JSON batches (--batch or --batch-ms)")
+
+    engine = FleetEngine(TRANSPORT_URL, args.devices, args.interval, connections=args.connections,
+                         spread=args.spread, chain=args.chain, binary=args.binary, batch=args.batch,
+                         batch_ms=args.batch_ms, batch_hash=args.batch_hash)
+    engine.connect()
+    print(f"{args.devices:,} devices over {engine.connections} connection(s) to transport={TRANSPORT_URL}, "
+          f"topic={TOPIC}/<device_id>")
+    try:
+        snap = asyncio.run(engine.run(args.duration, args.report))
+        print(format_snapshot(snap))
+    except KeyboardInterrupt:
+        print("\nStopping fleet engine...")
+    finally:
+        engine.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+import math
+import time
+
+
+class Ticker:
+    """
+    Fixed-rate deadlines on the monotonic clock. Tick k is due at
+    start + k * interval regardless of how long the work between ticks took,
+    so the period does not drift with hashing/serialization/publish time.
+
+    wait() sleeps until the next deadline, finishing with a short spin so
+    sub-millisecond periods stay accurate. If the caller falls more than a
+    full period behind, the overdue ticks are skipped (counted in `missed`)
+    rather than published in a burst. Lateness of each tick after waking is
+    tracked as jitter.
+    """
+
+    def __init__(self, interval: float, spin_s: float = 200e-6):
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+        self.interval = interval
+        self.interval_ns = round(interval * 1e9)
+        self.spin_ns = round(min(spin_s, interval / 4) * 1e9)
+        self.start_ns = None
+        self.tick = 0
+        self.missed = 0
+        self._late_n = 0
+        self._late_sum = 0
+        self._late_sq = 0
+        self.late_max_ns = 0
+
+    def wait(self) -> int:
+        """Blocks until the next tick is due and returns its index."""
+        now = time.perf_counter_ns()
+        if self.start_ns is None:
+            self.start_ns = now
+            self.tick = 0
+            return 0
+
+        self.tick += 1
+        deadline = self.start_ns + self.tick * self.interval_ns
+        behind = now - deadline
+        if behind >= self.interval_ns:
+            skipped = behind // self.interval_ns
+            self.missed += skipped
+            self.tick += skipped
+            deadline += skipped * self.interval_ns
+
+        remaining = deadline - now - self.spin_ns
+        if remaining > 0:
+            time.sleep(remaining / 1e9)
+        now = time.perf_counter_ns()
+        while now < deadline:
+            now = time.perf_counter_ns()
+
+        late = now - deadline
+        self._late_n += 1
+        self._late_sum += late
+        self._late_sq += late * late
+        if late > self.late_max_ns:
+            self.late_max_ns = late
+        return self.tick
+
+    def remaining(self) -> float:
+        """Seconds until the next tick is due (0 before the first tick or when overdue)."""
+        if self.start_ns is None:
+            return 0.0
+        deadline = self.start_ns + (self.tick + 1) * self.interval_ns
+        return max(0, deadline - time.perf_counter_ns()) / 1e9
+
+    @property
+    def rate(self) -> float:
+        """Achieved ticks per second since the first tick (tick 0 starts the clock, so it is not counted)."""
+        if self.start_ns is None:
+            return 0.0
+        elapsed_ns = time.perf_counter_ns() - self.start_ns
+        return (self.served - 1) / (elapsed_ns / 1e9) if elapsed_ns else 0.0
+
+    @property
+    def served(self) -> int:
+        """Ticks returned by wait(), including tick 0."""
+        return 0 if self.start_ns is None else self.tick + 1 - self.missed
+
+    def jitter_us(self):
+        """(mean, std, max) lateness of a tick past its deadline, in µs."""
+        if not self._late_n:
+            return 0.0, 0.0, 0.0
+        mean = self._late_sum / self._late_n
+        var = max(0.0, self._late_sq / self._late_n - mean * mean)
+        return mean / 1e3, math.sqrt(var) / 1e3, self.late_max_ns / 1e3
+
+    def summary(self) -> str:
+        mean, std, worst = self.jitter_us()
+        return (f"{self.served:,} ticks at {self.rate:,.1f}/s (target {1 / self.interval:,.1f}/s), "
+                f"{self.missed:,} missed, jitter {mean:.0f}±{std:.0f} µs (max {worst:.0f} µs)")
@@ -0,0 +1,101 @@
+"""
+Property check for the precompiled canonicalizer: random payloads (floats
+including NaN, +/-Infinity, -0.0 and extreme exponents; unicode, control
+characters and surrogates in strings; None, bools, ints, nested
+containers, subclasses, missing keys) must canonicalize byte-identically
+to the original json.dumps() form.
+"""
+import json
+import math
+import random
+from enum import IntEnum
+
+import pytest
+
+from integrity import HASH_FIELDS, canonical_columns, canonical_payload
+
+
+class Level(IntEnum):
+    LOW = 1
+
+
+class Tag(str):
+    pass
+
+
+def reference(payload):
+    clean = {k: payload.get(k) for k in HASH_FIELDS}
+    return json.dumps(clean, separators=(",", ":"), sort_keys=True)
+
+
+def random_float(rng):
+    choice = rng.random()
+    if choice < 0.05:
+        return rng.choice([math.nan, math.inf, -math.inf, -0.0, 0.0, 5e-324, 1.7976931348623157e308])
+    if choice < 0.3:
+        return rng.uniform(-1e6, 1e6)
+    if choice < 0.5:
+        return math.ldexp(rng.random(), rng.randint(-1074, 1023)) * rng.choice([-1, 1])
+    return round(rng.uniform(0, 150), rng.randint(0, 6))
+
+
+def random_string(rng):
+    alphabet = "abcXYZ019 _-:.+\"\\/\b\f\n\r\t\x00\x1f\x7fé€😀\ud800"
+    return "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 24)))
+
+
+def random_value(rng, depth=0):
+    kind = rng.randrange(11 if depth < 2 else 8)
+    if kind == 0:
+        return None
+    if kind == 1:
+        return rng.choice([True, False])
+    if kind == 2:
+        return rng.randint(-2**70, 2**70)
+    if kind in (3, 4):
+        return random_float(rng)
+    if kind in (5, 6):
+        return random_string(rng)
+    if kind == 7:
+        return rng.choice([Level.LOW, Tag("OK")])
+    if kind == 8:
+        return [random_value(rng, depth + 1) for _ in range(rng.randint(0, 3))]
+    if kind == 9:
+        return {random_string(rng): random_value(rng, depth + 1) for _ in range(rng.randint(0, 3))}
+    return (random_value(rng, depth + 1),)
+
+
+def random_payload(rng):
+    payload = {k: random_value(rng) for k in HASH_FIELDS if rng.random() > 0.05}
+    payload["hash"] = random_string(rng)
+    return payload
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_canonical_payload_matches_json_dumps(seed):
+    rng = random.Random(seed)
+    for _ in range(10_000):
+        payload = random_payload(rng)
+        assert canonical_payload(payload) == reference(payload), payload
+
+
+def test_canonical_payload_ignores_extra_fields_and_key_order():
+    payload = {"status": "OK", "pressure": 29.18, "temperature": 74.32, "timestamp": "t", "device_id": "boiler_01"}
+    extra = dict(reversed(list(payload.items())), hash="0" * 64, _received_ts=1.0)
+    assert canonical_payload(extra) == canonical_payload(payload) == reference(payload)
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_canonical_columns_match_canonical_payload(seed):
+    rng = random.Random(seed)
+    for _ in range(200):
+        size = rng.randint(0, 40)
+        if rng.random() < 0.5:
+            # Columns of one repeated type, with duplicates, -0.0 and NaN.
+            pool = [0.0, -0.0, math.nan, 1.5, 74.32, 1e308]
+            batch = [{"device_id": rng.choice(["a", "b"]), "timestamp": random_string(rng),
+                      "temperature": rng.choice(pool), "pressure": rng.choice(pool[3:]), "status": "OK"}
+                     for _ in range(size)]
+        else:
+            batch = [random_payload(rng) for _ in range(size)]
+        assert canonical_columns(batch) == [canonical_payload(p) for p in batch]
@@ -0,0 +1,165 @@
+import json
+import os
+import sys
+from datetime import datetime, timezone, timedelta
+
+from integrity import ChainSigner, ChainVerifier
+from mqtt_client import MqttBuffer
+from transport import LoopbackBroker, LoopbackTransport, Message
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "publisher")))
+from boiler_simulator import SamplePublisher
+
+
+TOPIC = "cu/bca/boiler/secure_digital_twin"
+
+
+def chained(n, batch):
+    signer = ChainSigner("boiler_01", batch)
+    start = datetime.now(timezone.utc) - timedelta(seconds=n)
+    messages = []
+    for i in range(n):
+        payload = {
+            "device_id": "boiler_01",
+            "timestamp": (start + timedelta(seconds=i)).isoformat(),
+            "temperature": 70.0 + i,
+            "pressure": 30.0,
+            "status": "OK",
+        }
+        message, checkpoint = signer.sign(payload)
+        messages.append(message.encode("utf-8"))
+        if checkpoint is not None:
+            messages.append(checkpoint.encode("utf-8"))
+    return messages
+
+
+def ingest(messages):
+    buf = MqttBuffer(broker="loopback", port=0, topic=TOPIC, transport=LoopbackTransport(LoopbackBroker(), "dashboard"))
+    for m in messages:
+        buf._on_message(None, None, Message(f"{TOPIC}/boiler_01", m, qos=1))
+    return buf
+
+
+def test_redelivery_after_checkpoint_is_not_a_violation():
+    messages = chained(8, 4)
+    # The second packet is redelivered after both checkpoints went by.
+    buf = ingest(messages + [messages[1]])
+    assert buf.total_packets == 8
+    assert buf.integrity_violations == 0
+    assert buf.partition("boiler_01").chain.duplicates == 1
+
+
+def test_redelivered_checkpoint_is_ignored():
+    messages = chained(8, 4)
+    buf = ingest(messages[:5] + [messages[4]] + messages[5:])
+    chain = buf.partition("boiler_01").chain
+    assert buf.total_packets == 8
+    assert buf.integrity_violations == 0
+    assert chain.missing == 0 and chain.broken_links == 0
+
+
+def test_tampered_packet_still_flagged():
+    messages = chained(8, 4)
+    payload = json.loads(messages[2])
+    payload["temperature"] = 100.0
+    messages[2] = json.dumps(payload).encode("utf-8")
+    buf = ingest(messages)
+    assert buf.total_packets == 8
+    assert buf.integrity_violations == 1
+
+
+def test_pending_overflow_then_late_packet_is_dropped():
+    verifier = ChainVerifier(max_pending=2)
+    assert verifier.add(0, b"a", {}, 0) == []
+    assert verifier.add(1, b"b", {}, 0) == []
+    assert [ok for _, _, ok in verifier.add(2, b"c", {}, 0)] == [False]
+    assert verifier.add(0, b"a", {}, 0) == []
+    assert verifier.duplicates == 1
+
+
+
+def test_publisher_restart_starts_a_new_chain():
+    first_run, second_run = chained(8, 4), chained(8, 4)
+    # A redelivery from the first run straddles the restart.
+    buf = ingest(first_run + second_run[:2] + [first_run[9]] + second_run[2:])
+    chain = buf.partition("boiler_01").chain
+    assert buf.total_packets == 16
+    assert buf.integrity_violations == 0
+    assert chain.duplicates == 1
+    assert chain.broken_links == 0 and chain.missing == 0
+
+
+def test_checkpoint_redelivered_after_restart_is_still_a_duplicate():
+    first_run, second_run = chained(4, 4), chained(4, 4)
+    buf = ingest(first_run + second_run + [second_run[4]])
+    chain = buf.partition("boiler_01").chain
+    assert buf.total_packets == 8
+    assert buf.integrity_violations == 0
+    assert chain.duplicates == 1
+
+
+def test_forged_checkpoints_are_rejected_without_blocking_the_device():
+    messages = chained(8, 4)
+    forged = [
+        {"first_seq": 0, "count": 5_000_000, "prev": "0" * 64, "root": "1" * 64, "leaves": []},
+        {"first_seq": 0, "count": 2, "prev": "0" * 64, "root": "1" * 64, "leaves": ["00" * 32]},
+        {"first_seq": 10**9, "count": 1, "prev": "0" * 64, "root": "1" * 64, "leaves": ["00" * 32]},
+    ]
+    forged = [json.dumps({"device_id": "boiler_01", "checkpoint": c}).encode("utf-8") for c in forged]
+    buf = ingest(messages[:1] + forged + messages[1:])
+    chain = buf.partition("boiler_01").chain
+    assert chain.rejected == 3
+    assert chain.released_below == 8
+    assert buf.total_packets == 8
+    assert buf.integrity_violations == 0
+
+
+def test_publisher_flush_checkpoints_a_partial_chain_batch():
+    broker = LoopbackBroker()
+    buf = MqttBuffer(broker="loopback", port=0, topic=TOPIC, transport=LoopbackTransport(broker, "dashboard"))
+    buf.start()
+    client = LoopbackTransport(broker, "publisher")
+    client.connect()
+    publisher = SamplePublisher(client, chain=4)
+    for i in range(6):
+        publisher.publish(f"{TOPIC}/boiler_01", {
+            "device_id": "boiler_01",
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "temperature": 70.0 + i,
+            "pressure": 30.0,
+            "status": "OK",
+        }, 0)
+    publisher.flush()
+    buf.stop()
+    assert buf.total_packets == 6
+    assert buf.integrity_violations == 0
+    assert not buf.partition("boiler_01").chain.pending
+
+
+class RecordingClient:
+    def __init__(self):
+        self.messages = []
+
+    def publish(self, topic, message, qos=0, retain=False):
+        self.messages.append((topic, message))
+
+
+def test_flush_due_sends_batches_past_batch_ms_without_a_new_sample():
+    client = RecordingClient()
+    publisher = SamplePublisher(client, batch=100, batch_ms=50)
+    for device_id in ("boiler_01", "boiler_02"):
+        publisher.publish(f"{TOPIC}/{device_id}", {
+            "device_id": device_id,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "temperature": 70.0,
+            "pressure": 30.0,
+            "status": "OK",
+        }, 0)
+    opened = publisher._opened[f"{TOPIC}/boiler_01"]
+
+    assert 0 < publisher.flush_due(opened + 0.01) <= 0.04
+    assert client.messages == []
+
+    assert publisher.flush_due(opened + 0.06) == float("inf")
+    assert sorted(topic for topic, _ in client.messages) == [f"{TOPIC}/boiler_01", f"{TOPIC}/boiler_02"]
+    assert all(len(json.loads(message)["batch"]) == 1 for _, message in client.messages)
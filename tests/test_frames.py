@@ -0,0 +1,86 @@
+import math
+import time
+
+from frames import SharedWindows, TelemetryWindow, frame_stats, to_df
+from mqtt_client import DevicePartition
+from ring_buffer import TelemetryRingBuffer
+
+
+HOUR_NS = 3600 * 1_000_000_000
+
+
+def test_stale_device_falls_back_to_last_samples_stats():
+    now_ns = time.time_ns()
+    partition = DevicePartition("boiler_01", 1000, stats_window_ns=30 * 60 * 1_000_000_000)
+    for i in range(10):
+        partition.add({"temperature": 70.0 + i, "pressure": 30.0, "status": "OK", "integrity_ok": True},
+                      now_ns - HOUR_NS + i * 1_000_000_000)
+
+    df, stats = SharedWindows(30).view(partition, now_ns)
+    assert df.empty and stats["temperature"]["count"] == 0
+
+    fallback = frame_stats(to_df(partition.buffer, last=100))
+    assert fallback["temperature"]["count"] == 10
+    assert fallback["temperature"]["mean"] == 74.5
+    assert fallback["temperature"]["max"] == 79.0
+    assert math.isclose(fallback["pressure"]["std"], 0.0)
+
+
+def test_returned_window_frames_are_not_rewritten_by_later_refreshes():
+    source = TelemetryRingBuffer(16)
+    window = TelemetryWindow(source, window_min=60, capacity=8)
+    base = time.time_ns()
+    for i in range(6):
+        source.append(base + i, 70.0 + i, 30.0, "OK", True, "boiler_01")
+    df1 = window.refresh(base)
+    before = df1.copy()
+
+    # A late arrival re-merges the tail df1 covers.
+    source.append(base + 2, 99.0, 30.0, "OK", False, "boiler_01")
+    df2 = window.refresh(base)
+    assert df2["temperature"].tolist()[3] == 99.0
+    # Appending past the store's capacity reuses slots df1 and df2 cover.
+    for i in range(6, 12):
+        source.append(base + i, 70.0 + i, 30.0, "OK", True, "boiler_01")
+    window.refresh(base)
+
+    assert df1.equals(before)
+    assert len(df2) == 7 and df2["temperature"].tolist()[3] == 99.0
+
+
+def test_steady_evict_and_append_at_capacity_keeps_returned_frames():
+    source = TelemetryRingBuffer(64)
+    window = TelemetryWindow(source, window_min=9.5 / 60, capacity=10)
+    second = 1_000_000_000
+    base = time.time_ns() - 60 * second
+    returned = []
+    for i in range(40):
+        source.append(base + i * second, float(i), 30.0, "OK", True, "boiler_01")
+        df = window.refresh(base + i * second)
+        returned.append((df, df.copy()))
+
+    for df, before in returned:
+        assert df.equals(before)
+        assert df["ts_ns"].is_monotonic_increasing
+
+
+class CountingStore:
+    def __init__(self):
+        self.queries = []
+
+    def query_buckets(self, device_id, start_ns, end_ns, bucket_ns):
+        self.queries.append((device_id, start_ns, end_ns, bucket_ns))
+        return {"ts_ns": [start_ns]}
+
+
+def test_history_is_queried_once_per_interval_for_all_sessions():
+    store = CountingStore()
+    windows = SharedWindows(30, min_interval_s=60)
+    first = [windows.history(store, "boiler_01", HOUR_NS, 720, HOUR_NS * 2) for _ in range(5)]
+    assert len(store.queries) == 1
+    assert all(result is first[0] for result in first)
+    assert store.queries[0] == ("boiler_01", HOUR_NS, HOUR_NS * 2, HOUR_NS // 720)
+
+    windows.history(store, "boiler_01", 24 * HOUR_NS, 720)
+    windows.history(store, "boiler_02", HOUR_NS, 720)
+    assert len(store.queries) == 3
@@ -0,0 +1,127 @@
+import sys
+import threading
+
+import numpy as np
+
+from frames import TelemetryWindow
+from ring_buffer import TelemetryRingBuffer
+
+
+def fill(buf, start, stop):
+    for i in range(start, stop):
+        buf.append(i, float(i), float(-i), "OK", True, "boiler_01")
+
+
+def test_read_copies_only_the_requested_samples():
+    buf = TelemetryRingBuffer(8)
+    fill(buf, 0, 5)
+    first, cols = buf.read(2)
+    assert first == 2
+    assert cols["ts_ns"].tolist() == [2, 3, 4]
+
+    fill(buf, 5, 20)
+    # The copy is independent of later appends that reuse its slots.
+    assert cols["ts_ns"].tolist() == [2, 3, 4]
+    assert cols["temperature"].tolist() == [2.0, 3.0, 4.0]
+
+
+def test_read_clamps_to_retained_samples():
+    buf = TelemetryRingBuffer(8)
+    fill(buf, 0, 20)
+    first, cols = buf.read(3)
+    assert first == buf.head == 12
+    assert cols["ts_ns"].tolist() == list(range(12, 20))
+
+    first, cols = buf.read(buf.seq)
+    assert first == 20 and len(cols["ts_ns"]) == 0
+
+
+class LappingColumn(np.ndarray):
+    """Column that runs `on_read` the first time it is sliced."""
+
+    on_read = None
+
+    def __getitem__(self, key):
+        hook, LappingColumn.on_read = LappingColumn.on_read, None
+        if hook is not None:
+            hook()
+        return super().__getitem__(key)
+
+
+def test_read_drops_slots_reused_during_the_copy():
+    buf = TelemetryRingBuffer(8)
+    fill(buf, 0, 8)
+    # The writer appends 3 samples after `ts_ns` was copied but before
+    # `temperature` is, reusing the slots of seqs 0-2.
+    buf._cols["temperature"] = buf._cols["temperature"].view(LappingColumn)
+    LappingColumn.on_read = lambda: fill(buf, 8, 11)
+    first, cols = buf.read(0)
+    assert first == 3
+    assert cols["ts_ns"].tolist() == list(range(3, 8))
+    assert cols["temperature"].tolist() == [float(i) for i in range(3, 8)]
+
+
+def test_concurrent_append_and_read_never_returns_torn_samples():
+    # Switch threads as often as possible so the writer laps reads in flight.
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    buf = TelemetryRingBuffer(64)
+    total = 200_000
+    errors = []
+    done = threading.Event()
+
+    def writer():
+        fill(buf, 0, total)
+        done.set()
+
+    def check(first, cols):
+        ts = cols["ts_ns"]
+        n = len(ts)
+        if n and not (np.array_equal(ts, np.arange(first, first + n))
+                      and np.array_equal(cols["temperature"], ts.astype(np.float32))
+                      and np.array_equal(cols["pressure"], -ts.astype(np.float32))):
+            errors.append(f"inconsistent samples at seq {first}")
+        return n
+
+    def reader():
+        since = 0
+        while not done.is_set() or since < buf.seq:
+            first, cols = buf.read(since)
+            if first < since:
+                errors.append(f"read went backwards: {first} < {since}")
+            since = first + check(first, cols)
+            # A full read spans nearly every slot, so any append during the
+            # copy reuses one of them.
+            check(*buf.read())
+
+    threads = [threading.Thread(target=writer), threading.Thread(target=reader)]
+    try:
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+    finally:
+        sys.setswitchinterval(interval)
+    assert not errors, errors[:5]
+
+
+def test_window_refresh_while_ingest_appends():
+    source = TelemetryRingBuffer(256)
+    window = TelemetryWindow(source, window_min=60, capacity=4096)
+    total = 50_000
+    done = threading.Event()
+
+    def writer():
+        fill(source, 0, total)
+        done.set()
+
+    t = threading.Thread(target=writer)
+    t.start()
+    while not done.is_set():
+        df = window.refresh(now_ns=total)
+        ts = df["ts_ns"].to_numpy()
+        assert (np.diff(ts) > 0).all()
+        assert np.array_equal(df["temperature"].to_numpy(), ts.astype(np.float32))
+    t.join()
+    df = window.refresh(now_ns=total)
+    assert df["ts_ns"].iloc[-1] == total - 1
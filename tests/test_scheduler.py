@@ -0,0 +1,45 @@
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "publisher")))
+import scheduler
+from scheduler import Ticker
+
+
+class FakeClock:
+    def __init__(self):
+        self.now_ns = 1_000_000_000
+
+    def perf_counter_ns(self):
+        return self.now_ns
+
+    def sleep(self, seconds):
+        self.now_ns += round(seconds * 1e9)
+
+
+def test_rate_counts_intervals_not_ticks(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(scheduler.time, "perf_counter_ns", clock.perf_counter_ns)
+    monkeypatch.setattr(scheduler.time, "sleep", clock.sleep)
+
+    ticker = Ticker(1.0, spin_s=0)
+    for _ in range(6):
+        ticker.wait()
+    assert ticker.served == 6
+    assert ticker.rate == 1.0
+
+
+def test_missed_ticks_lower_the_rate(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(scheduler.time, "perf_counter_ns", clock.perf_counter_ns)
+    monkeypatch.setattr(scheduler.time, "sleep", clock.sleep)
+
+    ticker = Ticker(1.0, spin_s=0)
+    ticker.wait()
+    clock.sleep(3.5)
+    # Ticks 1 and 2 are skipped; tick 3 is served late rather than dropped.
+    assert ticker.wait() == 3
+    assert ticker.missed == 2
+    assert ticker.wait() == 4
+    assert ticker.served == 3
+    assert ticker.rate == 2 / 4
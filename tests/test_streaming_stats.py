@@ -0,0 +1,51 @@
+import math
+import random
+
+import numpy as np
+
+from mqtt_client import DevicePartition
+
+
+def reference(ts, values, capacity, cutoff_ns):
+    ts, values = np.array(ts[-capacity:]), np.array(values[-capacity:], dtype=np.float32).astype(np.float64)
+    values = values[ts >= cutoff_ns]
+    return values[~np.isnan(values)]
+
+
+def assert_matches(snapshot, values):
+    assert snapshot["count"] == len(values)
+    if len(values):
+        assert math.isclose(snapshot["mean"], values.mean(), rel_tol=1e-9, abs_tol=1e-9)
+        assert snapshot["min"] == values.min() and snapshot["max"] == values.max()
+    if len(values) > 1:
+        assert math.isclose(snapshot["std"], values.std(ddof=1), rel_tol=1e-6, abs_tol=1e-9)
+
+
+def test_window_stats_match_numpy_over_time_and_capacity_bounds():
+    rng = random.Random(0)
+    capacity, window_ns = 50, 80
+    partition = DevicePartition("boiler_01", capacity, stats_window_ns=window_ns)
+    ts, temperatures, ts_ns = [], [], 0
+    cutoff_ns = -window_ns
+    for i in range(2000):
+        # Bursts fill the buffer before the time window expires anything.
+        ts_ns += rng.choice([0, 1, 1, 2, 5, 30])
+        temperature = math.nan if rng.random() < 0.05 else rng.gauss(75, 5)
+        partition.add({"temperature": temperature, "pressure": 30.0, "status": "OK", "integrity_ok": True}, ts_ns)
+        ts.append(ts_ns)
+        temperatures.append(temperature)
+        if i % 7 == 0:
+            now_ns = ts_ns + rng.choice([0, 10, 50])
+            # Expiry is never undone by a later, earlier `now_ns`.
+            cutoff_ns = max(cutoff_ns, now_ns - window_ns)
+            snapshot = partition.window_stats(now_ns)["temperature"]
+            assert_matches(snapshot, reference(ts, temperatures, capacity, cutoff_ns))
+
+
+def test_window_stats_hold_no_more_than_the_buffer():
+    partition = DevicePartition("boiler_01", 100, stats_window_ns=10**18)
+    for i in range(1000):
+        partition.add({"temperature": float(i), "pressure": 30.0, "status": "OK", "integrity_ok": True}, i)
+    stats = partition.window_stats()["temperature"]
+    assert stats["count"] == len(partition.buffer) == 100
+    assert stats["min"] == 900.0 and stats["max"] == 999.0
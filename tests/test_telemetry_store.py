@@ -0,0 +1,49 @@
+import time
+
+import numpy as np
+
+from telemetry_store import ROLLUP_NS, TelemetryStore
+
+
+MINUTE_NS = 60 * 1_000_000_000
+
+
+def rollup_rows(store):
+    return store._reader().execute(
+        "SELECT bucket_ns, count FROM telemetry_rollup WHERE device_id = 'boiler_01' ORDER BY bucket_ns"
+    ).fetchall()
+
+
+def test_steady_stream_commits_every_flush_interval(tmp_path):
+    store = TelemetryStore(str(tmp_path / "telemetry.db"), flush_interval=0.2)
+    store.start()
+    base = time.time_ns()
+    try:
+        # 20 Hz: every get() returns well within flush_interval.
+        for i in range(30):
+            store.add("boiler_01", base + i, 70.0, 30.0, "OK", True)
+            time.sleep(0.05)
+        committed = len(store.query("boiler_01", base, base + 30)["ts_ns"])
+    finally:
+        store.stop()
+    assert committed >= 20
+
+
+def test_rollup_refreshes_only_the_minutes_a_batch_touched(tmp_path):
+    store = TelemetryStore(str(tmp_path / "telemetry.db"))
+    base = 1000 * ROLLUP_NS
+    with store._connect() as conn:
+        rows = [("boiler_01", base + i * MINUTE_NS, 70.0, 30.0, 0, 1, None) for i in range(100)]
+        conn.executemany("INSERT INTO telemetry VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+
+    store.start()
+    store.add("boiler_01", base + 5, 80.0, 30.0, "OK", True)
+    store.add("boiler_01", base + 99 * MINUTE_NS + 5, 80.0, 30.0, "OK", False)
+    store.flush()
+    store.stop()
+
+    assert rollup_rows(store) == [(base, 2), (base + 99 * MINUTE_NS, 2)]
+    buckets = store.query_buckets("boiler_01", base, base + 100 * MINUTE_NS, ROLLUP_NS)
+    assert buckets["count"].tolist() == [2, 2]
+    assert np.allclose(buckets["temperature"], [75.0, 75.0])
+    assert buckets["integrity_violations"].tolist() == [0, 1]
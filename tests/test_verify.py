@@ -0,0 +1,51 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone, timedelta
+
+import numpy as np
+import pytest
+
+from integrity import sha256_hash, verify_hash, verify_many
+
+
+def make_payloads(n):
+    start = datetime.now(timezone.utc) - timedelta(seconds=n)
+    payloads = []
+    for i in range(n):
+        payload = {
+            "device_id": f"boiler_{i % 7:02d}",
+            "timestamp": (start + timedelta(seconds=i)).isoformat(),
+            "temperature": 70.0 + i % 13 * 0.25,
+            "pressure": 30.0,
+            "status": "OK",
+        }
+        payload["hash"] = sha256_hash(payload)
+        if i % 11 == 0:
+            payload["temperature"] = 100.0
+        if i % 17 == 0:
+            del payload["hash"]
+        payloads.append(payload)
+    return payloads
+
+
+@pytest.mark.parametrize("executor", ["inline", "thread", "process"])
+def test_verify_many_is_aligned_with_verify_hash(executor):
+    payloads = make_payloads(1000)
+    result = verify_many(payloads, executor=executor, workers=2, chunk_size=64)
+    assert result.dtype == bool
+    assert result.tolist() == [verify_hash(p) for p in payloads]
+    assert not result.all() and result.any()
+
+
+def test_verify_many_reuses_a_given_executor():
+    payloads = make_payloads(300)
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        first = verify_many(payloads, executor=pool, chunk_size=50)
+        second = verify_many(payloads[::-1], executor=pool, chunk_size=50)
+    assert first.tolist() == second[::-1].tolist() == [verify_hash(p) for p in payloads]
+
+
+def test_verify_many_empty_and_unknown_executor():
+    assert verify_many([]).shape == (0,)
+    assert verify_many(iter([]), executor="bogus").dtype == np.bool_
+    with pytest.raises(ValueError):
+        verify_many(make_payloads(3), executor="bogus")
@@ -0,0 +1,39 @@
+import json
+import time
+
+import wire
+from mqtt_client import MqttBuffer
+from transport import LoopbackBroker, LoopbackTransport, Message
+
+
+TOPIC = "cu/bca/boiler/secure_digital_twin"
+
+
+def ingest(messages, max_devices=1024):
+    buf = MqttBuffer(broker="loopback", port=0, topic=TOPIC, max_devices=max_devices,
+                     transport=LoopbackTransport(LoopbackBroker(), "dashboard"))
+    for topic, data in messages:
+        buf._on_message(None, None, Message(topic, data, qos=1))
+    return buf
+
+
+def test_undecodable_binary_messages_do_not_claim_partitions():
+    garbage = [(wire.binary_topic(f"{TOPIC}/fake_{i}"), b"\xff" * n) for i, n in enumerate([0, 7, wire.PACKET_SIZE])]
+    packet = wire.encode("boiler_01", time.time_ns(), 70.0, 30.0, "OK")
+    buf = ingest(garbage + [(wire.binary_topic(f"{TOPIC}/boiler_01"), packet)], max_devices=1)
+    assert buf.device_ids() == ["boiler_01"]
+    assert buf.total_packets == 1 and buf.integrity_violations == 0
+    assert buf.metrics.decode_failures == 3
+
+
+def test_qos1_redeliveries_are_routed_once():
+    json_packet = {"device_id": "boiler_02", "timestamp": "2026-01-21T12:30:05+00:00",
+                   "temperature": 70.0, "pressure": 30.0, "status": "OK", "hash": "0" * 64}
+    tampered = json.dumps(json_packet).encode("utf-8")
+    packet = wire.encode("boiler_01", time.time_ns(), 70.0, 30.0, "OK")
+    binary = (wire.binary_topic(f"{TOPIC}/boiler_01"), packet)
+    buf = ingest([binary, binary, (f"{TOPIC}/boiler_02", tampered), (f"{TOPIC}/boiler_02", tampered)])
+    assert buf.total_packets == 2
+    assert buf.integrity_violations == 1
+    assert buf.metrics.duplicates == 2
+    assert len(buf.partition("boiler_01").buffer) == 1